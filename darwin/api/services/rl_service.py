@@ -17,7 +17,6 @@ from darwin.rl.storage.agent_state import AgentStateSQLite
 from darwin.rl.storage.model_store import ModelStore
 from darwin.rl.monitoring.alerts import AgentMonitor, Alert
 from darwin.rl.graduation.policy import GraduationPolicy, GraduationDecision
-from darwin.rl.graduation.metrics import AgentPerformanceMetrics
 from darwin.rl.schemas.rl_config import GraduationThresholdsV1
 from darwin.api.models.rl import (
     AgentDecisionResponse,
@@ -60,12 +59,13 @@ class RLService:
 
         # Initialize storage backends
         agent_state_path = self.artifacts_dir / "agent_state.sqlite"
-        self.agent_state = AgentStateSQLite(agent_state_path)
+        # The service only reads; an existing database is opened read-only so
+        # dashboard queries never contend with the process recording decisions
+        self.agent_state = AgentStateSQLite(agent_state_path, read_only=agent_state_path.exists())
         self.model_store = ModelStore(self.models_dir)
 
         # Initialize monitoring and graduation components
         self.monitor = AgentMonitor(self.agent_state)
-        self.metrics_tracker = AgentPerformanceMetrics(self.agent_state)
 
         # Default graduation thresholds (can be overridden)
         self.graduation_thresholds = GraduationThresholdsV1(
@@ -78,6 +78,8 @@ class RLService:
         self.graduation_policy = GraduationPolicy(
             self.agent_state, self.graduation_thresholds
         )
+        # Share the policy's tracker so its rolling-metrics cache serves both
+        self.metrics_tracker = self.graduation_policy.metrics_tracker
 
     def get_agents_overview(self) -> AgentsOverviewResponse:
         """
@@ -88,13 +90,21 @@ class RLService:
         """
         agents = []
 
+        # Graduation data requirements for all agents come from one query
+        try:
+            graduations = self.graduation_policy.evaluate_graduation_batch(self.AGENT_NAMES)
+        except Exception:
+            graduations = {}
+
         for agent_name in self.AGENT_NAMES:
             try:
                 # Get current model version
                 current_version = self.model_store.get_current_version(agent_name)
 
                 # Get graduation status
-                graduation = self.graduation_policy.evaluate_graduation(agent_name)
+                graduation = graduations.get(agent_name)
+                if graduation is None:
+                    graduation = self.graduation_policy.evaluate_graduation(agent_name)
 
                 # Get recent decisions count (30 days)
                 recent_decisions = self.agent_state.get_decision_count(agent_name)
@@ -1,11 +1,21 @@
 """Base class for RL agents."""
 
+from __future__ import annotations
+
+import asyncio
 import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+if TYPE_CHECKING:
+    # stable-baselines3 pulls in torch; only import it when a model is loaded
+    from stable_baselines3 import PPO
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +25,15 @@ class RLAgent(ABC):
     All agents (Gate, Portfolio, Meta-Learner) inherit from this class.
     """
 
+    # Async prediction batching: requests arriving within this window are
+    # coalesced into a single policy forward pass
+    batch_window_ms: float = 1.0
+    batch_max_size: int = 64
+
+    # Below this batch size thread-pool submission costs more than it saves,
+    # so predict_batch encodes serially
+    parallel_encode_min_batch: int = 16
+
     def __init__(self, agent_name: str, model_path: str | None = None):
         """Initialize RL agent.
 
@@ -24,7 +43,20 @@ class RLAgent(ABC):
         """
         self.agent_name = agent_name
         self.model_path = model_path
-        self.model: Any | None = None
+        self.model: PPO | None = None
+        self._pi_net: Any | None = None
+
+        # Whether _pi_net is a frozen TorchScript module (DARWIN_RL_JIT=1)
+        self._pi_scripted = False
+
+        # Optional CUDA graph over the (1, state_dim) policy-head forward
+        self._cuda_graph: Any | None = None
+        self._static_in: Any | None = None
+        self._static_out: Any | None = None
+
+        # Pending async predictions: (future, state, deterministic)
+        self._pending: List[Tuple[asyncio.Future, np.ndarray, bool]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     @abstractmethod
     def predict(self, *args: Any, **kwargs: Any) -> Any:
@@ -60,7 +92,6 @@ class RLAgent(ABC):
             model_path: Path to model file (.zip)
         """
         try:
-            from pathlib import Path
             from stable_baselines3 import PPO
 
             model_file = Path(model_path)
@@ -70,6 +101,10 @@ class RLAgent(ABC):
             # Load PPO model
             self.model = PPO.load(str(model_file))
             self.model_path = model_path
+            self._pi_net = self._build_policy_head()
+            self._script_policy_head()
+            self.warmup()
+            self._capture_cuda_graph()
 
             logger.info(f"Loaded {self.agent_name} PPO model from {model_path}")
 
@@ -81,6 +116,265 @@ class RLAgent(ABC):
             logger.error(f"Failed to load model from {model_path}: {e}")
             raise
 
+    def warmup(self) -> None:
+        """Run dummy forward passes so the first real prediction is not slowed.
+
+        The first call through SB3/torch pays one-off costs (lazy module
+        setup, allocator growth, kernel selection); paying them at load time
+        keeps them out of the first candidate's latency.
+        """
+        if not self.is_loaded():
+            return
+
+        import torch
+
+        dummy = np.zeros(self.get_state_dim(), dtype=np.float32)
+        self.model.predict(dummy, deterministic=True)
+
+        if self._pi_net is not None:
+            with torch.inference_mode():
+                self._pi_net(torch.as_tensor(dummy, device=self.model.policy.device).unsqueeze(0))
+
+    def _build_policy_head(self) -> Any:
+        """Compose the policy's actor path into a single module.
+
+        Calling this directly skips the Distribution object that
+        ``policy.get_distribution`` allocates on every call.
+
+        Returns:
+            ``torch.nn.Sequential`` mapping observations to action logits
+        """
+        import torch
+
+        policy = self.model.policy
+        return torch.nn.Sequential(
+            policy.pi_features_extractor,
+            policy.mlp_extractor.policy_net,
+            policy.action_net,
+        )
+
+    def _script_policy_head(self) -> None:
+        """Trace the policy head into a frozen TorchScript module.
+
+        Opt-in via ``DARWIN_RL_JIT=1``. The head is a handful of Linear and
+        activation layers, so a single-state forward is dominated by Python
+        module dispatch; the frozen graph runs it in one call and
+        deterministic ``_predict_action`` calls use it instead of
+        ``model.predict``. Tracing failures fall back to the eager head.
+        """
+        self._pi_scripted = False
+
+        if os.environ.get("DARWIN_RL_JIT") != "1" or not self.is_loaded():
+            return
+
+        import torch
+
+        try:
+            example = torch.zeros((1, self.get_state_dim()), device=self.model.policy.device)
+            with torch.no_grad():
+                traced = torch.jit.trace(self._pi_net.eval(), example)
+            self._pi_net = torch.jit.freeze(traced)
+            self._pi_scripted = True
+            logger.info(f"Traced TorchScript policy head for {self.agent_name}")
+
+        except Exception as e:
+            logger.warning(
+                f"TorchScript tracing failed for {self.agent_name}, using eager policy: {e}"
+            )
+            self._pi_net = self._build_policy_head()
+
+    def _capture_cuda_graph(self) -> None:
+        """Capture a CUDA graph over the single-state policy-head forward.
+
+        Opt-in via ``DARWIN_RL_CUDA_GRAPH=1`` and only when CUDA is
+        available. These policies are small MLPs, so on CPU the eager
+        forward is already fastest; on GPU the graph removes per-call
+        kernel launch overhead. Capture failures fall back to eager mode.
+        """
+        self._cuda_graph = None
+
+        if os.environ.get("DARWIN_RL_CUDA_GRAPH") != "1" or not self.is_loaded():
+            return
+
+        import torch
+
+        if not torch.cuda.is_available():
+            return
+
+        try:
+            self.model.policy.to("cuda")
+            self._pi_net = self._build_policy_head()
+            self._pi_scripted = False
+            self._static_in = torch.zeros((1, self.get_state_dim()), device="cuda")
+
+            with torch.no_grad():
+                # Warm up on a side stream before capture, as torch requires
+                stream = torch.cuda.Stream()
+                stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(stream):
+                    for _ in range(3):
+                        self._pi_net(self._static_in)
+                torch.cuda.current_stream().wait_stream(stream)
+
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph):
+                    self._static_out = self._pi_net(self._static_in)
+
+            self._cuda_graph = graph
+            logger.info(f"Captured CUDA graph for {self.agent_name} policy head")
+
+        except Exception as e:
+            logger.warning(
+                f"CUDA graph capture failed for {self.agent_name}, using eager policy: {e}"
+            )
+            self._cuda_graph = None
+
+    def _policy_head_forward(self, state: np.ndarray) -> Any:
+        """Run the policy head on a single state.
+
+        Replays the captured CUDA graph when one exists, otherwise runs the
+        cached eager head.
+
+        Args:
+            state: Encoded state vector
+
+        Returns:
+            CPU tensor of head outputs (logits for discrete action spaces)
+        """
+        import torch
+
+        if self._cuda_graph is not None:
+            with torch.no_grad():
+                self._static_in.copy_(torch.from_numpy(state).unsqueeze(0), non_blocking=True)
+                self._cuda_graph.replay()
+                return self._static_out[0].cpu()
+
+        if self._pi_net is None:
+            self._pi_net = self._build_policy_head()
+
+        with torch.inference_mode():
+            obs = torch.as_tensor(state, device=self.model.policy.device).unsqueeze(0)
+            return self._pi_net(obs)[0].cpu()
+
+    def _predict_action(self, state: np.ndarray, deterministic: bool = True) -> Any:
+        """Predict an action for a single encoded state.
+
+        Deterministic predictions go through the captured CUDA graph or the
+        TorchScript policy head when available; everything else uses
+        ``model.predict``.
+
+        Args:
+            state: Encoded state vector
+            deterministic: Whether to use deterministic policy
+
+        Returns:
+            Action as returned by ``model.predict``
+        """
+        if deterministic and (self._cuda_graph is not None or self._pi_scripted):
+            out = self._policy_head_forward(state).numpy()
+            if hasattr(self.model.action_space, "n"):
+                return np.argmax(out)
+            # Match model.predict, which clips continuous actions to the space
+            return np.clip(out, self.model.action_space.low, self.model.action_space.high)
+
+        action, _ = self.model.predict(state, deterministic=deterministic)
+        return action
+
+    def _predict_discrete_with_confidence(self, state: np.ndarray) -> Tuple[int, float]:
+        """Get the most likely discrete action and its probability.
+
+        Args:
+            state: Encoded state vector
+
+        Returns:
+            Tuple of (action, confidence)
+        """
+        import torch
+
+        logits = self._policy_head_forward(state)
+        action = int(torch.argmax(logits).item())
+        confidence = float(torch.softmax(logits, dim=-1)[action].item())
+
+        return action, confidence
+
+    def _encode_batch(
+        self, encode: Callable[..., np.ndarray], *arg_lists: Sequence[Any]
+    ) -> np.ndarray:
+        """Encode a batch of inputs into a stacked state matrix.
+
+        Large batches are spread over a thread pool so encoding can overlap
+        with other work; small batches are encoded serially.
+
+        Args:
+            encode: Encoder function (e.g. ``self.encoder.encode``)
+            *arg_lists: One sequence per encoder argument, all the same length
+
+        Returns:
+            State matrix of shape (batch_size, state_dim)
+        """
+        batch_size = len(arg_lists[0])
+
+        if batch_size < self.parallel_encode_min_batch:
+            states = [encode(*args) for args in zip(*arg_lists, strict=True)]
+        else:
+            max_workers = min(batch_size, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                states = list(executor.map(encode, *arg_lists))
+
+        return np.stack(states)
+
+    async def _predict_state_async(
+        self, state: np.ndarray, deterministic: bool = True
+    ) -> np.ndarray:
+        """Queue an encoded state for a batched policy forward pass.
+
+        States queued within ``batch_window_ms`` of each other (up to
+        ``batch_max_size``) are stacked and sent to the model in one call.
+
+        Args:
+            state: Encoded state vector
+            deterministic: Whether to use deterministic policy
+
+        Returns:
+            Raw model action for this state
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((future, state, bool(deterministic)))
+
+        if len(self._pending) >= self.batch_max_size:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window_ms / 1000.0, self._flush_pending)
+
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Run one batched forward pass per deterministic flag and resolve futures."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+
+        for deterministic in (True, False):
+            batch = [(f, s) for f, s, d in pending if d is deterministic]
+            if not batch:
+                continue
+
+            try:
+                states = np.stack([s for _, s in batch])
+                actions, _ = self.model.predict(states, deterministic=deterministic)
+            except Exception as e:
+                for future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (future, _), action in zip(batch, actions, strict=True):
+                if not future.done():
+                    future.set_result(action)
+
     def is_loaded(self) -> bool:
         """Check if model is loaded.
 
@@ -4,7 +4,7 @@ The gate agent filters candidates before sending to LLM.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 
@@ -68,16 +68,91 @@ class GateAgent(RLAgent):
         state = self.encoder.encode(candidate, portfolio_state or {})
 
         # Get action from PPO model
-        action, _ = self.model.predict(state, deterministic=deterministic)
-        action = int(action)
+        action = self.predict_state(state, deterministic)
 
         logger.debug(
-            f"Gate agent prediction for {candidate.candidate_id}: "
-            f"{'SKIP' if action == self.SKIP else 'PASS'}"
+            "Gate agent prediction for %s: %s",
+            candidate.candidate_id,
+            "SKIP" if action == self.SKIP else "PASS",
         )
 
         return action
 
+    def predict_state(self, state: np.ndarray, deterministic: bool = True) -> int:
+        """Predict skip/pass for an already encoded state.
+
+        Lets callers that also need the state (e.g. to hash it) encode once.
+
+        Args:
+            state: State from ``self.encoder.encode``
+            deterministic: Whether to use deterministic policy (default: True)
+
+        Returns:
+            Action (0=skip, 1=pass)
+        """
+        return int(self._predict_action(state, deterministic))
+
+    async def predict_async(
+        self,
+        candidate: CandidateRecordV1,
+        portfolio_state: Optional[Dict[str, Any]] = None,
+        deterministic: bool = True,
+    ) -> int:
+        """Async variant of ``predict`` that coalesces concurrent calls.
+
+        Args:
+            candidate: Candidate record
+            portfolio_state: Portfolio state dict (optional)
+            deterministic: Whether to use deterministic policy (default: True)
+
+        Returns:
+            Action (0=skip, 1=pass)
+        """
+        if not self.is_loaded():
+            raise ValueError(
+                f"Model not loaded for {self.agent_name} agent. "
+                "Call load_model() first or initialize with model_path."
+            )
+
+        state = self.encoder.encode(candidate, portfolio_state or {})
+        action = await self._predict_state_async(state, deterministic)
+
+        return int(action)
+
+    def predict_batch(
+        self,
+        candidates: Sequence[CandidateRecordV1],
+        portfolio_states: Optional[Sequence[Dict[str, Any]]] = None,
+        deterministic: bool = True,
+    ) -> List[int]:
+        """Predict skip/pass for a batch of candidates with one policy forward.
+
+        Args:
+            candidates: Candidate records
+            portfolio_states: Portfolio state per candidate (optional)
+            deterministic: Whether to use deterministic policy (default: True)
+
+        Returns:
+            List of actions (0=skip, 1=pass)
+        """
+        if not self.is_loaded():
+            raise ValueError(
+                f"Model not loaded for {self.agent_name} agent. "
+                "Call load_model() first or initialize with model_path."
+            )
+
+        if not candidates:
+            return []
+
+        states = self._encode_batch(
+            self.encoder.encode,
+            candidates,
+            portfolio_states or [{}] * len(candidates),
+        )
+        actions, _ = self.model.predict(states, deterministic=deterministic)
+
+        return [int(a) for a in actions]
+
     def predict_with_confidence(
         self,
         candidate: CandidateRecordV1,
@@ -100,14 +175,8 @@ class GateAgent(RLAgent):
         # Encode state
         state = self.encoder.encode(candidate, portfolio_state or {})
 
-        # Get action probabilities from PPO policy
-        action_probs = self.model.policy.get_distribution(state).distribution.probs.detach().numpy()
-
-        # Get most likely action
-        action = int(np.argmax(action_probs))
-        confidence = float(action_probs[action])
-
-        return action, confidence
+        # Get most likely action straight from the policy's action head
+        return self._predict_discrete_with_confidence(state)
 
     def should_pass(
         self,
@@ -2,9 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-
-import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from darwin.rl.agents.base import RLAgent
 from darwin.rl.utils.state_encoding import MetaLearnerStateEncoder
@@ -69,10 +67,81 @@ class MetaLearnerAgent(RLAgent):
         )
 
         # Get action from PPO model
-        action, _ = self.model.predict(state, deterministic=deterministic)
+        action = self._predict_action(state, deterministic)
+
+        return int(action)
+
+    async def predict_async(
+        self,
+        candidate: CandidateRecordV1,
+        llm_response: Dict[str, Any],
+        llm_history: Optional[Dict[str, Any]] = None,
+        portfolio_state: Optional[Dict[str, Any]] = None,
+        deterministic: bool = True,
+    ) -> int:
+        """Async variant of ``predict`` that coalesces concurrent calls.
+
+        Call sites scoring a burst of candidates with
+        ``asyncio.gather(*[agent.predict_async(c, r) for c, r in pairs])``
+        share one batched policy forward pass instead of one per candidate.
+
+        Args:
+            candidate: Candidate record
+            llm_response: LLM response with decision context
+            llm_history: Rolling LLM performance history
+            portfolio_state: Current portfolio state
+            deterministic: Use deterministic prediction
+
+        Returns:
+            Action (0=agree, 1=override_to_skip, 2=override_to_take)
+        """
+        if not self.is_loaded():
+            raise ValueError("Model not loaded. Call load_model() first.")
+
+        state = self.encoder.encode(
+            candidate, llm_response, llm_history or {}, portfolio_state or {}
+        )
+        action = await self._predict_state_async(state, deterministic)
 
         return int(action)
 
+    def predict_batch(
+        self,
+        candidates: Sequence[CandidateRecordV1],
+        llm_responses: Sequence[Dict[str, Any]],
+        llm_histories: Optional[Sequence[Dict[str, Any]]] = None,
+        portfolio_states: Optional[Sequence[Dict[str, Any]]] = None,
+        deterministic: bool = True,
+    ) -> List[int]:
+        """Predict actions for a batch of candidates with one policy forward.
+
+        Args:
+            candidates: Candidate records
+            llm_responses: LLM response per candidate
+            llm_histories: Rolling LLM history per candidate (optional)
+            portfolio_states: Portfolio state per candidate (optional)
+            deterministic: Use deterministic prediction
+
+        Returns:
+            List of actions (0=agree, 1=override_to_skip, 2=override_to_take)
+        """
+        if not self.is_loaded():
+            raise ValueError("Model not loaded. Call load_model() first.")
+
+        if not candidates:
+            return []
+
+        states = self._encode_batch(
+            self.encoder.encode,
+            candidates,
+            llm_responses,
+            llm_histories or [{}] * len(candidates),
+            portfolio_states or [{}] * len(candidates),
+        )
+        actions, _ = self.model.predict(states, deterministic=deterministic)
+
+        return [int(a) for a in actions]
+
     def predict_with_confidence(
         self,
         candidate: CandidateRecordV1,
@@ -99,14 +168,8 @@ class MetaLearnerAgent(RLAgent):
             candidate, llm_response, llm_history or {}, portfolio_state or {}
         )
 
-        # Get action probabilities from PPO policy
-        action_probs = self.model.policy.get_distribution(state).distribution.probs.detach().numpy()
-
-        # Get most likely action
-        action = int(np.argmax(action_probs))
-        confidence = float(action_probs[action])
-
-        return action, confidence
+        # Get most likely action straight from the policy's action head
+        return self._predict_discrete_with_confidence(state)
 
     def should_override(
         self,
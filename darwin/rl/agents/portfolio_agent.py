@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -57,10 +57,83 @@ class PortfolioAgent(RLAgent):
         state = self.encoder.encode(candidate, llm_response, portfolio_state or {})
 
         # Get position size from PPO model
-        action, _ = self.model.predict(state, deterministic=deterministic)
-        position_size = float(np.clip(action[0], 0.0, 1.0))
+        return self.predict_state(state, deterministic)
 
-        return position_size
+    def predict_state(self, state: np.ndarray, deterministic: bool = True) -> float:
+        """Predict position size fraction for an already encoded state.
+
+        Lets callers that also need the state (e.g. to hash it) encode once.
+
+        Args:
+            state: State from ``self.encoder.encode``
+            deterministic: Use deterministic prediction
+
+        Returns:
+            Position size fraction [0, 1]
+        """
+        action = self._predict_action(state, deterministic)
+        # Plain scalar clamp; np.clip dispatches a full ufunc for one value
+        return max(0.0, min(1.0, float(action[0])))
+
+    async def predict_async(
+        self,
+        candidate: CandidateRecordV1,
+        llm_response: Dict[str, Any],
+        portfolio_state: Optional[Dict[str, Any]] = None,
+        deterministic: bool = True,
+    ) -> float:
+        """Async variant of ``predict`` that coalesces concurrent calls.
+
+        Args:
+            candidate: Candidate record
+            llm_response: LLM response with decision context
+            portfolio_state: Current portfolio state
+            deterministic: Use deterministic prediction
+
+        Returns:
+            Position size fraction [0, 1]
+        """
+        if not self.is_loaded():
+            raise ValueError("Model not loaded. Call load_model() first.")
+
+        state = self.encoder.encode(candidate, llm_response, portfolio_state or {})
+        action = await self._predict_state_async(state, deterministic)
+
+        return max(0.0, min(1.0, float(action[0])))
+
+    def predict_batch(
+        self,
+        candidates: Sequence[CandidateRecordV1],
+        llm_responses: Sequence[Dict[str, Any]],
+        portfolio_states: Optional[Sequence[Dict[str, Any]]] = None,
+        deterministic: bool = True,
+    ) -> List[float]:
+        """Predict position sizes for a batch of candidates with one policy forward.
+
+        Args:
+            candidates: Candidate records
+            llm_responses: LLM response per candidate
+            portfolio_states: Portfolio state per candidate (optional)
+            deterministic: Use deterministic prediction
+
+        Returns:
+            List of position size fractions [0, 1]
+        """
+        if not self.is_loaded():
+            raise ValueError("Model not loaded. Call load_model() first.")
+
+        if not candidates:
+            return []
+
+        states = self._encode_batch(
+            self.encoder.encode,
+            candidates,
+            llm_responses,
+            portfolio_states or [{}] * len(candidates),
+        )
+        actions, _ = self.model.predict(states, deterministic=deterministic)
+
+        return [max(0.0, min(1.0, float(a[0]))) for a in actions]
 
     def predict_with_confidence(
         self,
@@ -86,7 +159,7 @@ class PortfolioAgent(RLAgent):
 
         # Get prediction
         action, _ = self.model.predict(state, deterministic=False)
-        position_size = float(np.clip(action[0], 0.0, 1.0))
+        position_size = max(0.0, min(1.0, float(action[0])))
 
         # Get value function estimate as confidence
         try:
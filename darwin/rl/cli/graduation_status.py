@@ -1,18 +1,186 @@
 """CLI tool for checking agent graduation status."""
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import copy
+import functools
 import json
 import logging
+import os
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Tuple
 
-from darwin.rl.graduation.policy import GraduationPolicy
-from darwin.rl.schemas.rl_config import GraduationThresholdsV1
-from darwin.rl.storage.agent_state import AgentStateSQLite
+if TYPE_CHECKING:
+    from darwin.rl.graduation.policy import GraduationDecision
+    from darwin.rl.schemas.rl_config import GraduationThresholdsV1
+    from darwin.rl.storage.agent_state import AgentStateSQLite
 
 logger = logging.getLogger(__name__)
 
+_BAR = "=" * 60
+
+# Default baseline per agent (used when --baseline is not given)
+_BASELINE_MAP = {
+    "gate": "pass_all",
+    "portfolio": "equal_weight",
+    "meta_learner": "llm_only",
+}
+_AGENT_CHOICES = tuple(_BASELINE_MAP)
+
+# Graduation metrics depend on the current time as well as the database
+# (validation windows end "now"), so cached evaluations expire after this
+_EVAL_CACHE_TTL_SECONDS = 60.0
+
+
+# Shared agent state connections by database path, see _get_agent_state()
+_agent_states: Dict[str, AgentStateSQLite] = {}
+
+
+def _get_agent_state(db_path: str) -> AgentStateSQLite:
+    """Open (once per path) the agent state database.
+
+    Repeated status checks in one process, e.g. all agents in sequence from a
+    supervisor loop, share the connection instead of reopening the file.
+    close_agent_states() closes them; main() calls it when done, and it also
+    runs at interpreter exit.
+
+    Args:
+        db_path: Path to agent state database
+
+    Returns:
+        Shared agent state storage instance
+    """
+    agent_state = _agent_states.get(db_path)
+    if agent_state is None:
+        from darwin.rl.storage.agent_state import AgentStateSQLite
+
+        # Status checks only read; an existing database is opened read-only so
+        # the CLI never writes to (or switches the journal mode of) a live file
+        agent_state = AgentStateSQLite(db_path, read_only=Path(db_path).exists())
+        _agent_states[db_path] = agent_state
+    return agent_state
+
+
+def close_agent_states() -> None:
+    """Close the shared agent state connections and drop cached evaluations."""
+    _cached_eval.cache_clear()
+    while _agent_states:
+        _, agent_state = _agent_states.popitem()
+        agent_state.close()
+
+
+atexit.register(close_agent_states)
+
+
+def _db_version(db_path: str) -> Tuple[int, int]:
+    """Get a cheap version stamp for the agent state database.
+
+    In WAL mode writes land in the -wal file until a checkpoint, so its
+    mtime is included alongside the main file's.
+
+    Args:
+        db_path: Path to agent state database
+
+    Returns:
+        Tuple of (db mtime_ns, wal mtime_ns or 0)
+    """
+    try:
+        wal_mtime = os.stat(f"{db_path}-wal").st_mtime_ns
+    except FileNotFoundError:
+        wal_mtime = 0
+    return os.stat(db_path).st_mtime_ns, wal_mtime
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_eval(
+    agent_name: str,
+    db_path: str,
+    db_version: Tuple[int, int],
+    thresholds_key: Tuple[Tuple[str, object], ...],
+    ttl_bucket: int,
+) -> GraduationDecision:
+    """Evaluate graduation, memoized on the database version, thresholds and time.
+
+    Dashboards and watchdogs re-check the same agent repeatedly; the
+    evaluation is only rerun when the database file changes or the
+    _EVAL_CACHE_TTL_SECONDS time bucket rolls over. db_version and
+    ttl_bucket are part of the cache key only. The returned decision is
+    shared between callers; use _evaluate() for a private copy.
+
+    Args:
+        agent_name: Name of agent to evaluate
+        db_path: Path to agent state database
+        db_version: Version stamp from _db_version()
+        thresholds_key: Sorted (field, value) pairs of GraduationThresholdsV1
+        ttl_bucket: Time bucket from time.monotonic() // _EVAL_CACHE_TTL_SECONDS
+
+    Returns:
+        Graduation decision
+    """
+    from darwin.rl.graduation.policy import GraduationPolicy
+    from darwin.rl.schemas.rl_config import GraduationThresholdsV1
+
+    thresholds = GraduationThresholdsV1(**dict(thresholds_key))
+    policy = GraduationPolicy(_get_agent_state(db_path), thresholds)
+    return policy.evaluate_graduation(agent_name)
+
+
+def _evaluate(
+    agent_name: str, db_path: str, thresholds: GraduationThresholdsV1
+) -> GraduationDecision:
+    """Evaluate graduation through the cache.
+
+    Args:
+        agent_name: Name of agent to evaluate
+        db_path: Path to agent state database
+        thresholds: Graduation thresholds
+
+    Returns:
+        Copy of the (possibly cached) decision, safe for the caller to modify
+    """
+    thresholds_key = tuple(sorted(thresholds.model_dump().items()))
+    ttl_bucket = int(time.monotonic() // _EVAL_CACHE_TTL_SECONDS)
+    decision = _cached_eval(agent_name, db_path, _db_version(db_path), thresholds_key, ttl_bucket)
+    return copy.deepcopy(decision)
+
+
+def _format_verbose(agent_name: str, decision: GraduationDecision) -> str:
+    """Render the detailed graduation report.
+
+    Args:
+        agent_name: Name of agent
+        decision: Graduation decision to report
+
+    Returns:
+        Report text, newline terminated
+    """
+    verdict = "✓ CAN GRADUATE" if decision.can_graduate else "✗ CANNOT GRADUATE"
+    parts = [
+        "",
+        _BAR,
+        f"Graduation Status for Agent: {agent_name}",
+        _BAR,
+        "",
+        f"Decision: {verdict}",
+        f"Reason: {decision.reason}",
+        "",
+        "Checks:",
+    ]
+    parts.extend(
+        f"  {'✓' if passed else '✗'} {check_name}" for check_name, passed in decision.checks.items()
+    )
+    parts.extend(["", "Metrics:"])
+    parts.extend(
+        f"  {metric_name}: {value:.4f}" if isinstance(value, float) else f"  {metric_name}: {value}"
+        for metric_name, value in decision.metrics.items()
+    )
+    parts.extend(["", _BAR, ""])
+    return "\n".join(parts) + "\n"
+
 
 def check_graduation_status(
     agent_name: str,
@@ -32,37 +200,17 @@ def check_graduation_status(
         Exit code (0=can graduate, 1=cannot graduate, 2=error)
     """
     try:
-        # Load agent state
-        agent_state = AgentStateSQLite(agent_state_db)
-
-        # Create graduation policy
-        policy = GraduationPolicy(agent_state, thresholds)
+        # Load (shared) agent state; this also creates the database if missing
+        db_path = str(agent_state_db)
+        _get_agent_state(db_path)
 
-        # Evaluate graduation
-        decision = policy.evaluate_graduation(agent_name)
+        # Evaluate graduation (memoized until the database changes or the TTL expires)
+        decision = _evaluate(agent_name, db_path, thresholds)
 
         # Print results
         if verbose:
-            print(f"\n{'='*60}")
-            print(f"Graduation Status for Agent: {agent_name}")
-            print(f"{'='*60}\n")
-
-            print(f"Decision: {'✓ CAN GRADUATE' if decision.can_graduate else '✗ CANNOT GRADUATE'}")
-            print(f"Reason: {decision.reason}\n")
-
-            print("Checks:")
-            for check_name, passed in decision.checks.items():
-                status = "✓" if passed else "✗"
-                print(f"  {status} {check_name}")
-
-            print("\nMetrics:")
-            for metric_name, value in decision.metrics.items():
-                if isinstance(value, float):
-                    print(f"  {metric_name}: {value:.4f}")
-                else:
-                    print(f"  {metric_name}: {value}")
-
-            print(f"\n{'='*60}\n")
+            # One buffered write instead of a print() per line
+            sys.stdout.write(_format_verbose(agent_name, decision))
         else:
             # Simple output
             if decision.can_graduate:
@@ -70,9 +218,6 @@ def check_graduation_status(
             else:
                 print(f"✗ {agent_name}: CANNOT GRADUATE - {decision.reason}")
 
-        # Close agent state
-        agent_state.close()
-
         return 0 if decision.can_graduate else 1
 
     except Exception as e:
@@ -81,12 +226,9 @@ def check_graduation_status(
         return 2
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Check RL agent graduation status",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _epilog() -> str:
+    """Return the usage examples shown in --help output."""
+    return """
 Examples:
   # Check gate agent with default thresholds
   python -m darwin.rl.cli.graduation_status gate --db artifacts/rl_state/agent_state.sqlite
@@ -97,13 +239,29 @@ Examples:
 
   # Verbose output
   python -m darwin.rl.cli.graduation_status meta_learner --db artifacts/rl_state/agent_state.sqlite -v
-        """,
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+
+    Cached so repeated invocations in the same process (e.g. a test loop)
+    reuse the parser instead of reconstructing it.
+
+    Returns:
+        Argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Check RL agent graduation status",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_epilog(),
     )
 
     parser.add_argument(
         "agent_name",
         type=str,
-        choices=["gate", "portfolio", "meta_learner"],
+        choices=_AGENT_CHOICES,
         help="Name of agent to check",
     )
 
@@ -157,17 +315,19 @@ Examples:
         help="Print detailed graduation information",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    args = _build_parser().parse_args()
 
     # Auto-detect baseline type if not specified
-    baseline_map = {
-        "gate": "pass_all",
-        "portfolio": "equal_weight",
-        "meta_learner": "llm_only",
-    }
-    baseline_type = args.baseline or baseline_map[args.agent_name]
+    baseline_type = args.baseline or _BASELINE_MAP[args.agent_name]
 
     # Create thresholds
+    from darwin.rl.schemas.rl_config import GraduationThresholdsV1
+
     thresholds = GraduationThresholdsV1(
         min_training_samples=args.min_training,
         min_validation_samples=args.min_validation,
@@ -177,12 +337,15 @@ Examples:
     )
 
     # Check graduation status
-    exit_code = check_graduation_status(
-        args.agent_name,
-        args.db,
-        thresholds,
-        verbose=args.verbose,
-    )
+    try:
+        exit_code = check_graduation_status(
+            args.agent_name,
+            args.db,
+            thresholds,
+            verbose=args.verbose,
+        )
+    finally:
+        close_agent_states()
 
     sys.exit(exit_code)
 
@@ -1,8 +1,33 @@
-"""RL environments for agents."""
+"""RL environments for agents.
 
-from darwin.rl.envs.gate_env import GateEnv, ReplayGateEnv
-from darwin.rl.envs.meta_learner_env import MetaLearnerEnv, ReplayMetaLearnerEnv
-from darwin.rl.envs.portfolio_env import PortfolioEnv, ReplayPortfolioEnv
+Environment classes are imported lazily (PEP 562) so that importing this
+package does not pull in gymnasium until an environment is actually used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from darwin.rl.envs.gate_env import GateEnv, ReplayGateEnv
+    from darwin.rl.envs.meta_learner_env import MetaLearnerEnv, ReplayMetaLearnerEnv
+    from darwin.rl.envs.portfolio_env import PortfolioEnv, ReplayPortfolioEnv
+    from darwin.rl.envs.vector_replay import (
+        VectorReplayGateEnv,
+        VectorReplayMetaLearnerEnv,
+        VectorReplayPortfolioEnv,
+    )
+
+_LAZY_IMPORTS = {
+    "GateEnv": "darwin.rl.envs.gate_env",
+    "ReplayGateEnv": "darwin.rl.envs.gate_env",
+    "PortfolioEnv": "darwin.rl.envs.portfolio_env",
+    "ReplayPortfolioEnv": "darwin.rl.envs.portfolio_env",
+    "MetaLearnerEnv": "darwin.rl.envs.meta_learner_env",
+    "ReplayMetaLearnerEnv": "darwin.rl.envs.meta_learner_env",
+    "VectorReplayGateEnv": "darwin.rl.envs.vector_replay",
+    "VectorReplayPortfolioEnv": "darwin.rl.envs.vector_replay",
+    "VectorReplayMetaLearnerEnv": "darwin.rl.envs.vector_replay",
+}
 
 __all__ = [
     "GateEnv",
@@ -11,4 +36,22 @@ __all__ = [
     "ReplayPortfolioEnv",
     "MetaLearnerEnv",
     "ReplayMetaLearnerEnv",
+    "VectorReplayGateEnv",
+    "VectorReplayPortfolioEnv",
+    "VectorReplayMetaLearnerEnv",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported environment classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
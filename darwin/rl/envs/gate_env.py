@@ -7,13 +7,13 @@ The gate agent learns to filter candidates before sending to LLM.
 """
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 import gymnasium as gym
 import numpy as np
 from gymnasium import spaces
 
-from darwin.rl.utils.reward_shaping import compute_gate_reward, normalize_reward
+from darwin.rl.utils.reward_shaping import compute_gate_reward
 from darwin.rl.utils.state_encoding import GateStateEncoder
 from darwin.schemas.candidate import CandidateRecordV1
 from darwin.schemas.outcome_label import OutcomeLabelV1
@@ -33,6 +33,10 @@ class GateEnv(gym.Env):
 
     metadata = {"render_modes": []}
 
+    # Encoders are read-only after construction, so one instance is shared
+    # by every env (e.g. across vectorized workers)
+    _ENCODER: ClassVar[GateStateEncoder] = GateStateEncoder()
+
     def __init__(
         self,
         episodes: Optional[list] = None,
@@ -50,8 +54,8 @@ class GateEnv(gym.Env):
         """
         super().__init__()
 
-        # State encoder
-        self.encoder = GateStateEncoder()
+        # State encoder (shared)
+        self.encoder = self._ENCODER
         self.state_dim = self.encoder.get_state_dim()
 
         # Action and observation spaces
@@ -63,10 +67,6 @@ class GateEnv(gym.Env):
             dtype=np.float32,
         )
 
-        # Episodes
-        self.episodes = episodes or []
-        self.current_episode_idx = 0
-
         # Reward configuration
         self.cost_savings_bonus = cost_savings_bonus
         self.clip_rewards = clip_rewards
@@ -76,6 +76,12 @@ class GateEnv(gym.Env):
         self.current_candidate: Optional[CandidateRecordV1] = None
         self.current_outcome: Optional[OutcomeLabelV1] = None
         self.current_portfolio_state: Optional[Dict[str, Any]] = None
+        self._last_obs: Optional[np.ndarray] = None
+
+        # Episodes
+        self.episodes = episodes or []
+        self.current_episode_idx = 0
+        self._cache_episodes()
 
     def reset(
         self,
@@ -102,20 +108,10 @@ class GateEnv(gym.Env):
         else:
             self.current_episode_idx = 0
 
-        # Load episode
-        episode = self.episodes[self.current_episode_idx]
-        self.current_candidate = episode["candidate"]
-        self.current_outcome = episode["outcome"]
-        self.current_portfolio_state = episode.get("portfolio_state", {})
-
-        # Encode state
-        observation = self.encoder.encode(
-            self.current_candidate,
-            self.current_portfolio_state,
-        )
+        observation = self._load_episode(self.current_episode_idx)
 
         info = {
-            "candidate_id": self.current_candidate.candidate_id,
+            "candidate_id": self._candidate_ids[self.current_episode_idx],
             "episode_idx": self.current_episode_idx,
         }
 
@@ -133,43 +129,102 @@ class GateEnv(gym.Env):
         if self.current_candidate is None or self.current_outcome is None:
             raise ValueError("Environment not reset. Call reset() first.")
 
-        # Compute reward based on action and outcome
-        reward = self._compute_reward(action)
+        # Policies hand actions over as NumPy scalars/0-d arrays; tuple
+        # indexing below needs a Python int
+        action = int(action)
+
+        # Rewards are precomputed per (episode, action) in _cache_episodes()
+        idx = self.current_episode_idx
+        reward = self._reward_table.item(idx, action)
 
         # Gate environment is single-step per episode
         terminated = True
         truncated = False
 
-        # Next observation (doesn't matter since terminated=True)
-        observation = self.encoder.encode(
-            self.current_candidate,
-            self.current_portfolio_state or {},
-        )
+        # Next observation is ignored since terminated=True; reuse the reset one
+        observation = self._last_obs
 
         # Info
         info = {
-            "candidate_id": self.current_candidate.candidate_id,
-            "action": "skip" if action == 0 else "pass",
+            "candidate_id": self._candidate_ids[idx],
+            "action": ("skip", "pass")[action],
             "reward": reward,
-            "counterfactual_r_multiple": self.current_outcome.counterfactual_r_multiple,
-            "was_taken": self.current_outcome.was_taken,
+            "counterfactual_r_multiple": self._counterfactual_r[idx],
+            "was_taken": self._was_taken[idx],
         }
 
         return observation, reward, terminated, truncated, info
 
-    def _compute_reward(self, action: int) -> float:
+    def _cache_episodes(self) -> None:
+        """Pre-encode all episodes into an (N, state_dim) observation matrix.
+
+        Episodes are immutable during offline replay, so each one is encoded
+        once here and reset() becomes a row lookup. Episode fields are split
+        into parallel lists (with defaults filled in) for the same reason.
+        """
+        self._candidates = [ep["candidate"] for ep in self.episodes]
+        self._outcomes = [ep["outcome"] for ep in self.episodes]
+        self._portfolio_states = [ep.get("portfolio_state", {}) for ep in self.episodes]
+
+        self._obs_cache = np.empty((len(self.episodes), self.state_dim), dtype=np.float32)
+        for i, (candidate, portfolio_state) in enumerate(
+            zip(self._candidates, self._portfolio_states, strict=True)
+        ):
+            self.encoder.encode(candidate, portfolio_state, out=self._obs_cache[i])
+
+        # reset() hands out rows of the cache without copying; read-only so a
+        # caller mutating an observation cannot corrupt later episodes
+        self._obs_cache.setflags(write=False)
+
+        self._candidate_ids = [c.candidate_id for c in self._candidates]
+        self._was_taken = [o.was_taken for o in self._outcomes]
+        self._counterfactual_r = [o.counterfactual_r_multiple for o in self._outcomes]
+
+        # Offline outcomes are fixed, so the reward for every (episode, action)
+        # pair is known up front and step() becomes a table lookup.
+        self._reward_table = np.empty((len(self.episodes), self.action_space.n))
+        for i, (candidate, outcome) in enumerate(
+            zip(self._candidates, self._outcomes, strict=True)
+        ):
+            for action in range(self.action_space.n):
+                self._reward_table[i, action] = self._compute_reward(action, candidate, outcome)
+
+    def _load_episode(self, episode_idx: int) -> np.ndarray:
+        """Load an episode as the current one.
+
+        Args:
+            episode_idx: Index into self.episodes
+
+        Returns:
+            Pre-encoded observation for the episode
+        """
+        self.current_candidate = self._candidates[episode_idx]
+        self.current_outcome = self._outcomes[episode_idx]
+        self.current_portfolio_state = self._portfolio_states[episode_idx]
+
+        self._last_obs = self._obs_cache[episode_idx]
+        return self._last_obs
+
+    def _compute_reward(
+        self,
+        action: int,
+        candidate: CandidateRecordV1,
+        outcome: OutcomeLabelV1,
+    ) -> float:
         """Compute reward for action.
 
         Args:
             action: Action taken (0=skip, 1=pass)
+            candidate: Candidate the action was taken on
+            outcome: Outcome label for the candidate
 
         Returns:
             Reward value
         """
         # Get counterfactual outcome
-        counterfactual_r = self.current_outcome.counterfactual_r_multiple
-        was_taken = self.current_outcome.was_taken
-        llm_decision = self.current_candidate.llm_decision
+        counterfactual_r = outcome.counterfactual_r_multiple
+        was_taken = outcome.was_taken
+        llm_decision = candidate.llm_decision
 
         # Compute reward
         if action == 0:  # SKIP
@@ -181,8 +236,8 @@ class GateEnv(gym.Env):
             )
         else:  # PASS
             # If candidate was actually taken, use actual outcome
-            if was_taken and self.current_outcome.actual_r_multiple is not None:
-                reward = self.current_outcome.actual_r_multiple
+            if was_taken and outcome.actual_r_multiple is not None:
+                reward = outcome.actual_r_multiple
             else:
                 # LLM decided to skip
                 reward = compute_gate_reward(
@@ -190,11 +245,15 @@ class GateEnv(gym.Env):
                     llm_decision=llm_decision or "skip",
                 )
 
-        # Normalize/clip reward
+        # Clip reward (inlined normalize_reward(reward, clip=True, clip_range=...))
         if self.clip_rewards:
-            reward = normalize_reward(reward, clip=True, clip_range=self.clip_range)
+            clip_range = self.clip_range
+            if reward < -clip_range:
+                reward = -clip_range
+            elif reward > clip_range:
+                reward = clip_range
 
-        return float(reward)
+        return reward
 
     def set_episodes(self, episodes: list) -> None:
         """Set episodes for training.
@@ -207,6 +266,7 @@ class GateEnv(gym.Env):
         """
         self.episodes = episodes
         self.current_episode_idx = 0
+        self._cache_episodes()
         logger.info(f"Loaded {len(episodes)} episodes for gate environment")
 
     def get_episode_count(self) -> int:
@@ -247,6 +307,9 @@ class ReplayGateEnv(GateEnv):
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Reset to next episode in sequence.
 
+        Replay is deterministic, so gym.Env.reset() (which only reseeds
+        np_random) is skipped.
+
         Args:
             seed: Random seed (ignored for replay)
             options: Additional options
@@ -261,20 +324,10 @@ class ReplayGateEnv(GateEnv):
         self.current_episode_idx = self.episode_count % self.max_episodes
         self.episode_count += 1
 
-        # Load episode
-        episode = self.episodes[self.current_episode_idx]
-        self.current_candidate = episode["candidate"]
-        self.current_outcome = episode["outcome"]
-        self.current_portfolio_state = episode.get("portfolio_state", {})
-
-        # Encode state
-        observation = self.encoder.encode(
-            self.current_candidate,
-            self.current_portfolio_state,
-        )
+        observation = self._load_episode(self.current_episode_idx)
 
         info = {
-            "candidate_id": self.current_candidate.candidate_id,
+            "candidate_id": self._candidate_ids[self.current_episode_idx],
             "episode_idx": self.current_episode_idx,
             "total_episodes": self.max_episodes,
         }
@@ -1,7 +1,7 @@
 """Meta-learner agent Gymnasium environment."""
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 import gymnasium as gym
 import numpy as np
@@ -22,6 +22,9 @@ class MetaLearnerEnv(gym.Env):
     Reward: Actual R-multiple if override improves outcome, penalty for disagreement
     """
 
+    # Shared, read-only encoder (see GateEnv._ENCODER)
+    _ENCODER: ClassVar[MetaLearnerStateEncoder] = MetaLearnerStateEncoder()
+
     def __init__(self, episodes: Optional[list] = None):
         """Initialize meta-learner environment.
 
@@ -35,7 +38,7 @@ class MetaLearnerEnv(gym.Env):
         """
         super().__init__()
 
-        self.encoder = MetaLearnerStateEncoder()
+        self.encoder = self._ENCODER
 
         # Action space: Discrete(3)
         # 0 = AGREE (follow LLM)
@@ -52,6 +55,10 @@ class MetaLearnerEnv(gym.Env):
         self.episodes = episodes or []
         self.current_episode_idx = 0
         self.current_episode: Optional[Dict[str, Any]] = None
+        self._last_obs: Optional[np.ndarray] = None
+        # Index loaded by reset(); replay subclasses advance current_episode_idx
+        self._active_idx = 0
+        self._cache_episodes()
 
     @property
     def state_dim(self) -> int:
@@ -66,6 +73,50 @@ class MetaLearnerEnv(gym.Env):
         """
         self.episodes = episodes
         self.current_episode_idx = 0
+        self._cache_episodes()
+
+    def _cache_episodes(self) -> None:
+        """Pre-encode all episodes into an (N, state_dim) observation matrix.
+
+        Episodes are immutable during offline replay, so encoding happens once
+        here and reset() only slices a row. Episode fields are split into
+        parallel lists with their defaults filled in.
+        """
+        self._candidates = [ep["candidate"] for ep in self.episodes]
+        self._llm_responses = [ep.get("llm_response", {}) for ep in self.episodes]
+        self._outcomes = [ep["outcome"] for ep in self.episodes]
+        self._llm_histories = [ep.get("llm_history", {}) for ep in self.episodes]
+        self._portfolio_states = [ep.get("portfolio_state", {}) for ep in self.episodes]
+
+        self._obs_cache = np.empty((len(self.episodes), self.state_dim), dtype=np.float32)
+        for i, fields in enumerate(
+            zip(
+                self._candidates,
+                self._llm_responses,
+                self._llm_histories,
+                self._portfolio_states,
+                strict=True,
+            )
+        ):
+            self.encoder.encode(*fields, out=self._obs_cache[i])
+
+        # reset() hands out rows of the cache without copying; read-only so a
+        # caller mutating an observation cannot corrupt later episodes
+        self._obs_cache.setflags(write=False)
+
+        self._candidate_ids = [c.candidate_id for c in self._candidates]
+        self._run_ids = [c.run_id for c in self._candidates]
+        self._llm_decisions = [r.get("decision", "skip") for r in self._llm_responses]
+        self._actual_r = [o.actual_r_multiple for o in self._outcomes]
+
+        # Offline outcomes are fixed, so the reward for every (episode, action)
+        # pair is known up front and step() becomes a table lookup.
+        self._reward_table = np.empty((len(self.episodes), self.action_space.n))
+        for i, (llm_decision, outcome) in enumerate(
+            zip(self._llm_decisions, self._outcomes, strict=True)
+        ):
+            for action in range(self.action_space.n):
+                self._reward_table[i, action] = self._compute_reward(action, llm_decision, outcome)
 
     def get_episode_count(self) -> int:
         """Get number of episodes.
@@ -92,23 +143,29 @@ class MetaLearnerEnv(gym.Env):
         if not self.episodes:
             raise ValueError("No episodes available. Call set_episodes() first.")
 
-        # Get current episode
-        self.current_episode = self.episodes[self.current_episode_idx]
+        return self._load_episode(self.current_episode_idx)
 
-        # Extract components
-        candidate = self.current_episode["candidate"]
-        llm_response = self.current_episode.get("llm_response", {})
-        llm_history = self.current_episode.get("llm_history", {})
-        portfolio_state = self.current_episode.get("portfolio_state", {})
+    def _load_episode(self, idx: int) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Load an episode as the current one.
 
-        # Encode state
-        obs = self.encoder.encode(candidate, llm_response, llm_history, portfolio_state)
+        Args:
+            idx: Index into self.episodes
+
+        Returns:
+            Tuple of (pre-encoded observation, info)
+        """
+        self._active_idx = idx
+        self.current_episode = self.episodes[idx]
+
+        # Observation was encoded once at set_episodes time
+        obs = self._obs_cache[idx]
+        self._last_obs = obs
 
         info = {
-            "candidate_id": candidate.candidate_id,
-            "run_id": candidate.run_id,
-            "episode_idx": self.current_episode_idx,
-            "llm_decision": llm_response.get("decision", "skip"),
+            "candidate_id": self._candidate_ids[idx],
+            "run_id": self._run_ids[idx],
+            "episode_idx": idx,
+            "llm_decision": self._llm_decisions[idx],
         }
 
         return obs, info
@@ -127,38 +184,34 @@ class MetaLearnerEnv(gym.Env):
         if self.current_episode is None:
             raise ValueError("Must call reset() before step()")
 
+        # Policies hand actions over as NumPy scalars/0-d arrays; tuple
+        # indexing below needs a Python int
+        action = int(action)
+
         # Get episode data
-        outcome = self.current_episode["outcome"]
-        llm_response = self.current_episode.get("llm_response", {})
-        llm_decision = llm_response.get("decision", "skip")
+        idx = self._active_idx
+        llm_decision = self._llm_decisions[idx]
 
-        # Compute reward
-        reward = self._compute_reward(action, llm_decision, outcome)
+        # Rewards are precomputed per (episode, action) in _cache_episodes()
+        reward = self._reward_table.item(idx, action)
 
         # Episode terminates after one decision
         terminated = True
         truncated = False
 
         # Return same observation (episode ends)
-        candidate = self.current_episode["candidate"]
-        llm_history = self.current_episode.get("llm_history", {})
-        portfolio_state = self.current_episode.get("portfolio_state", {})
-        obs = self.encoder.encode(candidate, llm_response, llm_history, portfolio_state)
-
-        # Determine final decision after override
-        if action == 0:  # AGREE
-            final_decision = llm_decision
-        elif action == 1:  # OVERRIDE_TO_SKIP
-            final_decision = "skip"
-        else:  # action == 2, OVERRIDE_TO_TAKE
-            final_decision = "take"
+        obs = self._last_obs
+
+        # Final decision after override, indexed by action
+        # (0=AGREE, 1=OVERRIDE_TO_SKIP, 2=OVERRIDE_TO_TAKE)
+        final_decision = (llm_decision, "skip", "take")[action]
 
         info = {
-            "candidate_id": candidate.candidate_id,
+            "candidate_id": self._candidate_ids[idx],
             "action": action,
             "llm_decision": llm_decision,
             "final_decision": final_decision,
-            "actual_r_multiple": outcome.actual_r_multiple,
+            "actual_r_multiple": self._actual_r[idx],
             "reward": reward,
         }
 
@@ -211,18 +264,21 @@ class ReplayMetaLearnerEnv(MetaLearnerEnv):
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Reset and cycle to next episode.
 
+        Replay is deterministic, so gym.Env.reset() (which only reseeds
+        np_random) is skipped.
+
         Args:
-            seed: Random seed
+            seed: Random seed (ignored for replay)
             options: Optional reset options
 
         Returns:
             Tuple of (observation, info)
         """
-        # Reset with current episode
-        obs, info = super().reset(seed=seed, options=options)
+        if not self.episodes:
+            raise ValueError("No episodes available. Call set_episodes() first.")
 
-        # Cycle to next episode for next reset
-        if self.episodes:
-            self.current_episode_idx = (self.current_episode_idx + 1) % len(self.episodes)
+        # Load current episode, then cycle to next episode for next reset
+        obs, info = self._load_episode(self.current_episode_idx)
+        self.current_episode_idx = (self.current_episode_idx + 1) % len(self.episodes)
 
         return obs, info
@@ -1,13 +1,23 @@
 """Portfolio agent Gymnasium environment."""
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 import gymnasium as gym
 import numpy as np
 from gymnasium import spaces
 
-from darwin.rl.utils.reward_shaping import compute_portfolio_reward
+from darwin.rl.utils.reward_shaping import (
+    PORTFOLIO_CAPACITY_BONUS,
+    PORTFOLIO_CAPACITY_MIN_SIZE,
+    PORTFOLIO_DIVERSIFICATION_BONUS,
+    PORTFOLIO_DIVERSIFICATION_RANGE,
+    PORTFOLIO_DRAWDOWN_PENALTY,
+    PORTFOLIO_OVERSIZE_MIN_SIZE,
+    PORTFOLIO_OVERSIZE_PENALTY,
+    portfolio_caused_drawdown,
+    portfolio_has_capacity,
+)
 from darwin.rl.utils.state_encoding import PortfolioStateEncoder
 from darwin.schemas.candidate import CandidateRecordV1
 
@@ -22,6 +32,9 @@ class PortfolioEnv(gym.Env):
     Reward: R-multiple with portfolio adjustments
     """
 
+    # Shared, read-only encoder (see GateEnv._ENCODER)
+    _ENCODER: ClassVar[PortfolioStateEncoder] = PortfolioStateEncoder()
+
     def __init__(self, episodes: Optional[list] = None):
         """Initialize portfolio environment.
 
@@ -34,7 +47,7 @@ class PortfolioEnv(gym.Env):
         """
         super().__init__()
 
-        self.encoder = PortfolioStateEncoder()
+        self.encoder = self._ENCODER
 
         # Action space: Continuous[0, 1] for position size fraction
         self.action_space = spaces.Box(low=0.0, high=1.0, shape=(1,), dtype=np.float32)
@@ -48,6 +61,10 @@ class PortfolioEnv(gym.Env):
         self.episodes = episodes or []
         self.current_episode_idx = 0
         self.current_episode: Optional[Dict[str, Any]] = None
+        self._last_obs: Optional[np.ndarray] = None
+        # Index loaded by reset(); replay subclasses advance current_episode_idx
+        self._active_idx = 0
+        self._cache_episodes()
 
     @property
     def state_dim(self) -> int:
@@ -62,6 +79,46 @@ class PortfolioEnv(gym.Env):
         """
         self.episodes = episodes
         self.current_episode_idx = 0
+        self._cache_episodes()
+
+    def _cache_episodes(self) -> None:
+        """Pre-encode all episodes into an (N, state_dim) observation matrix.
+
+        Episodes are immutable during offline replay, so encoding happens once
+        here and reset() only slices a row. Episode fields are split into
+        parallel lists with their defaults filled in.
+        """
+        self._candidates = [ep["candidate"] for ep in self.episodes]
+        self._llm_responses = [ep.get("llm_response", {}) for ep in self.episodes]
+        self._outcomes = [ep["outcome"] for ep in self.episodes]
+        self._portfolio_states = [ep.get("portfolio_state", {}) for ep in self.episodes]
+
+        self._obs_cache = np.empty((len(self.episodes), self.state_dim), dtype=np.float32)
+        for i, (candidate, llm_response, portfolio_state) in enumerate(
+            zip(self._candidates, self._llm_responses, self._portfolio_states, strict=True)
+        ):
+            self.encoder.encode(candidate, llm_response, portfolio_state, out=self._obs_cache[i])
+
+        # reset() hands out rows of the cache without copying; read-only so a
+        # caller mutating an observation cannot corrupt later episodes
+        self._obs_cache.setflags(write=False)
+
+        self._candidate_ids = [c.candidate_id for c in self._candidates]
+        self._run_ids = [c.run_id for c in self._candidates]
+        self._actual_r = [o.actual_r_multiple for o in self._outcomes]
+
+        # Position-size independent reward terms, so step() only evaluates the
+        # piecewise-linear closed form in position_size_fraction
+        self._caused_drawdown = [portfolio_caused_drawdown(ps) for ps in self._portfolio_states]
+        self._has_capacity = [portfolio_has_capacity(ps) for ps in self._portfolio_states]
+
+        # Same terms as arrays for batch_rewards()
+        self._has_outcome_arr = np.array([r is not None for r in self._actual_r], dtype=bool)
+        self._actual_r_arr = np.array(
+            [0.0 if r is None else r for r in self._actual_r], dtype=np.float64
+        )
+        self._caused_drawdown_arr = np.array(self._caused_drawdown, dtype=bool)
+        self._has_capacity_arr = np.array(self._has_capacity, dtype=bool)
 
     def get_episode_count(self) -> int:
         """Get number of episodes.
@@ -88,21 +145,28 @@ class PortfolioEnv(gym.Env):
         if not self.episodes:
             raise ValueError("No episodes available. Call set_episodes() first.")
 
-        # Get current episode
-        self.current_episode = self.episodes[self.current_episode_idx]
+        return self._load_episode(self.current_episode_idx)
 
-        # Extract components
-        candidate = self.current_episode["candidate"]
-        llm_response = self.current_episode.get("llm_response", {})
-        portfolio_state = self.current_episode.get("portfolio_state", {})
+    def _load_episode(self, idx: int) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Load an episode as the current one.
 
-        # Encode state
-        obs = self.encoder.encode(candidate, llm_response, portfolio_state)
+        Args:
+            idx: Index into self.episodes
+
+        Returns:
+            Tuple of (pre-encoded observation, info)
+        """
+        self._active_idx = idx
+        self.current_episode = self.episodes[idx]
+
+        # Observation was encoded once at set_episodes time
+        obs = self._obs_cache[idx]
+        self._last_obs = obs
 
         info = {
-            "candidate_id": candidate.candidate_id,
-            "run_id": candidate.run_id,
-            "episode_idx": self.current_episode_idx,
+            "candidate_id": self._candidate_ids[idx],
+            "run_id": self._run_ids[idx],
+            "episode_idx": idx,
         }
 
         return obs, info
@@ -121,70 +185,106 @@ class PortfolioEnv(gym.Env):
         if self.current_episode is None:
             raise ValueError("Must call reset() before step()")
 
-        # Extract action (clip to valid range)
-        position_size_fraction = float(np.clip(action[0], 0.0, 1.0))
-
-        # Get outcome
-        outcome = self.current_episode["outcome"]
-        portfolio_state = self.current_episode.get("portfolio_state", {})
+        # Extract action (clip to valid range); scalar compare avoids a 0-d ndarray
+        a = float(action[0])
+        position_size_fraction = 0.0 if a < 0.0 else (1.0 if a > 1.0 else a)
 
         # Compute reward
-        reward = self._compute_reward(position_size_fraction, outcome, portfolio_state)
+        idx = self._active_idx
+        reward = self._compute_reward(idx, position_size_fraction)
 
         # Episode terminates after one decision
         terminated = True
         truncated = False
 
         # Return same observation (episode ends)
-        candidate = self.current_episode["candidate"]
-        llm_response = self.current_episode.get("llm_response", {})
-        obs = self.encoder.encode(candidate, llm_response, portfolio_state)
+        obs = self._last_obs
 
         info = {
-            "candidate_id": candidate.candidate_id,
+            "candidate_id": self._candidate_ids[idx],
             "position_size_fraction": position_size_fraction,
-            "actual_r_multiple": outcome.actual_r_multiple,
+            "actual_r_multiple": self._actual_r[idx],
             "reward": reward,
         }
 
         return obs, reward, terminated, truncated, info
 
-    def _compute_reward(
-        self,
-        position_size_fraction: float,
-        outcome: Any,
-        portfolio_state: Dict[str, Any],
-    ) -> float:
+    def _compute_reward(self, episode_idx: int, position_size_fraction: float) -> float:
         """Compute reward for position sizing decision.
 
+        Closed form of compute_portfolio_reward(), built from the same
+        reward_shaping constants, with the per-episode terms precomputed by
+        _cache_episodes().
+
         Args:
+            episode_idx: Index of the episode the decision was made on
             position_size_fraction: Position size chosen [0, 1]
-            outcome: Outcome label with actual R-multiple
-            portfolio_state: Current portfolio state
 
         Returns:
             Reward value
         """
-        # Get actual R-multiple
-        actual_r_multiple = outcome.actual_r_multiple
+        actual_r_multiple = self._actual_r[episode_idx]
         if actual_r_multiple is None:
             # No outcome yet, return 0
             return 0.0
 
-        # Check for drawdown
-        dd_24h_bps = portfolio_state.get("dd_24h_bps", 0.0)
-        caused_drawdown = dd_24h_bps < -500  # 5% drawdown threshold
+        # Base reward: R-multiple scaled by position size
+        reward = actual_r_multiple * position_size_fraction
 
-        # Compute portfolio reward
-        reward = compute_portfolio_reward(
-            actual_r_multiple=actual_r_multiple,
-            position_size_fraction=position_size_fraction,
-            portfolio_state=portfolio_state,
-            caused_drawdown=caused_drawdown,
-        )
+        # Drawdown penalty
+        if self._caused_drawdown[episode_idx]:
+            reward -= PORTFOLIO_DRAWDOWN_PENALTY
+
+        # Diversification bonus for moderate sizing
+        low, high = PORTFOLIO_DIVERSIFICATION_RANGE
+        if low <= position_size_fraction <= high:
+            reward += PORTFOLIO_DIVERSIFICATION_BONUS
+
+        # Capacity utilization bonus / oversizing penalty
+        if self._has_capacity[episode_idx]:
+            if position_size_fraction > PORTFOLIO_CAPACITY_MIN_SIZE:
+                reward += PORTFOLIO_CAPACITY_BONUS
+        elif position_size_fraction > PORTFOLIO_OVERSIZE_MIN_SIZE:
+            reward -= PORTFOLIO_OVERSIZE_PENALTY
 
         return reward
 
+    def batch_rewards(
+        self,
+        actions: np.ndarray,
+        episode_indices: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Compute rewards for many position sizing decisions at once.
+
+        Vectorized form of _compute_reward() for offline evaluation and
+        vectorized rollouts, using the same reward_shaping constants.
+
+        Args:
+            actions: Position size fractions, shape (B,) or (B, 1)
+            episode_indices: Episode index for each action (default: 0..B-1)
+
+        Returns:
+            Rewards, shape (B,)
+        """
+        fractions = np.clip(np.asarray(actions, dtype=np.float64).reshape(-1), 0.0, 1.0)
+        if episode_indices is None:
+            episode_indices = np.arange(len(fractions))
+
+        actual_r = self._actual_r_arr[episode_indices]
+        has_capacity = self._has_capacity_arr[episode_indices]
+
+        low, high = PORTFOLIO_DIVERSIFICATION_RANGE
+        reward = actual_r * fractions
+        reward -= PORTFOLIO_DRAWDOWN_PENALTY * self._caused_drawdown_arr[episode_indices]
+        reward += PORTFOLIO_DIVERSIFICATION_BONUS * ((fractions >= low) & (fractions <= high))
+        reward += np.where(
+            has_capacity,
+            PORTFOLIO_CAPACITY_BONUS * (fractions > PORTFOLIO_CAPACITY_MIN_SIZE),
+            -PORTFOLIO_OVERSIZE_PENALTY * (fractions > PORTFOLIO_OVERSIZE_MIN_SIZE),
+        )
+
+        return np.where(self._has_outcome_arr[episode_indices], reward, 0.0)
+
 
 class ReplayPortfolioEnv(PortfolioEnv):
     """Portfolio environment that cycles through episodes for offline training."""
@@ -194,18 +294,21 @@ class ReplayPortfolioEnv(PortfolioEnv):
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Reset and cycle to next episode.
 
+        Replay is deterministic, so gym.Env.reset() (which only reseeds
+        np_random) is skipped.
+
         Args:
-            seed: Random seed
+            seed: Random seed (ignored for replay)
             options: Optional reset options
 
         Returns:
             Tuple of (observation, info)
         """
-        # Reset with current episode
-        obs, info = super().reset(seed=seed, options=options)
+        if not self.episodes:
+            raise ValueError("No episodes available. Call set_episodes() first.")
 
-        # Cycle to next episode for next reset
-        if self.episodes:
-            self.current_episode_idx = (self.current_episode_idx + 1) % len(self.episodes)
+        # Load current episode, then cycle to next episode for next reset
+        obs, info = self._load_episode(self.current_episode_idx)
+        self.current_episode_idx = (self.current_episode_idx + 1) % len(self.episodes)
 
         return obs, info
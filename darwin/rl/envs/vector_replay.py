@@ -0,0 +1,159 @@
+"""Vectorized replay environments for offline training.
+
+Every replay episode is a single decision, so a batch of ``num_envs``
+episodes can be served straight from the pre-encoded observation matrix and
+reward tables built by the single-episode environments: ``reset`` and
+``step`` are array gathers instead of ``num_envs`` Python calls.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from gymnasium.vector import VectorEnv
+from gymnasium.vector.utils import batch_space
+
+from darwin.rl.envs.gate_env import GateEnv
+from darwin.rl.envs.meta_learner_env import MetaLearnerEnv
+from darwin.rl.envs.portfolio_env import PortfolioEnv
+
+try:
+    from gymnasium.vector import AutoresetMode
+
+    _SAME_STEP_AUTORESET: Any = AutoresetMode.SAME_STEP
+except ImportError:  # gymnasium < 1.1
+    _SAME_STEP_AUTORESET = "SameStep"
+
+logger = logging.getLogger(__name__)
+
+
+class _VectorReplayEnv(VectorEnv):
+    """Base class cycling through episodes ``num_envs`` at a time.
+
+    Episodes always terminate after one step and are auto-reset in the same
+    step: the observations returned by ``step`` belong to the next batch.
+    """
+
+    metadata = {"autoreset_mode": _SAME_STEP_AUTORESET}
+    env_cls: type = GateEnv
+
+    def __init__(self, episodes: list, num_envs: int, **kwargs):
+        """Initialize vectorized replay environment.
+
+        Args:
+            episodes: List of episode dictionaries
+            num_envs: Number of episodes served per batch
+            **kwargs: Additional arguments passed to the single-episode env
+        """
+        if not episodes:
+            raise ValueError("No episodes loaded")
+        if num_envs < 1:
+            raise ValueError(f"num_envs must be >= 1, got {num_envs}")
+
+        # Single-episode env owns the observation cache and reward tables
+        self.env = self.env_cls(episodes=episodes, **kwargs)
+
+        self.num_envs = num_envs
+        self.single_observation_space = self.env.observation_space
+        self.single_action_space = self.env.action_space
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        self._offsets = np.arange(num_envs)
+        self._cursor = 0
+        self._indices = self._offsets % len(episodes)
+
+    def _advance(self) -> np.ndarray:
+        """Move to the next batch of episode indices.
+
+        Returns:
+            Episode indices for the new batch
+        """
+        num_episodes = self.env.get_episode_count()
+        self._indices = (self._offsets + self._cursor) % num_episodes
+        self._cursor = (self._cursor + self.num_envs) % num_episodes
+        return self._indices
+
+    def _batch_rewards(self, indices: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        """Look up rewards for a batch of discrete actions.
+
+        Args:
+            indices: Episode index per sub-environment
+            actions: Action per sub-environment
+
+        Returns:
+            Rewards, shape (num_envs,)
+        """
+        return self.env._reward_table[indices, np.asarray(actions).reshape(-1)]
+
+    def reset(
+        self,
+        *,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Reset to the first batch of episodes.
+
+        Args:
+            seed: Random seed (ignored for replay)
+            options: Additional options
+
+        Returns:
+            Tuple of (observations, info)
+        """
+        super().reset(seed=seed)
+        self._cursor = 0
+        indices = self._advance()
+        return self.env._obs_cache[indices], {"episode_idx": indices}
+
+    def step(
+        self, actions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Score one action per sub-environment and move to the next batch.
+
+        Args:
+            actions: Batch of actions
+
+        Returns:
+            Tuple of (observations, rewards, terminations, truncations, info)
+        """
+        indices = self._indices
+        rewards = self._batch_rewards(indices, actions)
+
+        # Every replay episode is a single decision
+        terminations = np.ones(self.num_envs, dtype=bool)
+        truncations = np.zeros(self.num_envs, dtype=bool)
+        info = {"episode_idx": indices}
+
+        next_indices = self._advance()
+        return self.env._obs_cache[next_indices], rewards, terminations, truncations, info
+
+
+class VectorReplayGateEnv(_VectorReplayEnv):
+    """Vectorized replay of gate agent episodes."""
+
+    env_cls = GateEnv
+
+
+class VectorReplayMetaLearnerEnv(_VectorReplayEnv):
+    """Vectorized replay of meta-learner agent episodes."""
+
+    env_cls = MetaLearnerEnv
+
+
+class VectorReplayPortfolioEnv(_VectorReplayEnv):
+    """Vectorized replay of portfolio agent episodes."""
+
+    env_cls = PortfolioEnv
+
+    def _batch_rewards(self, indices: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        """Compute rewards for a batch of position sizes.
+
+        Args:
+            indices: Episode index per sub-environment
+            actions: Position size fraction per sub-environment
+
+        Returns:
+            Rewards, shape (num_envs,)
+        """
+        return self.env.batch_rewards(actions, indices)
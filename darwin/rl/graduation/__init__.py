@@ -1,13 +1,37 @@
-"""RL agent graduation system."""
+"""RL agent graduation system.
 
-from darwin.rl.graduation.baselines import (
-    EqualWeightBaseline,
-    LLMOnlyBaseline,
-    PassAllBaseline,
-    get_baseline_strategy,
-)
-from darwin.rl.graduation.metrics import AgentPerformanceMetrics
-from darwin.rl.graduation.policy import GraduationDecision, GraduationPolicy
+Public names are imported lazily (PEP 562) so that e.g. the graduation CLI
+only loads the modules it actually uses.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from darwin.rl.graduation.baselines import (
+        BaselineEpisode,
+        EqualWeightBaseline,
+        LLMOnlyBaseline,
+        PassAllBaseline,
+        get_baseline_strategy,
+        make_equal_weight,
+        to_baseline_episodes,
+    )
+    from darwin.rl.graduation.metrics import AgentPerformanceMetrics
+    from darwin.rl.graduation.policy import GraduationDecision, GraduationPolicy
+
+_LAZY_IMPORTS = {
+    "AgentPerformanceMetrics": "darwin.rl.graduation.metrics",
+    "GraduationPolicy": "darwin.rl.graduation.policy",
+    "GraduationDecision": "darwin.rl.graduation.policy",
+    "PassAllBaseline": "darwin.rl.graduation.baselines",
+    "EqualWeightBaseline": "darwin.rl.graduation.baselines",
+    "LLMOnlyBaseline": "darwin.rl.graduation.baselines",
+    "get_baseline_strategy": "darwin.rl.graduation.baselines",
+    "make_equal_weight": "darwin.rl.graduation.baselines",
+    "BaselineEpisode": "darwin.rl.graduation.baselines",
+    "to_baseline_episodes": "darwin.rl.graduation.baselines",
+}
 
 __all__ = [
     "AgentPerformanceMetrics",
@@ -17,4 +41,22 @@ __all__ = [
     "EqualWeightBaseline",
     "LLMOnlyBaseline",
     "get_baseline_strategy",
+    "make_equal_weight",
+    "BaselineEpisode",
+    "to_baseline_episodes",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported graduation names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily exported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,102 @@
 """Baseline strategies for agent performance comparison."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 import numpy as np
 
+from darwin.rl.utils.stats import fused_stats
 from darwin.schemas.candidate import CandidateRecordV1
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class BaselineEpisode:
+    """The fields of a replay episode that baselines read.
+
+    Built once per episode with from_episode(), so that several baselines
+    evaluated over the same episodes read plain attributes instead of
+    repeating the nested dict lookups.
+    """
+
+    r_multiple: Optional[float]
+    llm_decision: str
+
+    @classmethod
+    def from_episode(cls, episode: Dict[str, Any]) -> "BaselineEpisode":
+        """Extract baseline fields from an episode dictionary.
+
+        Args:
+            episode: Episode with optional "outcome" and "llm_response"
+
+        Returns:
+            Baseline episode
+        """
+        outcome = episode.get("outcome")
+        return cls(
+            r_multiple=outcome.actual_r_multiple if outcome else None,
+            llm_decision=episode.get("llm_response", {}).get("decision", "skip"),
+        )
+
+
+EpisodeLike = Dict[str, Any] | BaselineEpisode
+
+
+def to_baseline_episodes(episodes: Sequence[Dict[str, Any]]) -> List[BaselineEpisode]:
+    """Convert episode dictionaries for repeated baseline evaluation.
+
+    Args:
+        episodes: Episode dictionaries
+
+    Returns:
+        List of baseline episodes
+    """
+    return [BaselineEpisode.from_episode(ep) for ep in episodes]
+
+
+def _episode_r_multiples(
+    episodes: Sequence[EpisodeLike], llm_take_only: bool = False
+) -> np.ndarray:
+    """Collect known R-multiples from a non-empty list of episodes.
+
+    Episodes are either all dictionaries or all BaselineEpisode; the first
+    one decides which field access is used.
+
+    Args:
+        episodes: Episodes with outcomes
+        llm_take_only: Only keep episodes where the LLM decided "take"
+
+    Returns:
+        Float64 array of R-multiples
+    """
+    if isinstance(episodes[0], BaselineEpisode):
+        if llm_take_only:
+            values = (
+                ep.r_multiple
+                for ep in episodes
+                if ep.r_multiple is not None and ep.llm_decision == "take"
+            )
+        else:
+            values = (ep.r_multiple for ep in episodes if ep.r_multiple is not None)
+    elif llm_take_only:
+        values = (
+            ep["outcome"].actual_r_multiple
+            for ep in episodes
+            if ep.get("outcome")
+            and ep["outcome"].actual_r_multiple is not None
+            and ep.get("llm_response", {}).get("decision", "skip") == "take"
+        )
+    else:
+        values = (
+            outcome.actual_r_multiple
+            for outcome in (ep.get("outcome") for ep in episodes)
+            if outcome and outcome.actual_r_multiple is not None
+        )
+    return np.fromiter(values, dtype=np.float64)
+
+
 class BaselineStrategy:
     """Base class for baseline strategies."""
 
@@ -21,13 +108,12 @@ class BaselineStrategy:
         """
         self.name = name
 
-    def compute_baseline_performance(
-        self, episodes: List[Dict[str, Any]]
-    ) -> Dict[str, float]:
+    def compute_baseline_performance(self, episodes: Sequence[EpisodeLike]) -> Dict[str, float]:
         """Compute baseline performance on episodes.
 
         Args:
-            episodes: List of episodes with candidates and outcomes
+            episodes: Episodes with candidates and outcomes, as dictionaries
+                or as BaselineEpisode (see to_baseline_episodes())
 
         Returns:
             Dictionary with performance metrics
@@ -42,13 +128,11 @@ class PassAllBaseline(BaselineStrategy):
         """Initialize pass-all baseline."""
         super().__init__("pass_all")
 
-    def compute_baseline_performance(
-        self, episodes: List[Dict[str, Any]]
-    ) -> Dict[str, float]:
+    def compute_baseline_performance(self, episodes: Sequence[EpisodeLike]) -> Dict[str, float]:
         """Compute performance if we pass all candidates.
 
         Args:
-            episodes: List of episodes with outcomes
+            episodes: Episodes with outcomes (dicts or BaselineEpisode)
 
         Returns:
             Baseline metrics (no filtering, all decisions are "pass")
@@ -63,13 +147,9 @@ class PassAllBaseline(BaselineStrategy):
             }
 
         # Baseline passes everything, so we get all outcomes
-        r_multiples = []
-        for ep in episodes:
-            outcome = ep.get("outcome")
-            if outcome and outcome.actual_r_multiple is not None:
-                r_multiples.append(outcome.actual_r_multiple)
+        r_multiples = _episode_r_multiples(episodes)
 
-        if not r_multiples:
+        if not r_multiples.size:
             return {
                 "mean_r_multiple": 0.0,
                 "sharpe_ratio": 0.0,
@@ -78,16 +158,15 @@ class PassAllBaseline(BaselineStrategy):
                 "cost_per_trade": 1.0,
             }
 
-        mean_r = float(np.mean(r_multiples))
-        std_r = float(np.std(r_multiples))
+        mean_r, std_r, winners, total_trades = fused_stats(r_multiples)
         sharpe = mean_r / std_r if std_r > 0 else 0.0
-        win_rate = float(np.mean([r > 0 for r in r_multiples]))
+        win_rate = winners / total_trades
 
         return {
             "mean_r_multiple": mean_r,
             "sharpe_ratio": sharpe,
             "win_rate": win_rate,
-            "total_trades": len(r_multiples),
+            "total_trades": total_trades,
             "cost_per_trade": 1.0,  # All candidates call LLM
         }
 
@@ -104,13 +183,11 @@ class EqualWeightBaseline(BaselineStrategy):
         super().__init__("equal_weight")
         self.equal_weight = equal_weight
 
-    def compute_baseline_performance(
-        self, episodes: List[Dict[str, Any]]
-    ) -> Dict[str, float]:
+    def compute_baseline_performance(self, episodes: Sequence[EpisodeLike]) -> Dict[str, float]:
         """Compute performance with equal-weight position sizing.
 
         Args:
-            episodes: List of episodes with outcomes
+            episodes: Episodes with outcomes (dicts or BaselineEpisode)
 
         Returns:
             Baseline metrics (fixed position sizing)
@@ -123,16 +200,10 @@ class EqualWeightBaseline(BaselineStrategy):
                 "total_trades": 0,
             }
 
-        # Baseline uses equal weight for all trades
-        r_multiples = []
-        for ep in episodes:
-            outcome = ep.get("outcome")
-            if outcome and outcome.actual_r_multiple is not None:
-                # Scale by equal weight
-                scaled_r = outcome.actual_r_multiple * self.equal_weight
-                r_multiples.append(scaled_r)
+        # Baseline uses equal weight for all trades (scaled by equal weight)
+        r_multiples = _episode_r_multiples(episodes) * self.equal_weight
 
-        if not r_multiples:
+        if not r_multiples.size:
             return {
                 "mean_r_multiple": 0.0,
                 "sharpe_ratio": 0.0,
@@ -140,16 +211,15 @@ class EqualWeightBaseline(BaselineStrategy):
                 "total_trades": 0,
             }
 
-        mean_r = float(np.mean(r_multiples))
-        std_r = float(np.std(r_multiples))
+        mean_r, std_r, winners, total_trades = fused_stats(r_multiples)
         sharpe = mean_r / std_r if std_r > 0 else 0.0
-        win_rate = float(np.mean([r > 0 for r in r_multiples]))
+        win_rate = winners / total_trades
 
         return {
             "mean_r_multiple": mean_r,
             "sharpe_ratio": sharpe,
             "win_rate": win_rate,
-            "total_trades": len(r_multiples),
+            "total_trades": total_trades,
         }
 
 
@@ -160,13 +230,12 @@ class LLMOnlyBaseline(BaselineStrategy):
         """Initialize LLM-only baseline."""
         super().__init__("llm_only")
 
-    def compute_baseline_performance(
-        self, episodes: List[Dict[str, Any]]
-    ) -> Dict[str, float]:
+    def compute_baseline_performance(self, episodes: Sequence[EpisodeLike]) -> Dict[str, float]:
         """Compute performance if we always follow LLM.
 
         Args:
-            episodes: List of episodes with LLM decisions and outcomes
+            episodes: Episodes with LLM decisions and outcomes (dicts or
+                BaselineEpisode)
 
         Returns:
             Baseline metrics (no meta-learner override)
@@ -180,19 +249,10 @@ class LLMOnlyBaseline(BaselineStrategy):
                 "agreement_rate": 1.0,  # 100% agreement (no overrides)
             }
 
-        # Baseline follows LLM exactly
-        r_multiples = []
-        for ep in episodes:
-            outcome = ep.get("outcome")
-            llm_response = ep.get("llm_response", {})
-            llm_decision = llm_response.get("decision", "skip")
-
-            if outcome and outcome.actual_r_multiple is not None:
-                # Only count if LLM said "take"
-                if llm_decision == "take":
-                    r_multiples.append(outcome.actual_r_multiple)
+        # Baseline follows LLM exactly, so only count trades where LLM said "take"
+        r_multiples = _episode_r_multiples(episodes, llm_take_only=True)
 
-        if not r_multiples:
+        if not r_multiples.size:
             return {
                 "mean_r_multiple": 0.0,
                 "sharpe_ratio": 0.0,
@@ -201,23 +261,46 @@ class LLMOnlyBaseline(BaselineStrategy):
                 "agreement_rate": 1.0,
             }
 
-        mean_r = float(np.mean(r_multiples))
-        std_r = float(np.std(r_multiples))
+        mean_r, std_r, winners, total_trades = fused_stats(r_multiples)
         sharpe = mean_r / std_r if std_r > 0 else 0.0
-        win_rate = float(np.mean([r > 0 for r in r_multiples]))
+        win_rate = winners / total_trades
 
         return {
             "mean_r_multiple": mean_r,
             "sharpe_ratio": sharpe,
             "win_rate": win_rate,
-            "total_trades": len(r_multiples),
+            "total_trades": total_trades,
             "agreement_rate": 1.0,  # No overrides
         }
 
 
+# Baseline type -> strategy class, built once at import
+_STRATEGY_REGISTRY: Dict[str, Type[BaselineStrategy]] = {
+    "pass_all": PassAllBaseline,
+    "equal_weight": EqualWeightBaseline,
+    "llm_only": LLMOnlyBaseline,
+}
+
+
+def make_equal_weight(equal_weight: float) -> EqualWeightBaseline:
+    """Create an equal-weight baseline with a non-default position size.
+
+    Args:
+        equal_weight: Fixed position size fraction
+
+    Returns:
+        Equal-weight baseline instance
+    """
+    return EqualWeightBaseline(equal_weight=equal_weight)
+
+
 def get_baseline_strategy(baseline_type: str) -> BaselineStrategy:
     """Get baseline strategy by type.
 
+    Returns a new instance on every call, so callers may reconfigure it;
+    use make_equal_weight() for an equal-weight baseline with a custom
+    position size.
+
     Args:
         baseline_type: Baseline type ("pass_all", "equal_weight", "llm_only")
 
@@ -227,16 +310,11 @@ def get_baseline_strategy(baseline_type: str) -> BaselineStrategy:
     Raises:
         ValueError: If baseline type is unknown
     """
-    strategies = {
-        "pass_all": PassAllBaseline(),
-        "equal_weight": EqualWeightBaseline(),
-        "llm_only": LLMOnlyBaseline(),
-    }
-
-    if baseline_type not in strategies:
+    try:
+        strategy_cls = _STRATEGY_REGISTRY[baseline_type]
+    except KeyError:
         raise ValueError(
             f"Unknown baseline type: {baseline_type}. "
-            f"Valid types: {list(strategies.keys())}"
-        )
-
-    return strategies[baseline_type]
+            f"Valid types: {list(_STRATEGY_REGISTRY.keys())}"
+        ) from None
+    return strategy_cls()
@@ -5,15 +5,53 @@ ready to transition from observe mode to active mode.
 """
 
 import logging
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from darwin.rl.schemas.rl_config import AgentConfigV1, GraduationThresholdsV1
 from darwin.rl.storage.agent_state import AgentStateSQLite
+from darwin.rl.utils.stats import fused_stats
 
 logger = logging.getLogger(__name__)
 
+# Check ID -> (label, actual value format, required value format), used by
+# format_check() to render (check_id, actual, required) records as report lines
+_CHECK_FORMATS = {
+    "candidates_seen": ("Candidates seen", "{}", "{}"),
+    "training_samples": ("Training samples", "{}", "{}"),
+    "validation_samples": ("Validation samples", "{}", "{}"),
+    "validation_metric": ("Validation metric", "{:.3f}", "{:.3f}"),
+    "win_rate": ("Win rate", "{:.1%}", "{:.1%}"),
+    "sharpe_ratio": ("Sharpe ratio", "{:.2f}", "{:.2f}"),
+    "improvement_pct": ("Improvement", "{:.1f}%", "{:.1f}%"),
+    "stability": ("Stability", "{0[0]}/{0[1]} windows passed", "{0[0]}/{0[1]}"),
+}
+
+
+def _safe_improvement(metric: float, baseline: float) -> float:
+    """Percent improvement of a metric over the baseline, 0.0 for a zero baseline."""
+    return (metric - baseline) / baseline * 100.0 if baseline != 0 else 0.0
+
+
+def format_check(check: Tuple[str, Any, Any], passed: bool) -> str:
+    """Render a recorded graduation check as a report line.
+
+    Args:
+        check: (check_id, actual, required) record from evaluate_graduation()
+        passed: Whether the check passed
+
+    Returns:
+        Line such as "✓ Training samples: 1200 >= 1000"
+    """
+    check_id, actual, required = check
+    label, actual_fmt, required_fmt = _CHECK_FORMATS[check_id]
+    mark, op = ("✓", ">=") if passed else ("✗", "<")
+    line = f"{mark} {label}: {actual_fmt.format(actual)} {op} " + required_fmt.format(required)
+    if not passed and check_id == "candidates_seen":
+        line += f" (need {required - actual} more)"
+    return line
+
 
 class GraduationEvaluator:
     """Evaluate agent graduation readiness.
@@ -39,17 +77,24 @@ class GraduationEvaluator:
         self,
         agent_config: AgentConfigV1,
         baseline_metric: float,
-    ) -> Tuple[bool, Dict[str, any]]:
+        early_exit: bool = False,
+    ) -> Tuple[bool, Dict[str, Any]]:
         """Evaluate if agent is ready to graduate.
 
         Args:
             agent_config: Agent configuration with graduation thresholds
             baseline_metric: Baseline performance metric to beat
+            early_exit: Stop at the first failed hard gate (candidates seen,
+                training or validation samples) instead of building the full
+                report; later checks are then absent from details
 
         Returns:
             Tuple of (is_ready, details_dict)
             - is_ready: True if agent meets ALL graduation criteria
-            - details_dict: Detailed breakdown of each check
+            - details_dict: Detailed breakdown of each check; checks_passed and
+              checks_failed hold report lines, checks_passed_records and
+              checks_failed_records the matching (check_id, actual, required)
+              records
         """
         agent_name = agent_config.name
         thresholds = agent_config.graduation_thresholds
@@ -60,6 +105,8 @@ class GraduationEvaluator:
             "agent_name": agent_name,
             "checks_passed": [],
             "checks_failed": [],
+            "checks_passed_records": [],
+            "checks_failed_records": [],
             "metrics": {},
         }
 
@@ -67,327 +114,421 @@ class GraduationEvaluator:
         total_decisions = self.agent_state_db.get_decision_count(agent_name)
         details["metrics"]["total_candidates_seen"] = total_decisions
 
-        if total_decisions >= thresholds.min_candidates_seen:
-            details["checks_passed"].append(
-                f"✓ Candidates seen: {total_decisions} >= {thresholds.min_candidates_seen}"
-            )
-        else:
-            details["checks_failed"].append(
-                f"✗ Candidates seen: {total_decisions} < {thresholds.min_candidates_seen} "
-                f"(need {thresholds.min_candidates_seen - total_decisions} more)"
-            )
+        passed = self._record_check(
+            details, "candidates_seen", total_decisions, thresholds.min_candidates_seen
+        )
+        if not passed and early_exit:
+            return self._exit_early(agent_name, details)
+
+        # Actions and R-multiples of decisions with outcomes, fetched once
+        # and shared by every check below
+        actions, r_multiples = self.agent_state_db.fetch_action_r(agent_name)
+        # Winner mask shared by the win-rate, pass-rate and override metrics
+        # (NaN > 0 is False, so missing outcomes count as non-winners)
+        wins = r_multiples > 0
 
         # Check 2: Minimum training samples
-        training_samples = self._count_training_samples(agent_name)
+        training_samples = self._count_training_samples(actions)
         details["metrics"]["training_samples"] = training_samples
 
-        if training_samples >= thresholds.min_training_samples:
-            details["checks_passed"].append(
-                f"✓ Training samples: {training_samples} >= {thresholds.min_training_samples}"
-            )
-        else:
-            details["checks_failed"].append(
-                f"✗ Training samples: {training_samples} < {thresholds.min_training_samples}"
-            )
+        passed = self._record_check(
+            details, "training_samples", training_samples, thresholds.min_training_samples
+        )
+        if not passed and early_exit:
+            return self._exit_early(agent_name, details)
 
         # Check 3: Minimum validation samples
-        validation_samples = self._count_validation_samples(agent_name)
+        validation_samples = self._count_validation_samples(actions)
         details["metrics"]["validation_samples"] = validation_samples
 
-        if validation_samples >= thresholds.min_validation_samples:
-            details["checks_passed"].append(
-                f"✓ Validation samples: {validation_samples} >= {thresholds.min_validation_samples}"
-            )
-        else:
-            details["checks_failed"].append(
-                f"✗ Validation samples: {validation_samples} < {thresholds.min_validation_samples}"
-            )
+        passed = self._record_check(
+            details,
+            "validation_samples",
+            validation_samples,
+            thresholds.min_validation_samples,
+        )
+        if not passed and early_exit:
+            return self._exit_early(agent_name, details)
 
-        # Check 4: Validation metric (agent-specific)
-        validation_metric = self._calculate_validation_metric(agent_name, agent_config)
+        # Check 4: Validation metric (agent-specific), computed in the same
+        # pass over the validation windows as the stability check (check 8)
+        stability_passed, window_results, validation_metric = self._check_stability(
+            agent_name, agent_config, baseline_metric, actions, r_multiples, wins
+        )
         details["metrics"]["validation_metric"] = validation_metric
 
-        if validation_metric >= thresholds.min_validation_metric:
-            details["checks_passed"].append(
-                f"✓ Validation metric: {validation_metric:.3f} >= {thresholds.min_validation_metric:.3f}"
-            )
-        else:
-            details["checks_failed"].append(
-                f"✗ Validation metric: {validation_metric:.3f} < {thresholds.min_validation_metric:.3f}"
-            )
+        self._record_check(
+            details, "validation_metric", validation_metric, thresholds.min_validation_metric
+        )
 
         # Check 5: Win rate (if specified)
         if thresholds.min_win_rate is not None:
-            win_rate = self._calculate_win_rate(agent_name)
+            win_rate = self._calculate_win_rate(wins)
             details["metrics"]["win_rate"] = win_rate
 
-            if win_rate >= thresholds.min_win_rate:
-                details["checks_passed"].append(
-                    f"✓ Win rate: {win_rate:.1%} >= {thresholds.min_win_rate:.1%}"
-                )
-            else:
-                details["checks_failed"].append(
-                    f"✗ Win rate: {win_rate:.1%} < {thresholds.min_win_rate:.1%}"
-                )
+            self._record_check(details, "win_rate", win_rate, thresholds.min_win_rate)
 
         # Check 6: Sharpe ratio (if specified)
         if thresholds.min_sharpe_ratio is not None:
-            sharpe = self._calculate_sharpe(agent_name)
+            sharpe = self._calculate_sharpe(r_multiples)
             details["metrics"]["sharpe_ratio"] = sharpe
 
-            if sharpe >= thresholds.min_sharpe_ratio:
-                details["checks_passed"].append(
-                    f"✓ Sharpe ratio: {sharpe:.2f} >= {thresholds.min_sharpe_ratio:.2f}"
-                )
-            else:
-                details["checks_failed"].append(
-                    f"✗ Sharpe ratio: {sharpe:.2f} < {thresholds.min_sharpe_ratio:.2f}"
-                )
+            self._record_check(details, "sharpe_ratio", sharpe, thresholds.min_sharpe_ratio)
 
         # Check 7: Baseline improvement
-        improvement_pct = ((validation_metric - baseline_metric) / baseline_metric * 100)
+        improvement_pct = _safe_improvement(validation_metric, baseline_metric)
         details["metrics"]["baseline_metric"] = baseline_metric
         details["metrics"]["improvement_pct"] = improvement_pct
 
-        if improvement_pct >= thresholds.min_improvement_pct:
-            details["checks_passed"].append(
-                f"✓ Improvement: {improvement_pct:.1f}% >= {thresholds.min_improvement_pct:.1f}%"
-            )
-        else:
-            details["checks_failed"].append(
-                f"✗ Improvement: {improvement_pct:.1f}% < {thresholds.min_improvement_pct:.1f}%"
-            )
+        self._record_check(
+            details, "improvement_pct", improvement_pct, thresholds.min_improvement_pct
+        )
 
         # Check 8: Stability (pass in multiple validation windows)
-        stability_passed, window_results = self._check_stability(
-            agent_name, agent_config, baseline_metric
-        )
         details["metrics"]["validation_windows"] = window_results
 
         passing_windows = sum(1 for w in window_results if w["passed"])
-        if stability_passed:
-            details["checks_passed"].append(
-                f"✓ Stability: {passing_windows}/{len(window_results)} windows passed "
-                f">= {thresholds.min_passing_windows}/{thresholds.num_validation_windows}"
-            )
-        else:
-            details["checks_failed"].append(
-                f"✗ Stability: {passing_windows}/{len(window_results)} windows passed "
-                f"< {thresholds.min_passing_windows}/{thresholds.num_validation_windows}"
-            )
+        self._record_check(
+            details,
+            "stability",
+            (passing_windows, len(window_results)),
+            (thresholds.min_passing_windows, thresholds.num_validation_windows),
+            passed=stability_passed,
+        )
 
         # Final decision
         is_ready = len(details["checks_failed"]) == 0
 
         if is_ready:
-            logger.info(f"✅ Agent '{agent_name}' is READY to graduate!")
-            logger.info(f"   All {len(details['checks_passed'])} checks passed")
+            logger.info("✅ Agent '%s' is READY to graduate!", agent_name)
+            logger.info("   All %d checks passed", len(details["checks_passed"]))
         else:
-            logger.info(f"❌ Agent '{agent_name}' is NOT ready to graduate")
-            logger.info(f"   {len(details['checks_failed'])} checks failed:")
+            logger.info("❌ Agent '%s' is NOT ready to graduate", agent_name)
+            logger.info("   %d checks failed:", len(details["checks_failed"]))
             for failure in details["checks_failed"]:
-                logger.info(f"      {failure}")
+                logger.info("      %s", failure)
 
         return is_ready, details
 
-    def _count_training_samples(self, agent_name: str) -> int:
-        """Count training samples (decisions with outcomes).
+    def _exit_early(self, agent_name: str, details: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """Stop evaluation after a failed hard gate.
 
         Args:
             agent_name: Agent name
+            details: Details collected so far
+
+        Returns:
+            Tuple of (False, details)
+        """
+        logger.info(
+            "❌ Agent '%s' is NOT ready to graduate (stopped early: %s)",
+            agent_name,
+            details["checks_failed"][-1],
+        )
+        return False, details
+
+    @staticmethod
+    def _record_check(
+        details: Dict[str, Any],
+        check_id: str,
+        actual: Any,
+        required: Any,
+        passed: Optional[bool] = None,
+    ) -> bool:
+        """Record a check result as a report line and a raw record.
+
+        Args:
+            details: Details dict being built by evaluate_graduation()
+            check_id: Key into _CHECK_FORMATS
+            actual: Measured value
+            required: Threshold value
+            passed: Explicit outcome; defaults to actual >= required
+
+        Returns:
+            Whether the check passed
+        """
+        if passed is None:
+            passed = actual >= required
+        record = (check_id, actual, required)
+        key = "checks_passed" if passed else "checks_failed"
+        details[key].append(format_check(record, passed))
+        details[f"{key}_records"].append(record)
+        return passed
+
+    def _count_training_samples(self, actions: np.ndarray) -> int:
+        """Count training samples (decisions with outcomes).
+
+        Args:
+            actions: Actions of decisions with outcomes
 
         Returns:
             Count of training samples
         """
         # Training samples = all decisions with outcomes
-        decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
-        return len(decisions)
+        return len(actions)
 
-    def _count_validation_samples(self, agent_name: str) -> int:
+    def _count_validation_samples(self, actions: np.ndarray) -> int:
         """Count validation samples (held-out data).
 
         For simplicity, use last 20% of data as validation set.
 
         Args:
-            agent_name: Agent name
+            actions: Actions of decisions with outcomes
 
         Returns:
             Count of validation samples
         """
-        decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
-        validation_size = int(len(decisions) * 0.2)
+        validation_size = int(len(actions) * 0.2)
         return validation_size
 
     def _calculate_validation_metric(
-        self, agent_name: str, agent_config: AgentConfigV1
+        self,
+        agent_name: str,
+        agent_config: AgentConfigV1,
+        actions: np.ndarray,
+        r_multiples: np.ndarray,
+        wins: np.ndarray,
     ) -> float:
         """Calculate agent-specific validation metric.
 
         Args:
             agent_name: Agent name
             agent_config: Agent configuration
+            actions: Decision actions
+            r_multiples: Decision R-multiples, NaN where missing
+            wins: Mask of decisions with a positive R-multiple
 
         Returns:
             Validation metric value
         """
-        decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
-
-        if len(decisions) < 10:
+        if len(actions) < 10:
             return 0.0
 
-        # Use last 20% as validation set
-        validation_start = int(len(decisions) * 0.8)
-        validation_decisions = decisions[validation_start:]
+        # Use last 20% as validation set (array views, no copies)
+        validation_start = int(len(actions) * 0.8)
+        val_actions = actions[validation_start:]
+        val_r = r_multiples[validation_start:]
+        val_wins = wins[validation_start:]
 
-        if len(validation_decisions) < 5:
+        if len(val_actions) < 5:
             return 0.0
 
         # Agent-specific metrics
         if agent_name == "gate":
             # Gate metric: Cost savings (% of candidates skipped that lost money)
             # Simplified: just use pass rate for now
-            return self._calculate_pass_rate(validation_decisions)
+            return self._calculate_pass_rate(val_actions, val_wins)
 
         elif agent_name == "portfolio":
             # Portfolio metric: Sharpe ratio improvement
-            return self._calculate_sharpe_from_decisions(validation_decisions)
+            return self._calculate_sharpe_from_decisions(val_r)
 
         elif agent_name == "meta_learner":
             # Meta-learner metric: Override accuracy (improved decisions)
-            return self._calculate_override_accuracy(validation_decisions)
+            return self._calculate_override_accuracy(val_actions, val_wins)
 
         return 0.0
 
-    def _calculate_pass_rate(self, decisions: list) -> float:
+    def _calculate_pass_rate(self, actions: np.ndarray, wins: np.ndarray) -> float:
         """Calculate pass rate for gate agent."""
-        if not decisions:
+        if len(actions) == 0:
             return 0.0
 
         # For gate agent: what fraction of passes were profitable?
-        passes = [d for d in decisions if d["action"] == 1]  # action=1 means PASS
+        passes = actions == 1  # action=1 means PASS
+        num_passes = int(np.count_nonzero(passes))
 
-        if not passes:
+        if num_passes == 0:
             return 0.0
 
-        winners = sum(1 for d in passes if d["r_multiple"] and d["r_multiple"] > 0)
-        return winners / len(passes)
+        winners = int(np.count_nonzero(wins & passes))
+        return winners / num_passes
 
-    def _calculate_sharpe_from_decisions(self, decisions: list) -> float:
-        """Calculate Sharpe ratio from decisions."""
-        if len(decisions) < 10:
+    def _calculate_sharpe_from_decisions(self, r_multiples: np.ndarray) -> float:
+        """Calculate Sharpe ratio from decision R-multiples."""
+        if len(r_multiples) < 10:
             return 0.0
 
-        r_multiples = [d["r_multiple"] for d in decisions if d["r_multiple"] is not None]
+        # One pass for mean and sample std, skipping missing outcomes
+        mean_r, std_r, _, count = fused_stats(r_multiples, ddof=1)
 
-        if len(r_multiples) < 10:
+        if count < 10:
             return 0.0
 
-        mean_r = np.mean(r_multiples)
-        std_r = np.std(r_multiples, ddof=1)
-
         if std_r < 1e-9:
             return 0.0
 
         return float(mean_r / std_r)
 
-    def _calculate_override_accuracy(self, decisions: list) -> float:
+    def _calculate_override_accuracy(self, actions: np.ndarray, wins: np.ndarray) -> float:
         """Calculate override accuracy for meta-learner."""
-        if not decisions:
+        if len(actions) == 0:
             return 0.0
 
         # For meta-learner: were overrides profitable?
-        overrides = [d for d in decisions if d["action"] in [1, 2]]  # Override actions
+        overrides = (actions == 1) | (actions == 2)  # Override actions
+        num_overrides = int(np.count_nonzero(overrides))
 
-        if not overrides:
+        if num_overrides == 0:
             return 0.5  # No overrides = neutral
 
-        winners = sum(1 for d in overrides if d["r_multiple"] and d["r_multiple"] > 0)
-        return winners / len(overrides)
+        winners = int(np.count_nonzero(wins & overrides))
+        return winners / num_overrides
 
-    def _calculate_win_rate(self, agent_name: str) -> float:
+    def _calculate_win_rate(self, wins: np.ndarray) -> float:
         """Calculate overall win rate."""
-        decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
-
-        if not decisions:
+        if len(wins) == 0:
             return 0.0
 
-        winners = sum(1 for d in decisions if d["r_multiple"] and d["r_multiple"] > 0)
-        return winners / len(decisions)
+        winners = int(np.count_nonzero(wins))
+        return winners / len(wins)
 
-    def _calculate_sharpe(self, agent_name: str) -> float:
+    def _calculate_sharpe(self, r_multiples: np.ndarray) -> float:
         """Calculate overall Sharpe ratio."""
-        decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
-        return self._calculate_sharpe_from_decisions(decisions)
+        return self._calculate_sharpe_from_decisions(r_multiples)
+
+    @staticmethod
+    def _windowed_rates(
+        selected: np.ndarray,
+        wins: np.ndarray,
+        starts: List[int],
+        num_windows: int,
+        empty_rate: float,
+    ) -> Tuple[List[float], float]:
+        """Win rate among selected decisions per window and overall.
+
+        Args:
+            selected: Mask of decisions the rate is computed over
+            wins: Mask of decisions with a positive R-multiple
+            starts: Segment start offsets; segments past num_windows only
+                count towards the overall rate
+            num_windows: Number of leading segments that are windows
+            empty_rate: Rate reported when no decision is selected
+
+        Returns:
+            Tuple of (per-window rates, overall rate)
+        """
+        counts = np.add.reduceat(selected, starts, dtype=np.intp).tolist()
+        winners = np.add.reduceat(selected & wins, starts, dtype=np.intp).tolist()
+        rates = [w / c if c else empty_rate for w, c in zip(winners, counts, strict=True)]
+        total = sum(counts)
+        overall = sum(winners) / total if total else empty_rate
+        return rates[:num_windows], overall
 
     def _check_stability(
         self,
         agent_name: str,
         agent_config: AgentConfigV1,
         baseline_metric: float,
-    ) -> Tuple[bool, list]:
+        actions: np.ndarray,
+        r_multiples: np.ndarray,
+        wins: np.ndarray,
+    ) -> Tuple[bool, list, float]:
         """Check performance stability across validation windows.
 
+        Also returns the validation metric over the whole validation set. For
+        pass rate and override accuracy it is aggregated from the per-window
+        counts (plus any remainder past the last window) instead of a second
+        scan; Sharpe is computed over the full validation slice.
+
         Args:
             agent_name: Agent name
             agent_config: Agent configuration
             baseline_metric: Baseline metric to beat
+            actions: Decision actions
+            r_multiples: Decision R-multiples, NaN where missing
+            wins: Mask of decisions with a positive R-multiple
 
         Returns:
-            Tuple of (passed, window_results)
+            Tuple of (passed, window_results, validation_metric)
         """
         thresholds = agent_config.graduation_thresholds
-        decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
 
-        if len(decisions) < thresholds.num_validation_windows * 10:
+        if len(actions) < thresholds.num_validation_windows * 10:
             # Not enough data for windowed validation
-            return False, []
+            return (
+                False,
+                [],
+                self._calculate_validation_metric(
+                    agent_name, agent_config, actions, r_multiples, wins
+                ),
+            )
 
         # Split validation set into windows
-        validation_start = int(len(decisions) * 0.8)
-        validation_decisions = decisions[validation_start:]
+        validation_start = int(len(actions) * 0.8)
+        val_actions = actions[validation_start:]
+        val_r = r_multiples[validation_start:]
+        val_wins = wins[validation_start:]
 
-        window_size = len(validation_decisions) // thresholds.num_validation_windows
+        window_size = len(val_actions) // thresholds.num_validation_windows
         if window_size < 5:
-            return False, []
-
-        window_results = []
-
-        for i in range(thresholds.num_validation_windows):
-            window_start = i * window_size
-            window_end = window_start + window_size
-            window_decisions = validation_decisions[window_start:window_end]
-
-            # Calculate metric for this window
-            if agent_name == "gate":
-                window_metric = self._calculate_pass_rate(window_decisions)
-            elif agent_name == "portfolio":
-                window_metric = self._calculate_sharpe_from_decisions(window_decisions)
-            elif agent_name == "meta_learner":
-                window_metric = self._calculate_override_accuracy(window_decisions)
-            else:
-                window_metric = 0.0
-
-            # Check if this window beats baseline
-            improvement = (
-                (window_metric - baseline_metric) / baseline_metric * 100
-                if baseline_metric > 0
-                else 0
+            return (
+                False,
+                [],
+                self._calculate_validation_metric(
+                    agent_name, agent_config, actions, r_multiples, wins
+                ),
             )
 
-            passed = (
-                window_metric >= thresholds.min_validation_metric
-                and improvement >= thresholds.min_improvement_pct
+        # Equal-size window boundaries, computed once; any remainder at the
+        # end of the validation set is left out of the windows as before
+        num_windows = thresholds.num_validation_windows
+        bounds = (np.arange(num_windows + 1) * window_size).tolist()
+        # Remainder segment, counted only in the overall validation metric
+        starts = bounds[:-1] + ([bounds[-1]] if bounds[-1] < len(val_actions) else [])
+
+        if agent_name == "gate":
+            # action=1 means PASS
+            window_metrics, validation_metric = self._windowed_rates(
+                val_actions == 1, val_wins, starts, num_windows, empty_rate=0.0
             )
+        elif agent_name == "meta_learner":
+            # Override actions; no overrides = neutral
+            overrides = (val_actions == 1) | (val_actions == 2)
+            window_metrics, validation_metric = self._windowed_rates(
+                overrides, val_wins, starts, num_windows, empty_rate=0.5
+            )
+        elif agent_name == "portfolio":
+            window_metrics = [
+                # Array views, no copies
+                self._calculate_sharpe_from_decisions(val_r[window_start:window_end])
+                for window_start, window_end in zip(bounds[:-1], bounds[1:], strict=True)
+            ]
+            validation_metric = self._calculate_sharpe_from_decisions(val_r)
+        else:
+            window_metrics = [0.0] * num_windows
+            validation_metric = 0.0
+
+        # Improvement and pass/fail for all windows at once
+        # (windows only count improvement over a positive baseline)
+        metrics_arr = np.asarray(window_metrics, dtype=np.float64)
+        improvements = (
+            np.divide(
+                metrics_arr - baseline_metric,
+                baseline_metric,
+                out=np.zeros(num_windows),
+                where=baseline_metric > 0,
+            )
+            * 100
+        )
+        passed = (metrics_arr >= thresholds.min_validation_metric) & (
+            improvements >= thresholds.min_improvement_pct
+        )
 
-            window_results.append({
+        window_results = [
+            {
                 "window": i + 1,
                 "metric": window_metric,
                 "improvement_pct": improvement,
-                "passed": passed,
-            })
+                "passed": window_passed,
+            }
+            for i, (window_metric, improvement, window_passed) in enumerate(
+                zip(window_metrics, improvements.tolist(), passed.tolist(), strict=True)
+            )
+        ]
 
         # Check if enough windows passed
-        passing_windows = sum(1 for w in window_results if w["passed"])
+        passing_windows = int(np.count_nonzero(passed))
         stability_passed = passing_windows >= thresholds.min_passing_windows
 
-        return stability_passed, window_results
+        return stability_passed, window_results, validation_metric
@@ -1,27 +1,52 @@
 """Graduation metrics tracking for RL agents."""
 
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 
 from darwin.rl.schemas.agent_state import AgentDecisionV1
 from darwin.rl.storage.agent_state import AgentStateSQLite
+from darwin.rl.utils.stats import max_drawdown
 
 logger = logging.getLogger(__name__)
 
+# Minimum decisions in a window before rolling metrics are reported
+_DEFAULT_MIN_DECISIONS = 10
+
+
+def _window_sharpe(r_multiples: np.ndarray) -> float:
+    """Sharpe ratio of one stability window (population std)."""
+    mean_r = np.mean(r_multiples)
+    std_r = np.std(r_multiples) if len(r_multiples) > 1 else 0.0
+    return mean_r / std_r if std_r > 0 else 0.0
+
+
+# Per-window reducers for evaluate_stability(), keyed by metric name
+_WINDOW_REDUCERS: Dict[str, Callable[[np.ndarray], float]] = {
+    "mean_r_multiple": np.mean,
+    "sharpe_ratio": _window_sharpe,
+    "win_rate": lambda r_multiples: np.mean(r_multiples > 0),
+}
+
 
 class AgentPerformanceMetrics:
     """Track agent performance metrics for graduation evaluation."""
 
-    def __init__(self, agent_state: AgentStateSQLite):
+    def __init__(self, agent_state: AgentStateSQLite, cache_ttl_seconds: float = 60.0):
         """Initialize performance metrics tracker.
 
         Args:
             agent_state: Agent state storage instance
+            cache_ttl_seconds: How long compute_rolling_metrics() results may be
+                reused while the database is unchanged (0 disables caching)
         """
         self.agent_state = agent_state
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # (agent_name, window_days, min_decisions) -> (data version, computed at, metrics)
+        self._rolling_cache: Dict[Tuple[str, int, int], Tuple[Any, float, Optional[Dict]]] = {}
 
     def get_data_requirements(
         self, agent_name: str, min_training_samples: int, min_validation_samples: int
@@ -36,11 +61,59 @@ class AgentPerformanceMetrics:
         Returns:
             Dictionary with data requirement checks
         """
-        total_decisions = self.agent_state.get_decision_count(agent_name)
-        recent_decisions = self.agent_state.get_decision_count(
+        total_decisions, recent_decisions = self.agent_state.get_decision_count_split(
             agent_name, since=datetime.now() - timedelta(days=30)
         )
 
+        return self._data_requirements(
+            total_decisions, recent_decisions, min_training_samples, min_validation_samples
+        )
+
+    def get_data_requirements_batch(
+        self,
+        agent_names: Sequence[str],
+        min_training_samples: int,
+        min_validation_samples: int,
+    ) -> Dict[str, Dict[str, bool]]:
+        """Check data requirements of several agents with one grouped query.
+
+        Args:
+            agent_names: Names of agents
+            min_training_samples: Minimum training samples required
+            min_validation_samples: Minimum validation samples required
+
+        Returns:
+            Mapping of agent name to its get_data_requirements() result
+        """
+        counts = self.agent_state.get_decision_count_splits(
+            agent_names, since=datetime.now() - timedelta(days=30)
+        )
+
+        return {
+            agent_name: self._data_requirements(
+                total, recent, min_training_samples, min_validation_samples
+            )
+            for agent_name, (total, recent) in counts.items()
+        }
+
+    @staticmethod
+    def _data_requirements(
+        total_decisions: int,
+        recent_decisions: int,
+        min_training_samples: int,
+        min_validation_samples: int,
+    ) -> Dict[str, bool]:
+        """Build the data requirement checks from decision counts.
+
+        Args:
+            total_decisions: Count of all decisions
+            recent_decisions: Count of decisions in the last 30 days
+            min_training_samples: Minimum training samples required
+            min_validation_samples: Minimum validation samples required
+
+        Returns:
+            Dictionary with data requirement checks
+        """
         return {
             "has_min_training_samples": total_decisions >= min_training_samples,
             "has_min_validation_samples": recent_decisions >= min_validation_samples,
@@ -52,7 +125,7 @@ class AgentPerformanceMetrics:
         self,
         agent_name: str,
         window_days: int = 30,
-        min_decisions: int = 10,
+        min_decisions: int = _DEFAULT_MIN_DECISIONS,
     ) -> Optional[Dict[str, float]]:
         """Compute rolling performance metrics.
 
@@ -64,40 +137,65 @@ class AgentPerformanceMetrics:
         Returns:
             Dictionary of metrics or None if insufficient data
         """
-        # Get recent decisions with outcomes
+        # Reuse a recent result while the database is unchanged. The TTL bounds
+        # how far the window may have rolled forward since it was computed.
+        key = (agent_name, window_days, min_decisions)
+        version = self.agent_state.data_version()
+        cached = self._rolling_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == version
+            and time.monotonic() - cached[1] < self.cache_ttl_seconds
+        ):
+            return dict(cached[2]) if cached[2] is not None else None
+
+        # Get recent R-multiples
         since = datetime.now() - timedelta(days=window_days)
-        decisions = self.agent_state.get_decisions_with_outcomes(agent_name, since=since)
+        r_multiples = self.agent_state.get_r_multiples(agent_name, since=since)
+
+        metrics = self._summarize_r_multiples(agent_name, r_multiples, window_days, min_decisions)
+        if self.cache_ttl_seconds > 0:
+            self._rolling_cache[key] = (version, time.monotonic(), metrics)
+        return dict(metrics) if metrics is not None else None
 
-        if len(decisions) < min_decisions:
+    def _summarize_r_multiples(
+        self,
+        agent_name: str,
+        r_multiples: np.ndarray,
+        window_days: int,
+        min_decisions: int,
+    ) -> Optional[Dict[str, float]]:
+        """Compute rolling performance metrics from fetched R-multiples.
+
+        Args:
+            agent_name: Name of agent
+            r_multiples: R-multiples of the window, newest first
+            window_days: Rolling window in days
+            min_decisions: Minimum decisions required
+
+        Returns:
+            Dictionary of metrics or None if insufficient data
+        """
+        if len(r_multiples) < min_decisions:
             logger.info(
-                f"Insufficient decisions for {agent_name}: {len(decisions)} < {min_decisions}"
+                f"Insufficient decisions for {agent_name}: {len(r_multiples)} < {min_decisions}"
             )
             return None
 
-        # Extract R-multiples
-        r_multiples = [
-            d["outcome_r_multiple"]
-            for d in decisions
-            if d["outcome_r_multiple"] is not None
-        ]
-
-        if not r_multiples:
+        if not len(r_multiples):
             return None
 
         # Compute metrics
-        mean_r = np.mean(r_multiples)
-        std_r = np.std(r_multiples) if len(r_multiples) > 1 else 0.0
+        mean_r = r_multiples.mean()
+        std_r = r_multiples.std() if len(r_multiples) > 1 else 0.0
         sharpe = mean_r / std_r if std_r > 0 else 0.0
 
-        win_rate = np.mean([r > 0 for r in r_multiples])
-        max_r = np.max(r_multiples)
-        min_r = np.min(r_multiples)
+        win_rate = (r_multiples > 0).mean()
+        max_r = r_multiples.max()
+        min_r = r_multiples.min()
 
         # Compute drawdown
-        cumulative_r = np.cumsum(r_multiples)
-        running_max = np.maximum.accumulate(cumulative_r)
-        drawdown = running_max - cumulative_r
-        max_drawdown = np.max(drawdown) if len(drawdown) > 0 else 0.0
+        max_dd = max_drawdown(r_multiples)
 
         return {
             "mean_r_multiple": float(mean_r),
@@ -106,7 +204,7 @@ class AgentPerformanceMetrics:
             "win_rate": float(win_rate),
             "max_r_multiple": float(max_r),
             "min_r_multiple": float(min_r),
-            "max_drawdown": float(max_drawdown),
+            "max_drawdown": max_dd,
             "num_decisions": len(r_multiples),
             "window_days": window_days,
         }
@@ -182,31 +280,24 @@ class AgentPerformanceMetrics:
         """
         window_metrics = []
 
-        for i in range(num_windows):
-            # Get metrics for each window
-            since = datetime.now() - timedelta(days=(i + 1) * window_days)
-            until = datetime.now() - timedelta(days=i * window_days)
-
-            decisions = self.agent_state.get_decisions_with_outcomes(
-                agent_name, since=since, until=until
-            )
-
-            if decisions:
-                r_multiples = [
-                    d["outcome_r_multiple"]
-                    for d in decisions
-                    if d["outcome_r_multiple"] is not None
-                ]
-                if r_multiples:
-                    if metric_name == "mean_r_multiple":
-                        window_metrics.append(np.mean(r_multiples))
-                    elif metric_name == "sharpe_ratio":
-                        mean_r = np.mean(r_multiples)
-                        std_r = np.std(r_multiples) if len(r_multiples) > 1 else 0.0
-                        sharpe = mean_r / std_r if std_r > 0 else 0.0
-                        window_metrics.append(sharpe)
-                    elif metric_name == "win_rate":
-                        window_metrics.append(np.mean([r > 0 for r in r_multiples]))
+        # One query for the whole span; windows are sliced from the sorted
+        # timestamps with the same inclusive bounds as a per-window query.
+        now = datetime.now()
+        edges = [now - timedelta(days=k * window_days) for k in range(num_windows + 1)]
+        outcomes = self.agent_state.get_outcomes_bulk(agent_name, since=edges[-1], until=now)
+        timestamps = outcomes[:, 0]
+        edge_epochs = np.array([AgentStateSQLite.to_epoch(edge) for edge in edges])
+        lows = np.searchsorted(timestamps, edge_epochs[1:], side="left")
+        highs = np.searchsorted(timestamps, edge_epochs[:-1], side="right")
+
+        # Unknown metric names evaluate no windows (insufficient data)
+        reducer = _WINDOW_REDUCERS.get(metric_name)
+
+        # Reversed to newest first, the order get_decisions_with_outcomes() uses
+        for low, high in zip(lows, highs, strict=True):
+            r_multiples = outcomes[low:high, 1][::-1]
+            if reducer is not None and len(r_multiples):
+                window_metrics.append(reducer(r_multiples))
 
         if len(window_metrics) < num_windows:
             logger.info(
@@ -255,29 +346,31 @@ class AgentPerformanceMetrics:
         Returns:
             Dictionary of gate agent metrics or None
         """
-        metrics = self.compute_rolling_metrics(agent_name, window_days)
+        # One fetch serves both the rolling metrics and the gate-specific rates
+        since = datetime.now() - timedelta(days=window_days)
+        actions, r_multiples = self.agent_state.fetch_action_r(agent_name, since=since)
+
+        metrics = self._summarize_r_multiples(
+            agent_name, r_multiples, window_days, _DEFAULT_MIN_DECISIONS
+        )
         if metrics is None:
             return None
 
-        # Get decisions for gate-specific metrics
-        since = datetime.now() - timedelta(days=window_days)
-        decisions = self.agent_state.get_decisions_with_outcomes(agent_name, since=since)
+        # Skipped decisions (0 = SKIP) and skipped winners
+        total = len(actions)
+        skip_mask = actions == 0
+        skips = int(np.count_nonzero(skip_mask))
+        missed_winners = int(np.count_nonzero(skip_mask & (r_multiples > 0)))
 
         # Compute skip rate and cost savings
-        skip_actions = [d for d in decisions if d["action"] == 0]  # 0 = SKIP
-        skip_rate = len(skip_actions) / len(decisions) if decisions else 0.0
+        skip_rate = skips / total if total else 0.0
 
         # Estimate cost savings (skipped LLM calls)
         cost_per_call = 0.01  # $0.01 per LLM call
-        estimated_cost_savings = len(skip_actions) * cost_per_call
+        estimated_cost_savings = skips * cost_per_call
 
         # Compute miss rate (skipped winners)
-        missed_winners = [
-            d
-            for d in skip_actions
-            if d["outcome_r_multiple"] is not None and d["outcome_r_multiple"] > 0
-        ]
-        miss_rate = len(missed_winners) / len(skip_actions) if skip_actions else 0.0
+        miss_rate = missed_winners / skips if skips else 0.0
 
         metrics.update(
             {
@@ -301,16 +394,18 @@ class AgentPerformanceMetrics:
         Returns:
             Dictionary of portfolio agent metrics or None
         """
-        metrics = self.compute_rolling_metrics(agent_name, window_days)
+        # One fetch serves both the rolling metrics and the position sizes
+        since = datetime.now() - timedelta(days=window_days)
+        actions, r_multiples = self.agent_state.fetch_action_r(agent_name, since=since)
+
+        metrics = self._summarize_r_multiples(
+            agent_name, r_multiples, window_days, _DEFAULT_MIN_DECISIONS
+        )
         if metrics is None:
             return None
 
-        # Get decisions for portfolio-specific metrics
-        since = datetime.now() - timedelta(days=window_days)
-        decisions = self.agent_state.get_decisions_with_outcomes(agent_name, since=since)
-
         # Compute average position size
-        avg_position_size = np.mean([d["action"] for d in decisions]) if decisions else 0.0
+        avg_position_size = actions.mean()
 
         # TODO: Add more portfolio-specific metrics (Kelly criterion, risk parity, etc.)
 
@@ -334,31 +429,29 @@ class AgentPerformanceMetrics:
         Returns:
             Dictionary of meta-learner agent metrics or None
         """
-        metrics = self.compute_rolling_metrics(agent_name, window_days)
+        # One fetch serves both the rolling metrics and the override rates
+        since = datetime.now() - timedelta(days=window_days)
+        actions, r_multiples = self.agent_state.fetch_action_r(agent_name, since=since)
+
+        metrics = self._summarize_r_multiples(
+            agent_name, r_multiples, window_days, _DEFAULT_MIN_DECISIONS
+        )
         if metrics is None:
             return None
 
-        # Get decisions for meta-learner-specific metrics
-        since = datetime.now() - timedelta(days=window_days)
-        decisions = self.agent_state.get_decisions_with_outcomes(agent_name, since=since)
-
-        # Compute agreement rate (action = 0 = AGREE)
-        agree_actions = [d for d in decisions if d["action"] == 0]
-        agreement_rate = len(agree_actions) / len(decisions) if decisions else 0.0
+        # action = 0 = AGREE; every other action is an override
+        total = len(actions)
+        override_mask = actions != 0
+        overrides = int(np.count_nonzero(override_mask))
+        agreements = total - overrides
+        correct_overrides = int(np.count_nonzero(override_mask & (r_multiples > 0)))
 
-        # Compute override rate
-        override_actions = [d for d in decisions if d["action"] != 0]
-        override_rate = len(override_actions) / len(decisions) if decisions else 0.0
+        # Compute agreement rate and override rate
+        agreement_rate = agreements / total if total else 0.0
+        override_rate = overrides / total if total else 0.0
 
         # Compute override accuracy (when override, was it correct?)
-        correct_overrides = [
-            d
-            for d in override_actions
-            if d["outcome_r_multiple"] is not None and d["outcome_r_multiple"] > 0
-        ]
-        override_accuracy = (
-            len(correct_overrides) / len(override_actions) if override_actions else 0.0
-        )
+        override_accuracy = correct_overrides / overrides if overrides else 0.0
 
         metrics.update(
             {
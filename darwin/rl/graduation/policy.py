@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 
@@ -72,15 +72,58 @@ class GraduationPolicy:
         Returns:
             Graduation decision with details
         """
-        checks = {}
-        metrics = {}
-
-        # Check 1: Data requirements
         data_req = self.metrics_tracker.get_data_requirements(
             agent_name,
             self.thresholds.min_training_samples,
             self.thresholds.min_validation_samples,
         )
+        return self._evaluate(agent_name, data_req, episodes)
+
+    def evaluate_graduation_batch(
+        self,
+        agent_names: Sequence[str],
+        episodes: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> Dict[str, GraduationDecision]:
+        """Evaluate several agents, sharing one query for the data requirements.
+
+        Args:
+            agent_names: Names of agents to evaluate
+            episodes: Optional per-agent episodes for baseline comparison
+
+        Returns:
+            Mapping of agent name to graduation decision
+        """
+        data_reqs = self.metrics_tracker.get_data_requirements_batch(
+            agent_names,
+            self.thresholds.min_training_samples,
+            self.thresholds.min_validation_samples,
+        )
+        episodes = episodes or {}
+        return {
+            agent_name: self._evaluate(agent_name, data_req, episodes.get(agent_name))
+            for agent_name, data_req in data_reqs.items()
+        }
+
+    def _evaluate(
+        self,
+        agent_name: str,
+        data_req: Dict[str, Any],
+        episodes: Optional[List[Dict[str, Any]]],
+    ) -> GraduationDecision:
+        """Run the graduation checks given the agent's data requirements.
+
+        Args:
+            agent_name: Name of agent to evaluate
+            data_req: Result of get_data_requirements() for the agent
+            episodes: Optional episodes for baseline comparison
+
+        Returns:
+            Graduation decision with details
+        """
+        checks = {}
+        metrics = {}
+
+        # Check 1: Data requirements
         checks["has_sufficient_data"] = (
             data_req["has_min_training_samples"]
             and data_req["has_min_validation_samples"]
@@ -252,28 +295,26 @@ class GraduationPolicy:
         Returns:
             Stability check results
         """
-        # Get performance across 3 windows
+        # Get performance across 3 consecutive windows; the last one also
+        # takes any remainder days up to now
         window_size = lookback_days // 3
         windows = []
 
-        for i in range(3):
-            start_date = datetime.now() - timedelta(days=lookback_days - i * window_size)
-            end_date = start_date + timedelta(days=window_size)
+        now = datetime.now()
+        start_dates = [now - timedelta(days=lookback_days - i * window_size) for i in range(3)]
 
-            # Get decisions in window
-            decisions = self.agent_state.get_decisions_with_outcomes(
-                agent_name, since=start_date
-            )
+        # Fetch the whole lookback once and split it at the window starts
+        outcomes = self.agent_state.get_outcomes_bulk(agent_name, since=start_dates[0])
+        bounds = np.searchsorted(
+            outcomes[:, 0],
+            [AgentStateSQLite.to_epoch(start_date) for start_date in start_dates[1:]],
+            side="left",
+        )
 
-            if decisions:
-                r_multiples = [
-                    d["outcome_r_multiple"]
-                    for d in decisions
-                    if d["outcome_r_multiple"] is not None
-                ]
-                if r_multiples:
-                    mean_r = float(np.mean(r_multiples))
-                    windows.append(mean_r)
+        for r_multiples in np.split(outcomes[:, 1], bounds):
+            if len(r_multiples):
+                mean_r = float(np.mean(r_multiples))
+                windows.append(mean_r)
 
         if len(windows) < 2:
             # Not enough data to check stability
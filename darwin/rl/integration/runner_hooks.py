@@ -1,12 +1,21 @@
 """RL system integration for Darwin runner."""
 
+import atexit
 import logging
+import queue
+import threading
+import time
+import zlib
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from darwin.rl.agents.gate_agent import GateAgent
 from darwin.rl.agents.meta_learner_agent import MetaLearnerAgent
 from darwin.rl.agents.portfolio_agent import PortfolioAgent
+from darwin.rl.schemas.agent_state import AgentDecisionV1
 from darwin.rl.schemas.rl_config import AgentConfigV1, RLConfigV1
 from darwin.rl.storage.agent_state import AgentStateSQLite
 from darwin.schemas.candidate import CandidateRecordV1
@@ -22,8 +31,27 @@ class RLSystem:
     - Manage agent modes (observe vs active)
     - Track agent decisions
     - Provide hooks for runner integration
+
+    Decisions recorded by the hooks are buffered and handed to a background
+    writer thread once DECISION_FLUSH_SIZE accumulate or
+    DECISION_FLUSH_INTERVAL_S has passed since the last hand-off, so SQLite
+    commits stay off the hook path while readers in other processes (the
+    API) see decisions at most one interval late. Outcome updates are
+    queued to the same writer behind the decisions they apply to.
+    flush_decisions() waits until everything recorded is committed; it runs before in-process
+    monitors read, on close(), and at interpreter exit.
     """
 
+    DECISION_FLUSH_SIZE = 64
+    DECISION_FLUSH_INTERVAL_S = 5.0
+
+    # Writes (decision batches and outcome updates) the writer may fall
+    # behind by before hooks block on hand-off
+    DECISION_QUEUE_SIZE = 64
+
+    # Attempts the writer makes per write before leaving it to flush_decisions()
+    DECISION_WRITE_ATTEMPTS = 3
+
     def __init__(self, config: RLConfigV1, run_id: str):
         """Initialize RL system.
 
@@ -36,6 +64,24 @@ class RLSystem:
 
         # Initialize agent state storage
         self.agent_state = AgentStateSQLite(config.agent_state_db)
+        self._decision_buffer: List[AgentDecisionV1] = []
+
+        # Background writer for decisions and outcome updates, started on the
+        # first write; None in the queue tells it to stop
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.DECISION_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._last_hand_off = time.monotonic()
+
+        # Batches the writer gave up on, retried by flush_decisions() on the
+        # caller's connection so a failure surfaces instead of dropping them
+        self._unwritten: List[Tuple[str, Any]] = []
+        self._unwritten_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self._flush_at_exit)
+
+        # Per-agent state vectors the hooks encode into, reused across
+        # candidates (hooks run synchronously, so one buffer per agent)
+        self._state_buffers: Dict[str, np.ndarray] = {}
 
         # Initialize agents
         self.gate_agent: Optional[GateAgent] = None
@@ -67,6 +113,9 @@ class RLSystem:
         """
         try:
             self.gate_agent = GateAgent()
+            self._state_buffers["gate"] = np.zeros(
+                self.gate_agent.get_state_dim(), dtype=np.float32
+            )
 
             if config.model_path:
                 model_path = Path(config.model_path)
@@ -98,6 +147,9 @@ class RLSystem:
         """
         try:
             self.portfolio_agent = PortfolioAgent()
+            self._state_buffers["portfolio"] = np.zeros(
+                self.portfolio_agent.get_state_dim(), dtype=np.float32
+            )
 
             if config.model_path:
                 model_path = Path(config.model_path)
@@ -129,6 +181,9 @@ class RLSystem:
         """
         try:
             self.meta_learner_agent = MetaLearnerAgent()
+            self._state_buffers["meta_learner"] = np.zeros(
+                self.meta_learner_agent.get_state_dim(), dtype=np.float32
+            )
 
             if config.model_path:
                 model_path = Path(config.model_path)
@@ -158,19 +213,15 @@ class RLSystem:
         Returns:
             True if gate agent is in active mode and loaded
         """
-        if not self.config.gate_agent:
-            return False
-
-        if not self.config.gate_agent.enabled:
-            return False
-
-        if self.config.gate_agent.mode != "active":
-            return False
-
-        if not self.gate_agent or not self.gate_agent.is_loaded():
-            return False
-
-        return True
+        # enabled and mode are read live because they can be switched mid-run
+        # (auto-graduation, rollback) after the agent was loaded
+        agent = self.gate_agent
+        return (
+            agent is not None
+            and self.config.gate_agent.enabled
+            and agent.is_loaded()
+            and self.config.gate_agent.mode == "active"
+        )
 
     def gate_hook(
         self, candidate: CandidateRecordV1, portfolio_state: Dict
@@ -190,16 +241,18 @@ class RLSystem:
         if not self.gate_agent or not self.gate_agent.is_loaded():
             return None
 
+        if not self._observe_sampled(candidate.candidate_id, self.config.gate_agent):
+            return None
+
         try:
-            # Make prediction
-            action = self.gate_agent.predict(candidate, portfolio_state)
+            # Encode once; the same state feeds the prediction and its hash
+            state = self.gate_agent.encoder.encode(
+                candidate, portfolio_state or {}, out=self._state_buffers["gate"]
+            )
+            action = self.gate_agent.predict_state(state)
             is_skip = action == 0
 
             # Record decision
-            from darwin.rl.schemas.agent_state import AgentDecisionV1
-            from datetime import datetime
-
-            state = self.gate_agent.encoder.encode(candidate, portfolio_state)
             decision = AgentDecisionV1(
                 agent_name="gate",
                 candidate_id=candidate.candidate_id,
@@ -210,21 +263,20 @@ class RLSystem:
                 mode=self.config.gate_agent.mode,
                 model_version=self.config.gate_agent.model_version,
             )
-            self.agent_state.record_decision(decision)
+            self._record_decision(decision)
 
             # In observe mode, log but don't affect decisions
             if self.config.gate_agent.mode == "observe":
                 logger.debug(
-                    f"Gate agent (observe): candidate {candidate.candidate_id} "
-                    f"-> {'SKIP' if is_skip else 'PASS'}"
+                    "Gate agent (observe): candidate %s -> %s",
+                    candidate.candidate_id,
+                    "SKIP" if is_skip else "PASS",
                 )
                 return None
 
             # In active mode, return skip decision
             if is_skip:
-                logger.debug(
-                    f"Gate agent (active): skipping candidate {candidate.candidate_id}"
-                )
+                logger.debug("Gate agent (active): skipping candidate %s", candidate.candidate_id)
                 return "skip"
 
             return None
@@ -239,19 +291,13 @@ class RLSystem:
         Returns:
             True if portfolio agent is in active mode and loaded
         """
-        if not self.config.portfolio_agent:
-            return False
-
-        if not self.config.portfolio_agent.enabled:
-            return False
-
-        if self.config.portfolio_agent.mode != "active":
-            return False
-
-        if not self.portfolio_agent or not self.portfolio_agent.is_loaded():
-            return False
-
-        return True
+        agent = self.portfolio_agent
+        return (
+            agent is not None
+            and self.config.portfolio_agent.enabled
+            and agent.is_loaded()
+            and self.config.portfolio_agent.mode == "active"
+        )
 
     def portfolio_hook(
         self, candidate: CandidateRecordV1, llm_response: Dict[str, Any], portfolio_state: Dict
@@ -272,19 +318,20 @@ class RLSystem:
         if not self.portfolio_agent or not self.portfolio_agent.is_loaded():
             return 1.0
 
+        if not self._observe_sampled(candidate.candidate_id, self.config.portfolio_agent):
+            return 1.0
+
         try:
-            # Make prediction
-            position_size = self.portfolio_agent.predict(
-                candidate, llm_response, portfolio_state
+            # Encode once; the same state feeds the prediction and its hash
+            state = self.portfolio_agent.encoder.encode(
+                candidate,
+                llm_response,
+                portfolio_state or {},
+                out=self._state_buffers["portfolio"],
             )
+            position_size = self.portfolio_agent.predict_state(state)
 
             # Record decision
-            from darwin.rl.schemas.agent_state import AgentDecisionV1
-            from datetime import datetime
-
-            state = self.portfolio_agent.encoder.encode(
-                candidate, llm_response, portfolio_state
-            )
             decision = AgentDecisionV1(
                 agent_name="portfolio",
                 candidate_id=candidate.candidate_id,
@@ -295,20 +342,22 @@ class RLSystem:
                 mode=self.config.portfolio_agent.mode,
                 model_version=self.config.portfolio_agent.model_version,
             )
-            self.agent_state.record_decision(decision)
+            self._record_decision(decision)
 
             # In observe mode, log but don't affect sizing
             if self.config.portfolio_agent.mode == "observe":
                 logger.debug(
-                    f"Portfolio agent (observe): candidate {candidate.candidate_id} "
-                    f"-> size fraction {position_size:.2f}"
+                    "Portfolio agent (observe): candidate %s -> size fraction %.2f",
+                    candidate.candidate_id,
+                    position_size,
                 )
                 return 1.0  # Default size in observe mode
 
             # In active mode, return predicted size
             logger.debug(
-                f"Portfolio agent (active): candidate {candidate.candidate_id} "
-                f"-> size fraction {position_size:.2f}"
+                "Portfolio agent (active): candidate %s -> size fraction %.2f",
+                candidate.candidate_id,
+                position_size,
             )
             return position_size
 
@@ -322,19 +371,13 @@ class RLSystem:
         Returns:
             True if meta-learner agent is in active mode and loaded
         """
-        if not self.config.meta_learner_agent:
-            return False
-
-        if not self.config.meta_learner_agent.enabled:
-            return False
-
-        if self.config.meta_learner_agent.mode != "active":
-            return False
-
-        if not self.meta_learner_agent or not self.meta_learner_agent.is_loaded():
-            return False
-
-        return True
+        agent = self.meta_learner_agent
+        return (
+            agent is not None
+            and self.config.meta_learner_agent.enabled
+            and agent.is_loaded()
+            and self.config.meta_learner_agent.mode == "active"
+        )
 
     def meta_learner_hook(
         self,
@@ -360,6 +403,9 @@ class RLSystem:
         if not self.meta_learner_agent or not self.meta_learner_agent.is_loaded():
             return None
 
+        if not self._observe_sampled(candidate.candidate_id, self.config.meta_learner_agent):
+            return None
+
         try:
             # Get LLM decision
             llm_decision = llm_response.get("decision", "skip")
@@ -370,11 +416,12 @@ class RLSystem:
             )
 
             # Record decision
-            from darwin.rl.schemas.agent_state import AgentDecisionV1
-            from datetime import datetime
-
             state = self.meta_learner_agent.encoder.encode(
-                candidate, llm_response, llm_history, portfolio_state
+                candidate,
+                llm_response,
+                llm_history,
+                portfolio_state,
+                out=self._state_buffers["meta_learner"],
             )
 
             # Map override decision to action
@@ -395,27 +442,33 @@ class RLSystem:
                 mode=self.config.meta_learner_agent.mode,
                 model_version=self.config.meta_learner_agent.model_version,
             )
-            self.agent_state.record_decision(decision)
+            self._record_decision(decision)
 
             # In observe mode, log but don't affect decisions
             if self.config.meta_learner_agent.mode == "observe":
                 if override_decision:
                     logger.debug(
-                        f"Meta-learner agent (observe): candidate {candidate.candidate_id} "
-                        f"-> override LLM '{llm_decision}' to '{override_decision}'"
+                        "Meta-learner agent (observe): candidate %s "
+                        "-> override LLM '%s' to '%s'",
+                        candidate.candidate_id,
+                        llm_decision,
+                        override_decision,
                     )
                 else:
                     logger.debug(
-                        f"Meta-learner agent (observe): candidate {candidate.candidate_id} "
-                        f"-> agree with LLM '{llm_decision}'"
+                        "Meta-learner agent (observe): candidate %s -> agree with LLM '%s'",
+                        candidate.candidate_id,
+                        llm_decision,
                     )
                 return None  # Don't override in observe mode
 
             # In active mode, return override if any
             if override_decision:
                 logger.debug(
-                    f"Meta-learner agent (active): candidate {candidate.candidate_id} "
-                    f"-> overriding LLM '{llm_decision}' to '{override_decision}'"
+                    "Meta-learner agent (active): candidate %s -> overriding LLM '%s' to '%s'",
+                    candidate.candidate_id,
+                    llm_decision,
+                    override_decision,
                 )
                 return override_decision
 
@@ -425,40 +478,246 @@ class RLSystem:
             logger.error(f"Meta-learner agent hook error: {e}")
             return None  # Default: agree with LLM on error
 
-    def update_decision_outcome(
-        self, candidate_id: str, r_multiple: Optional[float], pnl_usd: Optional[float]
-    ) -> None:
-        """Update outcome for a recorded decision.
+    @staticmethod
+    def _observe_sampled(candidate_id: str, agent_config: AgentConfigV1) -> bool:
+        """Check whether an agent should score a candidate.
+
+        Active agents score every candidate. Observe-mode agents score the
+        ``observe_sample_rate`` fraction of candidates whose ID hashes below
+        the rate, so sampling is reproducible across runs and the same
+        candidates are scored by every agent.
 
         Args:
             candidate_id: Candidate ID
-            r_multiple: R-multiple outcome
-            pnl_usd: PnL in USD
+            agent_config: Agent configuration
+
+        Returns:
+            True if the hook should encode, predict and record the candidate
+        """
+        rate = agent_config.observe_sample_rate
+        if agent_config.mode != "observe" or rate >= 1.0:
+            return True
+        return zlib.crc32(candidate_id.encode()) < rate * 2**32
+
+    def _record_decision(self, decision: AgentDecisionV1) -> None:
+        """Buffer a decision, handing the buffer to the writer once it is full
+        or the flush interval has elapsed.
+
+        Args:
+            decision: Agent decision record
+        """
+        self._decision_buffer.append(decision)
+        if (
+            len(self._decision_buffer) >= self.DECISION_FLUSH_SIZE
+            or time.monotonic() - self._last_hand_off >= self.DECISION_FLUSH_INTERVAL_S
+        ):
+            self._hand_off_decisions()
+
+    def _hand_off_decisions(self) -> None:
+        """Queue the buffered decisions for the background writer."""
+        self._last_hand_off = time.monotonic()
+        if not self._decision_buffer:
+            return
+
+        decisions, self._decision_buffer = self._decision_buffer, []
+
+        self._enqueue_write(("decisions", decisions))
+
+    def _enqueue_write(self, op: Tuple[str, Any]) -> None:
+        """Queue a write op for the background writer, starting it if needed.
+
+        Args:
+            op: ("decisions", decision list) or ("outcome", update kwargs)
+        """
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name=f"rl-decision-writer-{self.run_id}",
+                daemon=True,
+            )
+            self._writer.start()
+
+        self._write_queue.put(op)
+
+    def _writer_loop(self) -> None:
+        """Apply queued write ops in order until the stop sentinel arrives.
+
+        Runs on the writer thread with its own connection (sqlite3
+        connections cannot be shared across threads). Consecutive decision
+        batches that queued up while a commit was in progress are written in
+        one transaction; outcome updates are applied after the decisions
+        queued before them. Each write is attempted DECISION_WRITE_ATTEMPTS
+        times; once one fails, it and every later op are parked for
+        flush_decisions() rather than dropped, preserving their order.
         """
         try:
-            # Update outcomes for all active agents
-            if self.config.gate_agent and self.config.gate_agent.enabled:
-                self.agent_state.update_decision_outcome(
-                    agent_name="gate", candidate_id=candidate_id,
-                    r_multiple=r_multiple, pnl_usd=pnl_usd
-                )
+            writer_state: Optional[AgentStateSQLite] = AgentStateSQLite(self.config.agent_state_db)
+        except Exception as e:
+            logger.error(f"Failed to open agent state for decision writer: {e}")
+            writer_state = None
+
+        stop = False
+        while not stop:
+            items = [self._write_queue.get()]
+            while True:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            ops: List[Tuple[str, Any]] = []
+            for item in items:
+                if item is None:
+                    stop = True
+                elif item[0] == "decisions" and ops and ops[-1][0] == "decisions":
+                    ops[-1] = ("decisions", ops[-1][1] + item[1])
+                else:
+                    ops.append(item)
+
+            try:
+                with self._unwritten_lock:
+                    parked = bool(self._unwritten)
+                for i, op in enumerate(ops):
+                    if parked or not self._apply_with_retry(writer_state, op):
+                        with self._unwritten_lock:
+                            self._unwritten.extend(ops[i:])
+                        break
+            finally:
+                for _ in items:
+                    self._write_queue.task_done()
+
+        if writer_state is not None:
+            writer_state.close()
+
+    @staticmethod
+    def _apply_write(state: AgentStateSQLite, op: Tuple[str, Any]) -> None:
+        """Apply one write op on the given connection.
 
-            if self.config.portfolio_agent and self.config.portfolio_agent.enabled:
-                self.agent_state.update_decision_outcome(
-                    agent_name="portfolio", candidate_id=candidate_id,
-                    r_multiple=r_multiple, pnl_usd=pnl_usd
-                )
+        Args:
+            state: Agent state connection
+            op: ("decisions", decision list) or ("outcome", update kwargs)
+        """
+        kind, payload = op
+        if kind == "decisions":
+            state.record_decisions(payload)
+        else:
+            state.update_decision_outcomes(**payload)
+
+    def _apply_with_retry(
+        self, writer_state: Optional[AgentStateSQLite], op: Tuple[str, Any]
+    ) -> bool:
+        """Apply a write op on the writer connection, backing off between attempts.
+
+        Args:
+            writer_state: Writer thread's connection (None if it failed to open)
+            op: Write op to apply
 
-            if self.config.meta_learner_agent and self.config.meta_learner_agent.enabled:
-                self.agent_state.update_decision_outcome(
-                    agent_name="meta_learner", candidate_id=candidate_id,
-                    r_multiple=r_multiple, pnl_usd=pnl_usd
+        Returns:
+            True if the write was committed
+        """
+        if writer_state is None:
+            logger.error(f"Decision writer has no database connection; deferring {op[0]} write")
+            return False
+
+        for attempt in range(1, self.DECISION_WRITE_ATTEMPTS + 1):
+            try:
+                self._apply_write(writer_state, op)
+                return True
+            except Exception as e:
+                logger.error(
+                    f"Failed to write agent {op[0]} "
+                    f"(attempt {attempt}/{self.DECISION_WRITE_ATTEMPTS}): {e}"
                 )
+                if attempt < self.DECISION_WRITE_ATTEMPTS:
+                    time.sleep(0.05 * 2**attempt)
+        return False
+
+    def flush_decisions(self) -> None:
+        """Write all buffered decisions and outcomes and wait until they are committed.
+
+        Raises:
+            Exception: If writes the writer could not apply also fail on this
+                connection; they stay queued, in order, for the next flush.
+        """
+        self._hand_off_decisions()
+        if self._writer is not None:
+            self._write_queue.join()
+
+        with self._unwritten_lock:
+            unwritten, self._unwritten = self._unwritten, []
+        for i, op in enumerate(unwritten):
+            try:
+                self._apply_write(self.agent_state, op)
+            except Exception:
+                with self._unwritten_lock:
+                    self._unwritten[:0] = unwritten[i:]
+                raise
+
+    def _flush_at_exit(self) -> None:
+        """Flush decisions still buffered when the interpreter exits without close()."""
+        if self._closed:
+            return
+        try:
+            self.flush_decisions()
         except Exception as e:
-            logger.error(f"Failed to update decision outcome: {e}")
+            logger.error(f"Failed to flush agent decisions at exit: {e}")
+
+    def update_decision_outcome(
+        self, candidate_id: str, r_multiple: Optional[float], pnl_usd: Optional[float]
+    ) -> None:
+        """Queue an outcome update for a recorded decision.
+
+        The update goes through the writer queue behind the decisions it
+        applies to, so the caller does not wait for a commit; it is visible
+        to readers after the next flush_decisions().
+
+        Args:
+            candidate_id: Candidate ID
+            r_multiple: R-multiple outcome
+            pnl_usd: PnL in USD
+        """
+        # The decision must reach the queue ahead of its outcome
+        if any(d.candidate_id == candidate_id for d in self._decision_buffer):
+            self._hand_off_decisions()
+
+        # Update outcomes for all enabled agents in one statement
+        agent_names = [
+            agent_name
+            for agent_name, agent_config in (
+                ("gate", self.config.gate_agent),
+                ("portfolio", self.config.portfolio_agent),
+                ("meta_learner", self.config.meta_learner_agent),
+            )
+            if agent_config and agent_config.enabled
+        ]
+        self._enqueue_write(
+            (
+                "outcome",
+                {
+                    "agent_names": agent_names,
+                    "candidate_id": candidate_id,
+                    "outcome_r_multiple": r_multiple,
+                    "outcome_pnl_usd": pnl_usd,
+                },
+            )
+        )
 
     def close(self) -> None:
-        """Close RL system and release resources."""
+        """Close RL system and release resources.
+
+        Raises:
+            Exception: If pending decisions could not be written; the writer
+                and connection are still shut down.
+        """
+        atexit.unregister(self._flush_at_exit)
+        self._closed = True
         if self.agent_state:
-            self.agent_state.close()
+            try:
+                self.flush_decisions()
+            finally:
+                if self._writer is not None:
+                    self._write_queue.put(None)
+                    self._writer.join()
+                    self._writer = None
+                self.agent_state.close()
         logger.info(f"Closed RL system for run {self.run_id}")
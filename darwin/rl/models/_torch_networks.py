@@ -0,0 +1,351 @@
+"""PyTorch definitions of the RL agent networks.
+
+Kept separate from networks.py so that importing networks stays cheap: this
+module imports torch at the top and is only loaded on first use of a network
+class. The classes live at module level so trained networks can be pickled
+and passed to torch.save().
+"""
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+
+def _as_tensor(states: np.ndarray) -> torch.Tensor:
+    """Wrap a state array as a float32 tensor.
+
+    Shares memory with the array when it is already contiguous float32.
+    """
+    return torch.from_numpy(np.ascontiguousarray(states, dtype=np.float32))
+
+
+class _AgentNetwork(nn.Module):
+    """Shared NumPy inference path for the agent networks.
+
+    precompile_numpy() snapshots the Sequential's weights as float32
+    arrays; predict() and predict_batch() then run the layers with NumPy
+    matmuls instead of going through PyTorch dispatch, which dominates
+    for these small networks.
+    """
+
+    # [(op, weight_t, bias)] from precompile_numpy(), None until then;
+    # weight_t/bias are views into the single _np_packed buffer
+    _np_layers: Optional[List[Tuple[str, Any, Any]]] = None
+    _np_packed: Optional[np.ndarray] = None
+
+    def precompile_numpy(self) -> None:
+        """Snapshot the current weights for NumPy inference.
+
+        All weights (transposed) and biases are packed back to back into
+        one contiguous float32 buffer and the layers hold views into it,
+        so a forward pass walks a single allocation.
+
+        Call after the trained weights are loaded; later weight updates
+        are not seen until this is called again.
+
+        Raises:
+            ValueError: If the network contains an unsupported layer
+        """
+        ops: List[Tuple[str, Any, Any]] = []
+        for layer in self.network.children():
+            if isinstance(layer, nn.Linear):
+                ops.append(
+                    (
+                        "linear",
+                        layer.weight.detach().cpu().numpy().T,
+                        layer.bias.detach().cpu().numpy(),
+                    )
+                )
+            elif isinstance(layer, nn.ReLU):
+                ops.append(("relu", None, None))
+            elif isinstance(layer, nn.Sigmoid):
+                ops.append(("sigmoid", None, None))
+            elif not isinstance(layer, nn.Dropout):  # no-op at inference
+                raise ValueError(f"Cannot precompile layer {type(layer).__name__} to NumPy")
+
+        packed = np.empty(
+            sum(w.size + b.size for op, w, b in ops if op == "linear"),
+            dtype=np.float32,
+        )
+        layers: List[Tuple[str, Any, Any]] = []
+        offset = 0
+        for op, weight_t, bias in ops:
+            if op == "linear":
+                w_view = packed[offset : offset + weight_t.size].reshape(weight_t.shape)
+                w_view[...] = weight_t
+                offset += weight_t.size
+                b_view = packed[offset : offset + bias.size]
+                b_view[...] = bias
+                offset += bias.size
+                layers.append((op, w_view, b_view))
+            else:
+                layers.append((op, None, None))
+
+        self._np_packed = packed
+        self._np_layers = layers
+
+    def _forward_numpy(self, state: np.ndarray) -> np.ndarray:
+        """Run the precompiled layers on one state or a batch.
+
+        Args:
+            state: State array (state_dim,) or (batch_size, state_dim)
+
+        Returns:
+            Network output (output_dim,) or (batch_size, output_dim)
+        """
+        x = np.asarray(state, dtype=np.float32)
+        for op, weight_t, bias in self._np_layers:
+            if op == "linear":
+                x = x @ weight_t
+                x += bias
+            elif op == "relu":
+                np.maximum(x, 0.0, out=x)
+            else:
+                x = 1.0 / (1.0 + np.exp(-x))
+        return x
+
+
+class GateAgentNetwork(_AgentNetwork):
+    """Neural network for Gate Agent.
+
+    Input: Candidate features (34 dims from state encoder)
+    Output: Binary decision (skip=0, pass=1)
+    """
+
+    def __init__(self, state_dim: int = 34, hidden_dims: list = [128, 64, 32]):
+        """Initialize gate agent network.
+
+        Args:
+            state_dim: Input state dimension
+            hidden_dims: List of hidden layer dimensions
+        """
+        super().__init__()
+
+        layers = []
+        input_dim = state_dim
+
+        # Build hidden layers
+        for hidden_dim in hidden_dims:
+            layers.append(nn.Linear(input_dim, hidden_dim))
+            layers.append(nn.ReLU())
+            layers.append(nn.Dropout(0.2))
+            input_dim = hidden_dim
+
+        # Output layer (binary classification)
+        layers.append(nn.Linear(input_dim, 2))
+
+        self.network = nn.Sequential(*layers)
+
+    def forward(self, state: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            state: State tensor (batch_size, state_dim)
+
+        Returns:
+            Logits for skip/pass (batch_size, 2)
+        """
+        return self.network(state)
+
+    def predict(self, state: np.ndarray) -> int:
+        """Predict action for single state.
+
+        Args:
+            state: State array (state_dim,)
+
+        Returns:
+            Action: 0 = skip, 1 = pass
+        """
+        if self._np_layers is not None:
+            return int(np.argmax(self._forward_numpy(state)))
+
+        if self.training:
+            self.eval()
+        with torch.no_grad():
+            state_tensor = _as_tensor(state).unsqueeze(0)
+            logits = self.forward(state_tensor)
+            action = torch.argmax(logits, dim=1).item()
+        return action
+
+    def predict_batch(self, states: np.ndarray) -> np.ndarray:
+        """Predict actions for a batch of states in one forward pass.
+
+        Args:
+            states: State array (batch_size, state_dim)
+
+        Returns:
+            Actions (batch_size,): 0 = skip, 1 = pass
+        """
+        if self._np_layers is not None:
+            return self._forward_numpy(states).argmax(axis=1)
+
+        if self.training:
+            self.eval()
+        with torch.no_grad():
+            logits = self.forward(_as_tensor(states))
+        return logits.argmax(dim=1).numpy()
+
+
+class PortfolioAgentNetwork(_AgentNetwork):
+    """Neural network for Portfolio Agent.
+
+    Input: Candidate + LLM + Portfolio context (30 dims from state encoder)
+    Output: Position size fraction [0.0, 1.0]
+    """
+
+    def __init__(self, state_dim: int = 30, hidden_dims: list = [128, 64, 32]):
+        """Initialize portfolio agent network.
+
+        Args:
+            state_dim: Input state dimension
+            hidden_dims: List of hidden layer dimensions
+        """
+        super().__init__()
+
+        layers = []
+        input_dim = state_dim
+
+        # Build hidden layers
+        for hidden_dim in hidden_dims:
+            layers.append(nn.Linear(input_dim, hidden_dim))
+            layers.append(nn.ReLU())
+            layers.append(nn.Dropout(0.2))
+            input_dim = hidden_dim
+
+        # Output layer (single value with sigmoid for [0, 1] range)
+        layers.append(nn.Linear(input_dim, 1))
+        layers.append(nn.Sigmoid())
+
+        self.network = nn.Sequential(*layers)
+
+    def forward(self, state: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            state: State tensor (batch_size, state_dim)
+
+        Returns:
+            Position size fractions (batch_size, 1) in [0.0, 1.0]
+        """
+        return self.network(state)
+
+    def predict(self, state: np.ndarray) -> float:
+        """Predict position size for single state.
+
+        Args:
+            state: State array (state_dim,)
+
+        Returns:
+            Position size fraction [0.0, 1.0]
+        """
+        if self._np_layers is not None:
+            return float(self._forward_numpy(state)[0])
+
+        if self.training:
+            self.eval()
+        with torch.no_grad():
+            state_tensor = _as_tensor(state).unsqueeze(0)
+            size_fraction = self.forward(state_tensor).item()
+        return size_fraction
+
+    def predict_batch(self, states: np.ndarray) -> np.ndarray:
+        """Predict position sizes for a batch of states in one forward pass.
+
+        Args:
+            states: State array (batch_size, state_dim)
+
+        Returns:
+            Position size fractions (batch_size,) in [0.0, 1.0]
+        """
+        if self._np_layers is not None:
+            return self._forward_numpy(states)[:, 0]
+
+        if self.training:
+            self.eval()
+        with torch.no_grad():
+            size_fractions = self.forward(_as_tensor(states))
+        return size_fractions.squeeze(1).numpy()
+
+
+class MetaLearnerAgentNetwork(_AgentNetwork):
+    """Neural network for Meta-Learner Agent.
+
+    Input: Candidate + LLM + History context (38 dims from state encoder)
+    Output: Action (0=agree, 1=override_to_skip, 2=override_to_take)
+    """
+
+    def __init__(self, state_dim: int = 38, hidden_dims: list = [128, 64, 32]):
+        """Initialize meta-learner agent network.
+
+        Args:
+            state_dim: Input state dimension
+            hidden_dims: List of hidden layer dimensions
+        """
+        super().__init__()
+
+        layers = []
+        input_dim = state_dim
+
+        # Build hidden layers
+        for hidden_dim in hidden_dims:
+            layers.append(nn.Linear(input_dim, hidden_dim))
+            layers.append(nn.ReLU())
+            layers.append(nn.Dropout(0.2))
+            input_dim = hidden_dim
+
+        # Output layer (3-class classification)
+        layers.append(nn.Linear(input_dim, 3))
+
+        self.network = nn.Sequential(*layers)
+
+    def forward(self, state: torch.Tensor) -> torch.Tensor:
+        """Forward pass.
+
+        Args:
+            state: State tensor (batch_size, state_dim)
+
+        Returns:
+            Logits for 3 actions (batch_size, 3)
+        """
+        return self.network(state)
+
+    def predict(self, state: np.ndarray) -> int:
+        """Predict action for single state.
+
+        Args:
+            state: State array (state_dim,)
+
+        Returns:
+            Action: 0=agree, 1=override_to_skip, 2=override_to_take
+        """
+        if self._np_layers is not None:
+            return int(np.argmax(self._forward_numpy(state)))
+
+        if self.training:
+            self.eval()
+        with torch.no_grad():
+            state_tensor = _as_tensor(state).unsqueeze(0)
+            logits = self.forward(state_tensor)
+            action = torch.argmax(logits, dim=1).item()
+        return action
+
+    def predict_batch(self, states: np.ndarray) -> np.ndarray:
+        """Predict actions for a batch of states in one forward pass.
+
+        Args:
+            states: State array (batch_size, state_dim)
+
+        Returns:
+            Actions (batch_size,): 0=agree, 1=override_to_skip,
+            2=override_to_take
+        """
+        if self._np_layers is not None:
+            return self._forward_numpy(states).argmax(axis=1)
+
+        if self.training:
+            self.eval()
+        with torch.no_grad():
+            logits = self.forward(_as_tensor(states))
+        return logits.argmax(dim=1).numpy()
@@ -4,208 +4,68 @@ Simple feed-forward networks for the three agent types:
 - Gate Agent: Binary classification (pass/skip)
 - Portfolio Agent: Regression (position size fraction)
 - Meta-Learner Agent: Multi-class classification (agree/override_skip/override_take)
+
+PyTorch is imported on first use (create_agent_network() or accessing one of
+the network classes), so importing this module stays cheap when no agent is
+enabled.
 """
 
+import importlib.util
 import logging
-from typing import Optional
-
-import numpy as np
+from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
-try:
-    import torch
-    import torch.nn as nn
-    import torch.nn.functional as F
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+if not TORCH_AVAILABLE:
     logger.warning("PyTorch not available. Install with: pip install torch")
 
+# Agent name -> network class name
+_NETWORK_NAMES = {
+    "gate": "GateAgentNetwork",
+    "portfolio": "PortfolioAgentNetwork",
+    "meta_learner": "MetaLearnerAgentNetwork",
+}
 
-if TORCH_AVAILABLE:
-    class GateAgentNetwork(nn.Module):
-        """Neural network for Gate Agent.
-
-        Input: Candidate features (34 dims from state encoder)
-        Output: Binary decision (skip=0, pass=1)
-        """
-
-        def __init__(self, state_dim: int = 34, hidden_dims: list = [128, 64, 32]):
-            """Initialize gate agent network.
-
-            Args:
-                state_dim: Input state dimension
-                hidden_dims: List of hidden layer dimensions
-            """
-            super().__init__()
-
-            layers = []
-            input_dim = state_dim
-
-            # Build hidden layers
-            for hidden_dim in hidden_dims:
-                layers.append(nn.Linear(input_dim, hidden_dim))
-                layers.append(nn.ReLU())
-                layers.append(nn.Dropout(0.2))
-                input_dim = hidden_dim
-
-            # Output layer (binary classification)
-            layers.append(nn.Linear(input_dim, 2))
-
-            self.network = nn.Sequential(*layers)
-
-        def forward(self, state: torch.Tensor) -> torch.Tensor:
-            """Forward pass.
-
-            Args:
-                state: State tensor (batch_size, state_dim)
-
-            Returns:
-                Logits for skip/pass (batch_size, 2)
-            """
-            return self.network(state)
-
-        def predict(self, state: np.ndarray) -> int:
-            """Predict action for single state.
-
-            Args:
-                state: State array (state_dim,)
-
-            Returns:
-                Action: 0 = skip, 1 = pass
-            """
-            self.eval()
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                logits = self.forward(state_tensor)
-                action = torch.argmax(logits, dim=1).item()
-            return action
-
-
-    class PortfolioAgentNetwork(nn.Module):
-        """Neural network for Portfolio Agent.
-
-        Input: Candidate + LLM + Portfolio context (30 dims from state encoder)
-        Output: Position size fraction [0.0, 1.0]
-        """
-
-        def __init__(self, state_dim: int = 30, hidden_dims: list = [128, 64, 32]):
-            """Initialize portfolio agent network.
-
-            Args:
-                state_dim: Input state dimension
-                hidden_dims: List of hidden layer dimensions
-            """
-            super().__init__()
-
-            layers = []
-            input_dim = state_dim
-
-            # Build hidden layers
-            for hidden_dim in hidden_dims:
-                layers.append(nn.Linear(input_dim, hidden_dim))
-                layers.append(nn.ReLU())
-                layers.append(nn.Dropout(0.2))
-                input_dim = hidden_dim
-
-            # Output layer (single value with sigmoid for [0, 1] range)
-            layers.append(nn.Linear(input_dim, 1))
-            layers.append(nn.Sigmoid())
-
-            self.network = nn.Sequential(*layers)
-
-        def forward(self, state: torch.Tensor) -> torch.Tensor:
-            """Forward pass.
-
-            Args:
-                state: State tensor (batch_size, state_dim)
-
-            Returns:
-                Position size fractions (batch_size, 1) in [0.0, 1.0]
-            """
-            return self.network(state)
+# Network classes, loaded from _torch_networks by _ensure_torch() on first use
+_NETWORKS: Dict[str, type] = {}
 
-        def predict(self, state: np.ndarray) -> float:
-            """Predict position size for single state.
 
-            Args:
-                state: State array (state_dim,)
+def _ensure_torch() -> Dict[str, type]:
+    """Import PyTorch and the network classes (once).
 
-            Returns:
-                Position size fraction [0.0, 1.0]
-            """
-            self.eval()
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                size_fraction = self.forward(state_tensor).item()
-            return size_fraction
-
-
-    class MetaLearnerAgentNetwork(nn.Module):
-        """Neural network for Meta-Learner Agent.
-
-        Input: Candidate + LLM + History context (38 dims from state encoder)
-        Output: Action (0=agree, 1=override_to_skip, 2=override_to_take)
-        """
-
-        def __init__(self, state_dim: int = 38, hidden_dims: list = [128, 64, 32]):
-            """Initialize meta-learner agent network.
-
-            Args:
-                state_dim: Input state dimension
-                hidden_dims: List of hidden layer dimensions
-            """
-            super().__init__()
-
-            layers = []
-            input_dim = state_dim
-
-            # Build hidden layers
-            for hidden_dim in hidden_dims:
-                layers.append(nn.Linear(input_dim, hidden_dim))
-                layers.append(nn.ReLU())
-                layers.append(nn.Dropout(0.2))
-                input_dim = hidden_dim
-
-            # Output layer (3-class classification)
-            layers.append(nn.Linear(input_dim, 3))
-
-            self.network = nn.Sequential(*layers)
+    Returns:
+        Mapping of class name to network class
 
-        def forward(self, state: torch.Tensor) -> torch.Tensor:
-            """Forward pass.
+    Raises:
+        RuntimeError: If PyTorch not available
+    """
+    if _NETWORKS:
+        return _NETWORKS
 
-            Args:
-                state: State tensor (batch_size, state_dim)
+    if not TORCH_AVAILABLE:
+        raise RuntimeError("PyTorch not available. Install with: pip install torch")
 
-            Returns:
-                Logits for 3 actions (batch_size, 3)
-            """
-            return self.network(state)
+    from darwin.rl.models import _torch_networks
 
-        def predict(self, state: np.ndarray) -> int:
-            """Predict action for single state.
+    _NETWORKS.update({name: getattr(_torch_networks, name) for name in _NETWORK_NAMES.values()})
+    return _NETWORKS
 
-            Args:
-                state: State array (state_dim,)
 
-            Returns:
-                Action: 0=agree, 1=override_to_skip, 2=override_to_take
-            """
-            self.eval()
-            with torch.no_grad():
-                state_tensor = torch.FloatTensor(state).unsqueeze(0)
-                logits = self.forward(state_tensor)
-                action = torch.argmax(logits, dim=1).item()
-            return action
+def __getattr__(name: str) -> Any:
+    """Resolve the network classes lazily (PEP 562)."""
+    if name in _NETWORK_NAMES.values():
+        return _ensure_torch()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def create_agent_network(agent_name: str, **kwargs):
+def create_agent_network(agent_name: str, quantize: bool = False, **kwargs):
     """Factory function to create agent networks.
 
     Args:
         agent_name: Agent name ("gate", "portfolio", "meta_learner")
+        quantize: Return an inference-only copy with int8 dynamically
+            quantized Linear layers (default: False)
         **kwargs: Additional arguments for network construction
 
     Returns:
@@ -215,14 +75,32 @@ def create_agent_network(agent_name: str, **kwargs):
         ValueError: If agent_name is invalid
         RuntimeError: If PyTorch not available
     """
-    if not TORCH_AVAILABLE:
-        raise RuntimeError("PyTorch not available. Install with: pip install torch")
+    try:
+        class_name = _NETWORK_NAMES[agent_name]
+    except KeyError:
+        raise ValueError(f"Unknown agent name: {agent_name}") from None
+
+    network = _ensure_torch()[class_name](**kwargs)
+    if quantize:
+        network = quantize_network(network)
+    return network
+
+
+def quantize_network(network: Any) -> Any:
+    """Convert a network's Linear layers to int8 dynamic quantization.
+
+    Weights are stored as int8 and activations are quantized on the fly, so
+    the result is for CPU inference only (it cannot be trained further).
+    Load trained weights before quantizing; the quantized state dict can be
+    saved and restored into another quantized instance.
+
+    Args:
+        network: Agent network (trained weights already loaded)
+
+    Returns:
+        Quantized copy of the network in eval mode
+    """
+    import torch
+    import torch.nn as nn
 
-    if agent_name == "gate":
-        return GateAgentNetwork(**kwargs)
-    elif agent_name == "portfolio":
-        return PortfolioAgentNetwork(**kwargs)
-    elif agent_name == "meta_learner":
-        return MetaLearnerAgentNetwork(**kwargs)
-    else:
-        raise ValueError(f"Unknown agent name: {agent_name}")
+    return torch.ao.quantization.quantize_dynamic(network.eval(), {nn.Linear}, dtype=torch.qint8)
@@ -4,8 +4,6 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import numpy as np
-
 from darwin.rl.storage.agent_state import AgentStateSQLite
 
 logger = logging.getLogger(__name__)
@@ -90,6 +88,7 @@ class AgentMonitor:
         baseline_window_days: int = 90,
         recent_window_days: int = 30,
         degradation_threshold: float = 0.3,
+        now: Optional[datetime] = None,
     ) -> Optional[Alert]:
         """Check if agent performance has degraded.
 
@@ -98,48 +97,25 @@ class AgentMonitor:
             baseline_window_days: Days for baseline comparison
             recent_window_days: Days for recent performance
             degradation_threshold: Threshold for degradation (0.3 = 30% drop)
+            now: Reference time for the windows (default: current time)
 
         Returns:
             Alert if performance degraded, None otherwise
         """
-        # Get baseline performance (older window)
-        baseline_start = datetime.now() - timedelta(days=baseline_window_days)
-        baseline_end = datetime.now() - timedelta(days=recent_window_days)
-        baseline_decisions = self.agent_state.get_decisions_with_outcomes(
-            agent_name, since=baseline_start
+        # Window means are aggregated in SQL; only (mean, count) come back
+        now = now or datetime.now()
+        baseline_mean, baseline_count = self.agent_state.get_mean_r_multiple(
+            agent_name,
+            since=now - timedelta(days=baseline_window_days),
+            until=now - timedelta(days=recent_window_days),
         )
-        baseline_decisions = [
-            d for d in baseline_decisions
-            if datetime.fromisoformat(d["timestamp"]) <= baseline_end
-        ]
-
-        # Get recent performance
-        recent_start = datetime.now() - timedelta(days=recent_window_days)
-        recent_decisions = self.agent_state.get_decisions_with_outcomes(
-            agent_name, since=recent_start
+        recent_mean, recent_count = self.agent_state.get_mean_r_multiple(
+            agent_name, since=now - timedelta(days=recent_window_days)
         )
 
-        if not baseline_decisions or not recent_decisions:
+        if not baseline_count or not recent_count:
             return None  # Not enough data
 
-        # Calculate mean R-multiple for both windows
-        baseline_r = [
-            d["outcome_r_multiple"]
-            for d in baseline_decisions
-            if d["outcome_r_multiple"] is not None
-        ]
-        recent_r = [
-            d["outcome_r_multiple"]
-            for d in recent_decisions
-            if d["outcome_r_multiple"] is not None
-        ]
-
-        if not baseline_r or not recent_r:
-            return None
-
-        baseline_mean = float(np.mean(baseline_r))
-        recent_mean = float(np.mean(recent_r))
-
         # Check for degradation
         if baseline_mean > 0:  # Only check if baseline was positive
             degradation = (baseline_mean - recent_mean) / baseline_mean
@@ -156,8 +132,8 @@ class AgentMonitor:
                         "baseline_mean_r": baseline_mean,
                         "recent_mean_r": recent_mean,
                         "degradation_pct": degradation * 100,
-                        "baseline_sample_count": len(baseline_r),
-                        "recent_sample_count": len(recent_r),
+                        "baseline_sample_count": baseline_count,
+                        "recent_sample_count": recent_count,
                     },
                 )
 
@@ -168,6 +144,7 @@ class AgentMonitor:
         agent_name: str,
         window_days: int = 7,
         max_override_rate: float = 0.3,
+        now: Optional[datetime] = None,
     ) -> Optional[Alert]:
         """Check if meta-learner has excessive override rate.
 
@@ -175,6 +152,7 @@ class AgentMonitor:
             agent_name: Name of agent (should be "meta_learner")
             window_days: Days to check
             max_override_rate: Maximum acceptable override rate
+            now: Reference time for the window (default: current time)
 
         Returns:
             Alert if override rate too high, None otherwise
@@ -182,15 +160,13 @@ class AgentMonitor:
         if agent_name != "meta_learner":
             return None  # Only applies to meta-learner
 
-        since = datetime.now() - timedelta(days=window_days)
-        decisions = self.agent_state.get_decisions_with_outcomes(agent_name, since=since)
+        since = (now or datetime.now()) - timedelta(days=window_days)
+        # Count overrides (action != 0 means override) in SQL
+        overrides, total = self.agent_state.count_overrides(agent_name, since=since)
 
-        if not decisions:
+        if not total:
             return None
 
-        # Count overrides (action != 0 means override)
-        overrides = sum(1 for d in decisions if d["action"] != 0)
-        total = len(decisions)
         override_rate = overrides / total
 
         if override_rate > max_override_rate:
@@ -217,6 +193,7 @@ class AgentMonitor:
         agent_name: str,
         window_days: int = 7,
         min_decisions_per_day: float = 1.0,
+        now: Optional[datetime] = None,
     ) -> Optional[Alert]:
         """Check if agent decision rate is too low.
 
@@ -224,11 +201,12 @@ class AgentMonitor:
             agent_name: Name of agent
             window_days: Days to check
             min_decisions_per_day: Minimum expected decisions per day
+            now: Reference time for the window (default: current time)
 
         Returns:
             Alert if decision rate too low, None otherwise
         """
-        since = datetime.now() - timedelta(days=window_days)
+        since = (now or datetime.now()) - timedelta(days=window_days)
         decision_count = self.agent_state.get_decision_count(agent_name, since=since)
 
         decisions_per_day = decision_count / window_days
@@ -269,12 +247,16 @@ class AgentMonitor:
         config = config or {}
         alerts = []
 
+        # One reference time so all checks see consistent windows
+        now = datetime.now()
+
         # Check performance degradation
         alert = self.check_performance_degradation(
             agent_name,
             baseline_window_days=config.get("baseline_window_days", 90),
             recent_window_days=config.get("recent_window_days", 30),
             degradation_threshold=config.get("degradation_threshold", 0.3),
+            now=now,
         )
         if alert:
             alerts.append(alert)
@@ -285,6 +267,7 @@ class AgentMonitor:
                 agent_name,
                 window_days=config.get("override_window_days", 7),
                 max_override_rate=config.get("max_override_rate", 0.3),
+                now=now,
             )
             if alert:
                 alerts.append(alert)
@@ -294,6 +277,7 @@ class AgentMonitor:
             agent_name,
             window_days=config.get("decision_rate_window_days", 7),
             min_decisions_per_day=config.get("min_decisions_per_day", 1.0),
+            now=now,
         )
         if alert:
             alerts.append(alert)
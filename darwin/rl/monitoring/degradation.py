@@ -8,10 +8,9 @@ import logging
 from collections import deque
 from typing import Dict, Optional, Tuple
 
-import numpy as np
-
 from darwin.rl.schemas.rl_config import AgentConfigV1
 from darwin.rl.storage.agent_state import AgentStateSQLite
+from darwin.rl.utils.stats import fused_stats
 
 logger = logging.getLogger(__name__)
 
@@ -79,21 +78,19 @@ class DegradationMonitor:
         if agent_config.mode != "active":
             return False, None
 
-        # Get recent decisions with outcomes
-        all_decisions = self.agent_state_db.get_decisions_with_outcomes(agent_name)
+        # Count decisions with outcomes without fetching them
+        total_decisions = self.agent_state_db.count_decisions_with_outcomes(agent_name)
 
-        if len(all_decisions) < self.min_samples_for_check:
+        if total_decisions < self.min_samples_for_check:
             logger.debug(
                 f"Not enough samples to check degradation for {agent_name} "
-                f"({len(all_decisions)} < {self.min_samples_for_check})"
+                f"({total_decisions} < {self.min_samples_for_check})"
             )
             return False, None
 
-        # Use most recent lookback_window decisions
-        recent_decisions = all_decisions[-self.lookback_window:]
-
-        # Calculate current performance metric
-        current_metric = self._calculate_agent_metric(agent_name, recent_decisions)
+        # Metric over the most recent lookback_window decisions
+        recent_decisions = min(total_decisions, self.lookback_window)
+        current_metric = self._calculate_agent_metric(agent_name)
 
         # Calculate performance drop
         performance_drop_pct = (
@@ -105,8 +102,8 @@ class DegradationMonitor:
         # Build details
         details = {
             "agent_name": agent_name,
-            "total_decisions": len(all_decisions),
-            "recent_decisions": len(recent_decisions),
+            "total_decisions": total_decisions,
+            "recent_decisions": recent_decisions,
             "graduation_metric": graduation_metric,
             "current_metric": current_metric,
             "performance_drop_pct": performance_drop_pct,
@@ -130,45 +127,48 @@ class DegradationMonitor:
 
         return is_degraded, details
 
-    def _calculate_agent_metric(self, agent_name: str, decisions: list) -> float:
+    def _calculate_agent_metric(self, agent_name: str) -> float:
         """Calculate agent-specific performance metric.
 
+        Computed over the agent's most recent lookback_window decisions with
+        outcomes. Win rates come from SQL aggregates; the portfolio Sharpe
+        ratio uses fused_stats() on the window's R-multiples, since a
+        variance from power sums cancels badly.
+
         Args:
             agent_name: Agent name
-            decisions: List of decisions with outcomes
 
         Returns:
             Performance metric value
         """
-        if not decisions:
-            return 0.0
-
         # Agent-specific metrics (same as graduation evaluator)
         if agent_name == "gate":
             # Gate metric: Pass rate (profitable passes)
-            passes = [d for d in decisions if d["action"] == 1]
+            passes, winners = self.agent_state_db.aggregate_recent(
+                agent_name, self.lookback_window, actions=(1,)
+            )
             if not passes:
                 return 0.0
-            winners = sum(1 for d in passes if d["r_multiple"] and d["r_multiple"] > 0)
-            return winners / len(passes)
+            return winners / passes
 
         elif agent_name == "portfolio":
             # Portfolio metric: Sharpe ratio
-            r_multiples = [d["r_multiple"] for d in decisions if d["r_multiple"] is not None]
-            if len(r_multiples) < 10:
+            r_multiples = self.agent_state_db.get_r_multiples(
+                agent_name, limit=self.lookback_window
+            )
+            mean_r, std_r, _, n = fused_stats(r_multiples, ddof=1)
+            if n < 10:
                 return 0.0
-
-            mean_r = np.mean(r_multiples)
-            std_r = np.std(r_multiples, ddof=1)
             return mean_r / std_r if std_r > 1e-9 else 0.0
 
         elif agent_name == "meta_learner":
             # Meta-learner metric: Override accuracy
-            overrides = [d for d in decisions if d["action"] in [1, 2]]
+            overrides, winners = self.agent_state_db.aggregate_recent(
+                agent_name, self.lookback_window, actions=(1, 2)
+            )
             if not overrides:
                 return 0.5
-            winners = sum(1 for d in overrides if d["r_multiple"] and d["r_multiple"] > 0)
-            return winners / len(overrides)
+            return winners / overrides
 
         return 0.0
 
@@ -1,6 +1,7 @@
 """Safety mechanisms for RL agents."""
 
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
@@ -27,7 +28,8 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.timeout_seconds = timeout_seconds
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
+        # time.monotonic() of the last failure; immune to wall-clock changes
+        self.last_failure_time: Optional[float] = None
         self.is_open = False
 
     def record_success(self) -> None:
@@ -38,7 +40,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record failed operation."""
         self.failure_count += 1
-        self.last_failure_time = datetime.now()
+        self.last_failure_time = time.monotonic()
 
         if self.failure_count >= self.failure_threshold:
             self.is_open = True
@@ -57,13 +59,14 @@ class CircuitBreaker:
             return True
 
         # Check if timeout expired
-        if self.last_failure_time:
-            elapsed = (datetime.now() - self.last_failure_time).total_seconds()
-            if elapsed >= self.timeout_seconds:
-                logger.info("Circuit breaker attempting to close (timeout expired)")
-                self.is_open = False
-                self.failure_count = 0
-                return True
+        if (
+            self.last_failure_time is not None
+            and time.monotonic() - self.last_failure_time >= self.timeout_seconds
+        ):
+            logger.info("Circuit breaker attempting to close (timeout expired)")
+            self.is_open = False
+            self.failure_count = 0
+            return True
 
         return False
 
@@ -153,16 +156,13 @@ class SafetyMonitor:
         # Get max override rate from config (default 20%)
         max_override_rate = getattr(self.config, "max_override_rate", 0.2)
 
-        # Get recent decisions
+        # Count recent overrides (action != 0) in SQL
         since = datetime.now() - timedelta(minutes=window_minutes)
-        decisions = self.agent_state.get_decisions_with_outcomes(agent_name, since=since)
+        overrides, total = self.agent_state.count_overrides(agent_name, since=since)
 
-        if not decisions:
+        if not total:
             return True  # No decisions yet
 
-        # Count overrides (action != 0)
-        overrides = sum(1 for d in decisions if d["action"] != 0)
-        total = len(decisions)
         override_rate = overrides / total
 
         if override_rate > max_override_rate:
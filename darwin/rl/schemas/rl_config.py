@@ -39,6 +39,10 @@ class AgentConfigV1(BaseModel):
     enabled: bool = False
     mode: Literal["observe", "active"] = "observe"
 
+    # Fraction of candidates scored and recorded in observe mode (sampled by
+    # candidate ID); below 1.0 the agent collects graduation data slower
+    observe_sample_rate: float = Field(default=1.0, gt=0.0, le=1.0)
+
     # Model paths
     model_path: Optional[str] = None
     model_version: Optional[str] = None
@@ -5,7 +5,7 @@ import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -15,6 +15,11 @@ from darwin.rl.schemas.agent_state import (
     GraduationRecordV1,
 )
 
+# Seconds a connection waits on a locked database before raising
+_BUSY_TIMEOUT_S = 5.0
+# Page cache per connection (negative cache_size is in KiB)
+_CACHE_SIZE_KIB = 65536
+
 
 class AgentStateSQLite:
     """SQLite backend for agent state tracking.
@@ -25,18 +30,69 @@ class AgentStateSQLite:
     - Graduation records (evaluation history)
     """
 
-    def __init__(self, db_path: str | Path):
+    def __init__(self, db_path: str | Path, read_only: bool = False):
         """Initialize agent state database.
 
+        Writable connections switch the database to WAL journaling, so
+        read-only connections (e.g. graduation metrics) do not block, and are
+        not blocked by, the process recording decisions. With WAL, commits
+        only need synchronous=NORMAL to stay consistent (a power loss can drop
+        the last commits but never corrupts the file), which avoids an fsync
+        per decision write.
+
         Args:
             db_path: Path to SQLite database file
+            read_only: Open an existing database without write access
         """
         self.db_path = Path(db_path)
+        self.read_only = read_only
+
+        if read_only:
+            self.conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, timeout=_BUSY_TIMEOUT_S
+            )
+            self._configure_connection()
+            return
+
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(str(self.db_path))
-        self.conn.row_factory = sqlite3.Row
+        self.conn = sqlite3.connect(str(self.db_path), timeout=_BUSY_TIMEOUT_S)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._configure_connection()
         self._create_tables()
 
+    def _configure_connection(self) -> None:
+        """Apply the per-connection settings shared by readers and writers."""
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+
+    def data_version(self) -> Tuple[int, int]:
+        """Get a token that changes whenever the database contents change.
+
+        Combines SQLite's data_version pragma, which moves on commits from
+        other connections, with this connection's total_changes counter.
+
+        Returns:
+            Tuple of (data_version, total_changes)
+        """
+        (version,) = self.conn.execute("PRAGMA data_version").fetchone()
+        return version, self.conn.total_changes
+
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        """Create a cursor returning plain tuples instead of sqlite3.Row.
+
+        Used by the bulk read paths, which unpack rows positionally or into
+        arrays. Statements are still compiled once per connection through
+        sqlite3's statement cache.
+
+        Returns:
+            Cursor on the shared connection
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
+
     def _create_tables(self) -> None:
         """Create tables if they don't exist."""
         # Agent decisions table
@@ -106,6 +162,14 @@ class AgentStateSQLite:
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_decisions_run ON agent_decisions(run_id)"
         )
+        # Covers the time-ranged metric reads (action, outcome_r_multiple by
+        # agent and timestamp) without touching the table rows
+        self.conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_decisions_agent_ts
+            ON agent_decisions(agent_name, timestamp, outcome_r_multiple, action)
+            """
+        )
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_snapshots_agent ON performance_snapshots(agent_name)"
         )
@@ -115,35 +179,60 @@ class AgentStateSQLite:
 
         self.conn.commit()
 
+    _INSERT_DECISION = """
+        INSERT OR REPLACE INTO agent_decisions (
+            agent_name, candidate_id, run_id, timestamp,
+            state_hash, action, mode, model_version,
+            outcome_r_multiple, outcome_pnl_usd
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _decision_params(decision: AgentDecisionV1) -> tuple:
+        """Build the INSERT parameters for a decision.
+
+        Args:
+            decision: Agent decision record
+
+        Returns:
+            Parameter tuple for _INSERT_DECISION
+        """
+        return (
+            decision.agent_name,
+            decision.candidate_id,
+            decision.run_id,
+            decision.timestamp.isoformat(),
+            decision.state_hash,
+            decision.action,
+            decision.mode,
+            decision.model_version,
+            decision.outcome_r_multiple,
+            decision.outcome_pnl_usd,
+        )
+
     def record_decision(self, decision: AgentDecisionV1) -> None:
         """Record a single agent decision.
 
         Args:
             decision: Agent decision record
         """
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO agent_decisions (
-                agent_name, candidate_id, run_id, timestamp,
-                state_hash, action, mode, model_version,
-                outcome_r_multiple, outcome_pnl_usd
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                decision.agent_name,
-                decision.candidate_id,
-                decision.run_id,
-                decision.timestamp.isoformat(),
-                decision.state_hash,
-                decision.action,
-                decision.mode,
-                decision.model_version,
-                decision.outcome_r_multiple,
-                decision.outcome_pnl_usd,
-            ),
-        )
+        self.conn.execute(self._INSERT_DECISION, self._decision_params(decision))
         self.conn.commit()
 
+    def record_decisions(self, decisions: Sequence[AgentDecisionV1]) -> None:
+        """Record several agent decisions in one transaction.
+
+        Args:
+            decisions: Agent decision records
+        """
+        if not decisions:
+            return
+
+        with self.conn:
+            self.conn.executemany(
+                self._INSERT_DECISION, [self._decision_params(d) for d in decisions]
+            )
+
     def update_decision_outcome(
         self,
         agent_name: str,
@@ -169,6 +258,37 @@ class AgentStateSQLite:
         )
         self.conn.commit()
 
+    def update_decision_outcomes(
+        self,
+        agent_names: Sequence[str],
+        candidate_id: str,
+        outcome_r_multiple: Optional[float],
+        outcome_pnl_usd: Optional[float],
+    ) -> None:
+        """Update the outcome of one candidate for several agents at once.
+
+        Every agent that decided on a candidate shares the trade's outcome,
+        so a single UPDATE and commit covers all of them.
+
+        Args:
+            agent_names: Names of the agents whose decisions to update
+            candidate_id: Candidate identifier
+            outcome_r_multiple: Realized R-multiple
+            outcome_pnl_usd: Realized PnL in USD
+        """
+        if not agent_names:
+            return
+
+        self.conn.execute(
+            f"""
+            UPDATE agent_decisions
+            SET outcome_r_multiple = ?, outcome_pnl_usd = ?
+            WHERE candidate_id = ? AND agent_name IN ({', '.join('?' * len(agent_names))})
+            """,
+            (outcome_r_multiple, outcome_pnl_usd, candidate_id, *agent_names),
+        )
+        self.conn.commit()
+
     def get_decisions(
         self,
         agent_name: str,
@@ -385,6 +505,88 @@ class AgentStateSQLite:
         row = cursor.fetchone()
         return row["count"] if row else 0
 
+    def get_decision_count_split(self, agent_name: str, since: datetime) -> Tuple[int, int]:
+        """Get total and recent decision counts for an agent in one query.
+
+        Args:
+            agent_name: Name of the agent
+            since: Start date of the recent period
+
+        Returns:
+            Tuple of (total, recent) where recent counts decisions at or
+            after since
+        """
+        total, recent = self.conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(timestamp >= ?), 0)
+            FROM agent_decisions
+            WHERE agent_name = ?
+            """,
+            (since.isoformat(), agent_name),
+        ).fetchone()
+        return total, recent
+
+    def get_decision_count_splits(
+        self, agent_names: Sequence[str], since: datetime
+    ) -> Dict[str, Tuple[int, int]]:
+        """Get total and recent decision counts for several agents in one query.
+
+        Args:
+            agent_names: Names of the agents
+            since: Start date of the recent period
+
+        Returns:
+            Mapping of agent name to (total, recent); agents without
+            decisions map to (0, 0)
+        """
+        counts = dict.fromkeys(agent_names, (0, 0))
+        if not counts:
+            return counts
+
+        rows = self._tuple_cursor().execute(
+            f"""
+            SELECT agent_name, COUNT(*), COALESCE(SUM(timestamp >= ?), 0)
+            FROM agent_decisions
+            WHERE agent_name IN ({', '.join('?' * len(counts))})
+            GROUP BY agent_name
+            """,
+            (since.isoformat(), *counts),
+        )
+        for agent_name, total, recent in rows:
+            counts[agent_name] = (total, recent)
+        return counts
+
+    def count_decisions_with_outcomes(
+        self,
+        agent_name: str,
+        since: Optional[datetime] = None,
+    ) -> int:
+        """Get count of decisions with outcomes for an agent.
+
+        Equivalent to len(get_decisions_with_outcomes(...)) without fetching
+        the rows.
+
+        Args:
+            agent_name: Name of the agent
+            since: Optional start date filter
+
+        Returns:
+            Count of decisions with outcomes
+        """
+        query = """
+            SELECT COUNT(*) as count FROM agent_decisions
+            WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+        """
+        params: List[str] = [agent_name]
+
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since.isoformat())
+
+        cursor = self.conn.execute(query, params)
+        row = cursor.fetchone()
+        return row["count"] if row else 0
+
     def get_decisions_with_outcomes(
         self,
         agent_name: str,
@@ -420,10 +622,260 @@ class AgentStateSQLite:
 
         query += " ORDER BY timestamp DESC"
 
-        cursor = self.conn.execute(query, params)
-        rows = cursor.fetchall()
+        cursor = self._tuple_cursor()
+        rows = cursor.execute(query, params).fetchall()
+
+        # zip() over plain tuples is cheaper than converting sqlite3.Row objects
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row, strict=True)) for row in rows]
+
+    def count_overrides(
+        self,
+        agent_name: str,
+        since: Optional[datetime] = None,
+    ) -> Tuple[int, int]:
+        """Count decisions with outcomes and how many were overrides.
 
-        return [dict(row) for row in rows]
+        An override is any non-zero action. Same rows as
+        get_decisions_with_outcomes(), aggregated inside SQLite.
+
+        Args:
+            agent_name: Name of the agent
+            since: Optional start date filter
+
+        Returns:
+            Tuple of (overrides, total)
+        """
+        query = """
+            SELECT COALESCE(SUM(action != 0), 0), COUNT(*)
+            FROM agent_decisions
+            WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+        """
+        params: List[str] = [agent_name]
+
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since.isoformat())
+
+        overrides, total = self._tuple_cursor().execute(query, params).fetchone()
+        return overrides, total
+
+    def aggregate_recent(
+        self,
+        agent_name: str,
+        limit: int,
+        actions: Optional[Tuple[float, ...]] = None,
+    ) -> Tuple[int, int]:
+        """Count decisions and wins over an agent's most recent outcomes.
+
+        Takes the ``limit`` newest decisions with outcomes, optionally keeps
+        only those whose action is in ``actions``, and counts inside SQLite,
+        so only two scalars are returned.
+
+        Args:
+            agent_name: Name of the agent
+            limit: Number of most recent decisions with outcomes to consider
+            actions: Optional action values to restrict the aggregate to
+
+        Returns:
+            Tuple of (count, wins) where wins have outcome_r_multiple > 0
+        """
+        query = """
+            SELECT COUNT(*), COALESCE(SUM(outcome_r_multiple > 0), 0)
+            FROM (
+                SELECT action, outcome_r_multiple
+                FROM agent_decisions
+                WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+                ORDER BY timestamp DESC
+                LIMIT ?
+            )
+        """
+        params: List = [agent_name, limit]
+
+        if actions is not None:
+            query += f" WHERE action IN ({', '.join('?' * len(actions))})"
+            params.extend(actions)
+
+        count, wins = self._tuple_cursor().execute(query, params).fetchone()
+        return count, wins
+
+    def fetch_action_r(
+        self,
+        agent_name: str,
+        since: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get actions and R-multiples of decisions with outcomes as arrays.
+
+        Narrow counterpart of get_decisions_with_outcomes() for metric
+        calculations: only the two numeric columns are read, in the same
+        (timestamp descending) order, without building a dict per row.
+
+        Args:
+            agent_name: Name of the agent
+            since: Optional start date filter
+
+        Returns:
+            Tuple of (actions, r_multiples), both float64 arrays
+        """
+        query = """
+            SELECT action, outcome_r_multiple
+            FROM agent_decisions
+            WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+        """
+        params: List[str] = [agent_name]
+
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since.isoformat())
+
+        query += " ORDER BY timestamp DESC"
+
+        cursor = self._tuple_cursor()
+        rows = cursor.execute(query, params).fetchall()
+
+        data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+        return data[:, 0], data[:, 1]
+
+    def get_r_multiples(
+        self,
+        agent_name: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """Get R-multiples of decisions with outcomes as an array.
+
+        Same rows and order (timestamp descending) as
+        get_decisions_with_outcomes(), reading only the R-multiple column
+        straight from the cursor into a float64 array.
+
+        Args:
+            agent_name: Name of the agent
+            since: Optional start date filter
+            until: Optional end date filter
+            limit: Optional maximum number of (most recent) values
+
+        Returns:
+            Float64 array of R-multiples
+        """
+        query = """
+            SELECT outcome_r_multiple
+            FROM agent_decisions
+            WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+        """
+        params: List[str] = [agent_name]
+
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since.isoformat())
+
+        if until:
+            query += " AND timestamp <= ?"
+            params.append(until.isoformat())
+
+        query += " ORDER BY timestamp DESC"
+
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self._tuple_cursor()
+        # Stream rows into the array; no intermediate list of 1-tuples
+        rows = cursor.execute(query, params)
+        return np.fromiter((row[0] for row in rows), dtype=np.float64)
+
+    def get_mean_r_multiple(
+        self,
+        agent_name: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Tuple[Optional[float], int]:
+        """Get the mean R-multiple and count of decisions with outcomes.
+
+        Aggregated in SQL, so only two scalars cross into Python.
+
+        Args:
+            agent_name: Name of the agent
+            since: Optional start date filter
+            until: Optional end date filter
+
+        Returns:
+            Tuple of (mean R-multiple or None if no rows, row count)
+        """
+        query = """
+            SELECT AVG(outcome_r_multiple), COUNT(outcome_r_multiple)
+            FROM agent_decisions
+            WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+        """
+        params: List[str] = [agent_name]
+
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since.isoformat())
+
+        if until:
+            query += " AND timestamp <= ?"
+            params.append(until.isoformat())
+
+        mean_r, count = self._tuple_cursor().execute(query, params).fetchone()
+        return mean_r, count
+
+    def get_outcomes_bulk(
+        self,
+        agent_name: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Get timestamps and R-multiples of decisions with outcomes in one query.
+
+        Lets windowed metrics fetch their whole span once and bucket rows in
+        NumPy instead of issuing one get_decisions_with_outcomes() per window.
+        Bounds are inclusive, as in get_decisions_with_outcomes().
+
+        Args:
+            agent_name: Name of the agent
+            since: Start of the span
+            until: Optional end of the span
+
+        Returns:
+            Float64 array of shape (N, 2) holding (epoch seconds, R-multiple)
+            rows in ascending timestamp order
+        """
+        query = """
+            SELECT timestamp, outcome_r_multiple
+            FROM agent_decisions
+            WHERE agent_name = ? AND outcome_r_multiple IS NOT NULL
+              AND timestamp >= ?
+        """
+        params: List[str] = [agent_name, since.isoformat()]
+
+        if until:
+            query += " AND timestamp <= ?"
+            params.append(until.isoformat())
+
+        query += " ORDER BY timestamp"
+
+        cursor = self._tuple_cursor()
+        rows = cursor.execute(query, params).fetchall()
+
+        out = np.empty((len(rows), 2), dtype=np.float64)
+        if rows:
+            timestamps, r_multiples = zip(*rows, strict=True)
+            out[:, 0] = np.array(timestamps, dtype="datetime64[us]").astype(np.int64) / 1e6
+            out[:, 1] = r_multiples
+        return out
+
+    @staticmethod
+    def to_epoch(timestamp: datetime) -> float:
+        """Convert a naive timestamp to the epoch seconds used by get_outcomes_bulk().
+
+        Args:
+            timestamp: Timestamp to convert
+
+        Returns:
+            Seconds since the epoch
+        """
+        return np.datetime64(timestamp, "us").astype(np.int64) / 1e6
 
     @staticmethod
     def hash_state(state: np.ndarray) -> str:
@@ -435,9 +887,14 @@ class AgentStateSQLite:
         Returns:
             Hex hash string
         """
-        state_bytes = state.tobytes()
-        return hashlib.sha256(state_bytes).hexdigest()[:16]
+        # hashlib reads the array's buffer directly; no tobytes() copy
+        return hashlib.sha256(np.ascontiguousarray(state)).hexdigest()[:16]
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection.
+
+        In WAL mode the database keeps -wal and -shm sidecar files next to
+        it while connections are open; the last writer to close checkpoints
+        the log back into the main file and removes them.
+        """
         self.conn.close()
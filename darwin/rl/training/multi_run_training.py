@@ -93,7 +93,9 @@ class MultiRunTrainer:
         stats = {
             "total_runs": len(self.databases),
             "total_decisions": self.get_combined_decision_count(agent_name),
-            "total_with_outcomes": len(self.get_combined_decisions(agent_name)),
+            "total_with_outcomes": sum(
+                db.count_decisions_with_outcomes(agent_name) for db in self.databases
+            ),
             "runs": [],
         }
 
@@ -102,7 +104,7 @@ class MultiRunTrainer:
                 "run_index": i + 1,
                 "db_path": self.db_paths[i],
                 "total_decisions": db.get_decision_count(agent_name),
-                "decisions_with_outcomes": len(db.get_decisions_with_outcomes(agent_name)),
+                "decisions_with_outcomes": db.count_decisions_with_outcomes(agent_name),
             }
             stats["runs"].append(run_stat)
 
@@ -1,13 +1,13 @@
 """Offline batch training for RL agents from historical data."""
 
+from __future__ import annotations
+
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import DummyVecEnv
 
 from darwin.rl.envs.gate_env import ReplayGateEnv
 from darwin.rl.schemas.training_episode import TrainingBatchV1, TrainingRunV1
@@ -16,6 +16,9 @@ from darwin.schemas.outcome_label import OutcomeLabelV1
 from darwin.storage.candidate_cache import CandidateCacheSQLite
 from darwin.storage.outcome_labels import OutcomeLabelsSQLite
 
+if TYPE_CHECKING:
+    from stable_baselines3 import PPO
+
 logger = logging.getLogger(__name__)
 
 
@@ -168,6 +171,10 @@ class OfflineBatchTrainer:
         logger.info(f"Validation episodes: {len(val_episodes)}")
         logger.info(f"Total timesteps: {total_timesteps}")
 
+        # Deferred so importing this module does not pull in torch
+        from stable_baselines3 import PPO
+        from stable_baselines3.common.vec_env import DummyVecEnv
+
         # Create vectorized environment
         def make_env():
             env = self.env_class(episodes=train_episodes)
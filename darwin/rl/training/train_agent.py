@@ -72,18 +72,21 @@ class AgentTrainer:
             logger.info(f"   Need {min_candidates - total_decisions} more candidates")
             return False
 
-        # Step 1: Check if we have enough data to train
-        decisions_with_outcomes = self.agent_state_db.get_decisions_with_outcomes(agent_name)
-        logger.info(f"Decisions with outcomes: {len(decisions_with_outcomes)}")
+        # Step 1: Check if we have enough data to train (count only; rows are
+        # fetched once we know training will run)
+        num_with_outcomes = self.agent_state_db.count_decisions_with_outcomes(agent_name)
+        logger.info(f"Decisions with outcomes: {num_with_outcomes}")
 
         min_training_samples = agent_config.graduation_thresholds.min_training_samples
-        if len(decisions_with_outcomes) < min_training_samples:
+        if num_with_outcomes < min_training_samples:
             logger.info(
                 f"❌ Not enough training samples yet "
-                f"({len(decisions_with_outcomes)} < {min_training_samples})"
+                f"({num_with_outcomes} < {min_training_samples})"
             )
             return False
 
+        decisions_with_outcomes = self.agent_state_db.get_decisions_with_outcomes(agent_name)
+
         # Step 2: Train model (placeholder for now)
         logger.info("Training model...")
         model_trained = self._train_model(agent_name, decisions_with_outcomes)
@@ -5,6 +5,18 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Portfolio reward terms, shared with the closed-form and vectorized rewards
+# in PortfolioEnv so the three implementations cannot drift apart
+PORTFOLIO_DRAWDOWN_THRESHOLD_BPS = -500.0  # 5% 24h drawdown
+PORTFOLIO_DRAWDOWN_PENALTY = 0.1
+PORTFOLIO_DIVERSIFICATION_BONUS = 0.05
+PORTFOLIO_DIVERSIFICATION_RANGE = (0.3, 0.7)
+PORTFOLIO_CAPACITY_BONUS = 0.02
+PORTFOLIO_CAPACITY_MIN_SIZE = 0.5
+PORTFOLIO_OVERSIZE_PENALTY = 0.05
+PORTFOLIO_OVERSIZE_MIN_SIZE = 0.3
+PORTFOLIO_DEFAULT_MAX_EXPOSURE_FRAC = 0.8
+
 
 def compute_gate_reward(
     action: int,
@@ -86,9 +98,9 @@ def compute_portfolio_reward(
     position_size_fraction: float,
     portfolio_state: dict,
     caused_drawdown: bool = False,
-    drawdown_penalty: float = 0.1,
-    diversification_bonus: float = 0.05,
-    capacity_bonus: float = 0.02,
+    drawdown_penalty: float = PORTFOLIO_DRAWDOWN_PENALTY,
+    diversification_bonus: float = PORTFOLIO_DIVERSIFICATION_BONUS,
+    capacity_bonus: float = PORTFOLIO_CAPACITY_BONUS,
 ) -> float:
     """Compute reward for portfolio agent decision.
 
@@ -120,23 +132,49 @@ def compute_portfolio_reward(
 
     # Diversification bonus (placeholder - would need portfolio analysis)
     # For now, just reward moderate sizing vs all-in
-    if 0.3 <= position_size_fraction <= 0.7:
+    low, high = PORTFOLIO_DIVERSIFICATION_RANGE
+    if low <= position_size_fraction <= high:
         reward += diversification_bonus
 
     # Capacity utilization bonus
-    exposure_frac = portfolio_state.get("exposure_frac", 0.0)
-    max_exposure_frac = portfolio_state.get("max_exposure_frac", 0.8)
+    has_capacity = portfolio_has_capacity(portfolio_state)
 
-    if exposure_frac < max_exposure_frac and position_size_fraction > 0.5:
+    if has_capacity and position_size_fraction > PORTFOLIO_CAPACITY_MIN_SIZE:
         # Good use of available capacity
         reward += capacity_bonus
-    elif exposure_frac >= max_exposure_frac and position_size_fraction > 0.3:
+    elif not has_capacity and position_size_fraction > PORTFOLIO_OVERSIZE_MIN_SIZE:
         # Oversizing when capacity is low
-        reward -= 0.05
+        reward -= PORTFOLIO_OVERSIZE_PENALTY
 
     return reward
 
 
+def portfolio_caused_drawdown(portfolio_state: dict) -> bool:
+    """Check whether a portfolio state is in a large 24h drawdown.
+
+    Args:
+        portfolio_state: Portfolio state dict
+
+    Returns:
+        True if dd_24h_bps is below PORTFOLIO_DRAWDOWN_THRESHOLD_BPS
+    """
+    return portfolio_state.get("dd_24h_bps", 0.0) < PORTFOLIO_DRAWDOWN_THRESHOLD_BPS
+
+
+def portfolio_has_capacity(portfolio_state: dict) -> bool:
+    """Check whether a portfolio has exposure capacity left.
+
+    Args:
+        portfolio_state: Portfolio state dict
+
+    Returns:
+        True if exposure_frac is below max_exposure_frac
+    """
+    return portfolio_state.get("exposure_frac", 0.0) < portfolio_state.get(
+        "max_exposure_frac", PORTFOLIO_DEFAULT_MAX_EXPOSURE_FRAC
+    )
+
+
 def compute_meta_learner_reward(
     action: int,
     llm_decision: str,
@@ -4,7 +4,7 @@ Convert candidate features into state vectors for different agent types.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -12,6 +12,47 @@ from darwin.schemas.candidate import CandidateRecordV1, PlaybookType
 
 logger = logging.getLogger(__name__)
 
+# Setup quality encoding: C=0, B=1, A=2, A+=3
+_SETUP_QUALITY_MAP = {"C": 0, "B": 1, "A": 2, "A+": 3}
+
+
+def _slots(
+    feature_names: List[str], predicate: Callable[[str], bool]
+) -> Tuple[np.ndarray, List[str]]:
+    """Select the state slots whose feature name matches a predicate.
+
+    Args:
+        feature_names: Ordered feature names of an encoder
+        predicate: Selects which names belong to the group
+
+    Returns:
+        Tuple of (slot indices, feature names) for the group
+    """
+    names = [name for name in feature_names if predicate(name)]
+    indices = np.array([feature_names.index(name) for name in names], dtype=np.intp)
+    return indices, names
+
+
+def _state_buffer(state_dim: int, out: Optional[np.ndarray]) -> np.ndarray:
+    """Return a zeroed state vector, reusing ``out`` when given.
+
+    Args:
+        state_dim: State dimension
+        out: Optional preallocated float32 buffer of shape (state_dim,)
+
+    Returns:
+        Zeroed state buffer
+    """
+    if out is None:
+        return np.zeros(state_dim, dtype=np.float32)
+    if out.shape != (state_dim,) or out.dtype != np.float32:
+        raise ValueError(
+            f"out must be a float32 array of shape ({state_dim},), "
+            f"got {out.dtype} array of shape {out.shape}"
+        )
+    out.fill(0.0)
+    return out
+
 
 class StateEncoder:
     """Base class for state encoders."""
@@ -21,9 +62,12 @@ class StateEncoder:
         self.feature_names: list[str] = []
         self.state_dim: int = 0
 
-    def encode(self, *args: Any, **kwargs: Any) -> np.ndarray:
+    def encode(self, *args: Any, out: Optional[np.ndarray] = None, **kwargs: Any) -> np.ndarray:
         """Encode inputs to state vector.
 
+        Args:
+            out: Optional float32 buffer of shape (state_dim,) to write into
+
         Returns:
             State numpy array of shape (state_dim,)
         """
@@ -93,43 +137,55 @@ class GateStateEncoder(StateEncoder):
         ]
         self.state_dim = len(self.feature_names)
 
+        # Resolve the per-name dispatch once; encode() then fills each group
+        # of slots with a single array assignment
+        portfolio_names = {"open_positions", "exposure_frac", "dd_24h_bps", "halt_flag"}
+        self._playbook_idx = self.feature_names.index("playbook_type")
+        self._direction_idx = self.feature_names.index("direction")
+        self._portfolio_idx, self._portfolio_names = _slots(
+            self.feature_names, lambda name: name in portfolio_names
+        )
+        self._feature_idx, self._feature_names = _slots(
+            self.feature_names,
+            lambda name: name not in portfolio_names and name not in ("playbook_type", "direction"),
+        )
+
     def encode(
         self,
         candidate: CandidateRecordV1,
         portfolio_state: Optional[Dict[str, Any]] = None,
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Encode candidate to gate agent state.
 
         Args:
             candidate: Candidate record with features
             portfolio_state: Optional portfolio state dict
+            out: Optional float32 buffer of shape (state_dim,) to write into
 
         Returns:
             State array of shape (35,)
         """
-        state = np.zeros(self.state_dim, dtype=np.float32)
+        state = _state_buffer(self.state_dim, out)
         features = candidate.features
 
-        # Extract features with defaults
-        for i, name in enumerate(self.feature_names):
-            if name == "playbook_type":
-                # Encode playbook type: breakout=0, pullback=1
-                state[i] = 0.0 if candidate.playbook == PlaybookType.BREAKOUT else 1.0
-            elif name == "direction":
-                # Encode direction: long=1, short=-1
-                state[i] = 1.0 if candidate.direction == "long" else -1.0
-            elif name in ["open_positions", "exposure_frac", "dd_24h_bps", "halt_flag"]:
-                # Portfolio context from external state
-                if portfolio_state:
-                    state[i] = float(portfolio_state.get(name, 0.0))
-                else:
-                    state[i] = 0.0
-            else:
-                # Feature from candidate
-                state[i] = float(features.get(name, 0.0))
-
-        # Handle NaN/Inf
-        state = np.nan_to_num(state, nan=0.0, posinf=1e6, neginf=-1e6)
+        # Encode playbook type: breakout=0, pullback=1
+        state[self._playbook_idx] = 0.0 if candidate.playbook == PlaybookType.BREAKOUT else 1.0
+        # Encode direction: long=1, short=-1
+        state[self._direction_idx] = 1.0 if candidate.direction == "long" else -1.0
+
+        # Portfolio context from external state
+        if portfolio_state:
+            state[self._portfolio_idx] = [
+                float(portfolio_state.get(name, 0.0)) for name in self._portfolio_names
+            ]
+
+        # Features from candidate, with defaults
+        state[self._feature_idx] = [float(features.get(name, 0.0)) for name in self._feature_names]
+
+        # Handle NaN/Inf (nan_to_num is costly, so only when needed)
+        if not np.isfinite(state).all():
+            np.nan_to_num(state, copy=False, nan=0.0, posinf=1e6, neginf=-1e6)
 
         return state
 
@@ -185,11 +241,20 @@ class PortfolioStateEncoder(StateEncoder):
         ]
         self.state_dim = len(self.feature_names)
 
+        # Resolve the per-name dispatch once (see GateStateEncoder)
+        llm_names = ("llm_confidence", "llm_setup_quality", "llm_has_risk_flags", "llm_decision")
+        self._direction_idx = self.feature_names.index("direction")
+        self._llm_idx = [self.feature_names.index(name) for name in llm_names]
+        self._value_idx, self._value_names = _slots(
+            self.feature_names, lambda name: name != "direction" and name not in llm_names
+        )
+
     def encode(
         self,
         candidate: CandidateRecordV1,
         llm_response: Dict[str, Any],
         portfolio_state: Dict[str, Any],
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Encode candidate + LLM + portfolio to portfolio agent state.
 
@@ -197,51 +262,38 @@ class PortfolioStateEncoder(StateEncoder):
             candidate: Candidate record
             llm_response: LLM response dict
             portfolio_state: Portfolio state dict
+            out: Optional float32 buffer of shape (state_dim,) to write into
 
         Returns:
             State array of shape (30,)
         """
-        state = np.zeros(self.state_dim, dtype=np.float32)
-        features = candidate.features
+        state = _state_buffer(self.state_dim, out)
+
+        state[self._direction_idx] = 1.0 if candidate.direction == "long" else -1.0
+        state[self._llm_idx] = [
+            float(llm_response.get("confidence", 0.5)),
+            float(_SETUP_QUALITY_MAP.get(llm_response.get("setup_quality", "C"), 0)),
+            1.0 if llm_response.get("risk_flags", []) else 0.0,
+            1.0 if llm_response.get("decision", "skip") == "take" else 0.0,
+        ]
 
-        for i, name in enumerate(self.feature_names):
-            if name == "direction":
-                state[i] = 1.0 if candidate.direction == "long" else -1.0
-            elif name == "llm_confidence":
-                state[i] = float(llm_response.get("confidence", 0.5))
-            elif name == "llm_setup_quality":
-                # Encode quality: C=0, B=1, A=2, A+=3
-                quality = llm_response.get("setup_quality", "C")
-                quality_map = {"C": 0, "B": 1, "A": 2, "A+": 3}
-                state[i] = float(quality_map.get(quality, 0))
-            elif name == "llm_has_risk_flags":
-                risk_flags = llm_response.get("risk_flags", [])
-                state[i] = 1.0 if risk_flags else 0.0
-            elif name == "llm_decision":
-                decision = llm_response.get("decision", "skip")
-                state[i] = 1.0 if decision == "take" else 0.0
-            elif name in portfolio_state:
-                state[i] = float(portfolio_state[name])
-            elif name in ["stop_dist_atr", "tp_dist_atr", "risk_reward_ratio"]:
-                # Compute from exit spec
-                entry = candidate.entry_price
-                stop = candidate.exit_spec.stop_loss_price
-                tp = candidate.exit_spec.take_profit_price
-                atr = candidate.atr_at_entry
-
-                if name == "stop_dist_atr":
-                    state[i] = abs(entry - stop) / atr if atr > 0 else 0.0
-                elif name == "tp_dist_atr":
-                    state[i] = abs(tp - entry) / atr if atr > 0 else 0.0
-                elif name == "risk_reward_ratio":
-                    stop_dist = abs(entry - stop)
-                    tp_dist = abs(tp - entry)
-                    state[i] = tp_dist / stop_dist if stop_dist > 0 else 0.0
-            else:
-                state[i] = float(features.get(name, 0.0))
-
-        # Handle NaN/Inf
-        state = np.nan_to_num(state, nan=0.0, posinf=1e6, neginf=-1e6)
+        # Risk specification from exit spec
+        entry = candidate.entry_price
+        atr = candidate.atr_at_entry
+        stop_dist = abs(entry - candidate.exit_spec.stop_loss_price)
+        tp_dist = abs(candidate.exit_spec.take_profit_price - entry)
+
+        # Remaining slots: portfolio state wins, then risk spec, then candidate features
+        values = dict(candidate.features)
+        values["stop_dist_atr"] = stop_dist / atr if atr > 0 else 0.0
+        values["tp_dist_atr"] = tp_dist / atr if atr > 0 else 0.0
+        values["risk_reward_ratio"] = tp_dist / stop_dist if stop_dist > 0 else 0.0
+        values.update(portfolio_state)
+        state[self._value_idx] = [float(values.get(name, 0.0)) for name in self._value_names]
+
+        # Handle NaN/Inf (nan_to_num is costly, so only when needed)
+        if not np.isfinite(state).all():
+            np.nan_to_num(state, copy=False, nan=0.0, posinf=1e6, neginf=-1e6)
 
         return state
 
@@ -305,12 +357,30 @@ class MetaLearnerStateEncoder(StateEncoder):
         ]
         self.state_dim = len(self.feature_names)
 
+        # Resolve the per-name dispatch once (see GateStateEncoder)
+        llm_names = (
+            "llm_decision",
+            "llm_confidence",
+            "llm_setup_quality",
+            "llm_risk_flags_count",
+            "llm_response_time_ms",
+            "llm_has_notes",
+        )
+        self._direction_idx = self.feature_names.index("direction")
+        self._playbook_idx = self.feature_names.index("playbook_type")
+        self._llm_idx = [self.feature_names.index(name) for name in llm_names]
+        self._value_idx, self._value_names = _slots(
+            self.feature_names,
+            lambda name: name not in ("direction", "playbook_type") and name not in llm_names,
+        )
+
     def encode(
         self,
         candidate: CandidateRecordV1,
         llm_response: Dict[str, Any],
         llm_history: Dict[str, Any],
         portfolio_state: Dict[str, Any],
+        out: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Encode candidate + LLM + history to meta-learner state.
 
@@ -319,54 +389,35 @@ class MetaLearnerStateEncoder(StateEncoder):
             llm_response: LLM response dict
             llm_history: LLM historical performance dict
             portfolio_state: Portfolio state dict
+            out: Optional float32 buffer of shape (state_dim,) to write into
 
         Returns:
             State array of shape (38,)
         """
-        state = np.zeros(self.state_dim, dtype=np.float32)
-        features = candidate.features
+        state = _state_buffer(self.state_dim, out)
+
+        state[self._direction_idx] = 1.0 if candidate.direction == "long" else -1.0
+        state[self._playbook_idx] = 0.0 if candidate.playbook == PlaybookType.BREAKOUT else 1.0
+        state[self._llm_idx] = [
+            1.0 if llm_response.get("decision", "skip") == "take" else 0.0,
+            float(llm_response.get("confidence", 0.5)),
+            float(_SETUP_QUALITY_MAP.get(llm_response.get("setup_quality", "C"), 0)),
+            float(len(llm_response.get("risk_flags", []))),
+            float(llm_response.get("response_time_ms", 0.0)),
+            1.0 if llm_response.get("notes", "") else 0.0,
+        ]
 
-        for i, name in enumerate(self.feature_names):
-            if name == "direction":
-                state[i] = 1.0 if candidate.direction == "long" else -1.0
-            elif name == "playbook_type":
-                state[i] = 0.0 if candidate.playbook == PlaybookType.BREAKOUT else 1.0
-            elif name == "llm_decision":
-                decision = llm_response.get("decision", "skip")
-                state[i] = 1.0 if decision == "take" else 0.0
-            elif name == "llm_confidence":
-                state[i] = float(llm_response.get("confidence", 0.5))
-            elif name == "llm_setup_quality":
-                quality = llm_response.get("setup_quality", "C")
-                quality_map = {"C": 0, "B": 1, "A": 2, "A+": 3}
-                state[i] = float(quality_map.get(quality, 0))
-            elif name == "llm_risk_flags_count":
-                risk_flags = llm_response.get("risk_flags", [])
-                state[i] = float(len(risk_flags))
-            elif name == "llm_response_time_ms":
-                state[i] = float(llm_response.get("response_time_ms", 0.0))
-            elif name == "llm_has_notes":
-                notes = llm_response.get("notes", "")
-                state[i] = 1.0 if notes else 0.0
-            elif name in llm_history:
-                # LLM historical metrics
-                state[i] = float(llm_history[name])
-            elif name in portfolio_state:
-                # Portfolio context
-                state[i] = float(portfolio_state[name])
-            elif name == "time_of_day":
-                # Normalize hour to [0, 1]
-                hour = candidate.timestamp.hour
-                state[i] = hour / 24.0
-            elif name == "day_of_week":
-                # Normalize day to [0, 1]
-                day = candidate.timestamp.weekday()
-                state[i] = day / 7.0
-            else:
-                # Candidate feature
-                state[i] = float(features.get(name, 0.0))
-
-        # Handle NaN/Inf
-        state = np.nan_to_num(state, nan=0.0, posinf=1e6, neginf=-1e6)
+        # Remaining slots: LLM history wins, then portfolio state, then
+        # time-of-day/day-of-week (normalized to [0, 1]), then candidate features
+        values = dict(candidate.features)
+        values["time_of_day"] = candidate.timestamp.hour / 24.0
+        values["day_of_week"] = candidate.timestamp.weekday() / 7.0
+        values.update(portfolio_state)
+        values.update(llm_history)
+        state[self._value_idx] = [float(values.get(name, 0.0)) for name in self._value_names]
+
+        # Handle NaN/Inf (nan_to_num is costly, so only when needed)
+        if not np.isfinite(state).all():
+            np.nan_to_num(state, copy=False, nan=0.0, posinf=1e6, neginf=-1e6)
 
         return state
@@ -0,0 +1,93 @@
+"""Summary statistics shared by graduation metrics and baselines."""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+# Below this length NumPy's per-call dispatch costs more than the arithmetic
+# itself (e.g. the 10-50 decision windows of graduation stability checks)
+_SMALL_N = 32
+
+
+def _fused_stats_small(values: np.ndarray, ddof: int) -> Tuple[float, float, int, int]:
+    """Pure-Python fused_stats() for short arrays."""
+    data = [x for x in values.tolist() if x == x]  # x != x only for NaN
+    n = len(data)
+    if n == 0:
+        return 0.0, 0.0, 0, 0
+
+    mean = sum(data) / n
+    sum_sq = sum((x - mean) * (x - mean) for x in data)
+    std = math.sqrt(sum_sq / (n - ddof)) if n > ddof else 0.0
+    positive = sum(1 for x in data if x > 0)
+    return mean, std, positive, n
+
+
+def fused_stats(values: np.ndarray, ddof: int = 0) -> Tuple[float, float, int, int]:
+    """Compute mean, standard deviation and positive count of a series.
+
+    NaNs are skipped. The variance uses the centered sum of squares of the
+    NaN-free values rather than E[x^2] - mean^2, which cancels badly for
+    series whose mean is near zero relative to their spread.
+
+    Args:
+        values: Float64 array, NaN where a value is missing
+        ddof: Delta degrees of freedom for the standard deviation
+
+    Returns:
+        Tuple of (mean, std, positive_count, count). Mean and std are 0.0
+        when there are no values; std is 0.0 when count <= ddof.
+    """
+    if values.size < _SMALL_N:
+        return _fused_stats_small(values, ddof)
+
+    finite = ~np.isnan(values)
+    if not finite.all():
+        values = values[finite]
+
+    n = values.size
+    if n == 0:
+        return 0.0, 0.0, 0, 0
+
+    mean = float(values.sum()) / n
+    deviations = values - mean
+    std = math.sqrt(float(deviations @ deviations) / (n - ddof)) if n > ddof else 0.0
+    positive = int(np.count_nonzero(values > 0))
+    return mean, std, positive, n
+
+
+def _max_drawdown_small(values: np.ndarray) -> float:
+    """Single-pass pure-Python max_drawdown() for short arrays."""
+    cumulative = 0.0
+    peak = -math.inf
+    drawdown = 0.0
+    for x in values.tolist():
+        cumulative += x
+        if cumulative > peak:
+            peak = cumulative
+        elif peak - cumulative > drawdown:
+            drawdown = peak - cumulative
+    return drawdown
+
+
+def max_drawdown(values: np.ndarray) -> float:
+    """Compute the largest peak-to-trough drop of a cumulative series.
+
+    Short arrays are scanned once in Python with a running peak and no
+    temporaries. Longer ones write the running peak into one buffer and
+    subtract in place, so only two temporaries are allocated.
+
+    Args:
+        values: Float64 array of per-step returns (e.g. R-multiples)
+
+    Returns:
+        Maximum drawdown of the cumulative sum, 0.0 for an empty array
+    """
+    if values.size < _SMALL_N:
+        return _max_drawdown_small(values)
+
+    cumulative = np.cumsum(values)
+    drawdown = np.maximum.accumulate(cumulative)
+    np.subtract(drawdown, cumulative, out=drawdown)
+    return float(drawdown.max())
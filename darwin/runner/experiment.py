@@ -991,6 +991,12 @@ class ExperimentRunner:
         if not self.degradation_monitor or not self.rl_system or not self.config.rl:
             return
 
+        # The monitor reads agent_state directly, so commit buffered decisions first
+        try:
+            self.rl_system.flush_decisions()
+        except Exception as e:
+            logger.error(f"Failed to flush agent decisions before degradation check: {e}")
+
         # Check all active agents
         results = self.degradation_monitor.check_all_agents(
             gate_config=self.config.rl.gate_agent,
@@ -94,6 +94,60 @@ class TestRLSystemInitialization:
 
             rl_system.close()
 
+    def test_disabling_agent_mid_run_deactivates_it(self, monkeypatch):
+        """Test agents report inactive once disabled, even with a model loaded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent_state_db = str(Path(tmpdir) / "agent_state.sqlite")
+
+            thresholds = GraduationThresholdsV1(
+                min_training_samples=1000,
+                min_validation_samples=200,
+                min_validation_metric=0.1,
+                baseline_type="pass_all",
+                min_improvement_pct=20.0,
+            )
+            config = RLConfigV1(
+                enabled=True,
+                agent_state_db=agent_state_db,
+                gate_agent=AgentConfigV1(
+                    name="gate",
+                    enabled=True,
+                    mode="active",
+                    graduation_thresholds=thresholds,
+                ),
+                portfolio_agent=AgentConfigV1(
+                    name="portfolio",
+                    enabled=True,
+                    mode="active",
+                    graduation_thresholds=thresholds,
+                ),
+                meta_learner_agent=AgentConfigV1(
+                    name="meta_learner",
+                    enabled=True,
+                    mode="active",
+                    graduation_thresholds=thresholds,
+                ),
+            )
+
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+            checks = {
+                "gate": (rl_system.gate_agent, rl_system.gate_agent_active),
+                "portfolio": (rl_system.portfolio_agent, rl_system.portfolio_agent_active),
+                "meta_learner": (
+                    rl_system.meta_learner_agent,
+                    rl_system.meta_learner_agent_active,
+                ),
+            }
+
+            for agent_name, (agent, is_active) in checks.items():
+                monkeypatch.setattr(agent, "is_loaded", lambda: True)
+                assert is_active(), agent_name
+
+                getattr(config, f"{agent_name}_agent").enabled = False
+                assert not is_active(), agent_name
+
+            rl_system.close()
+
 
 class TestGateAgentHooks:
     """Test gate agent hook behavior."""
@@ -193,6 +247,109 @@ class TestGateAgentHooks:
 
             rl_system.close()
 
+    def test_gate_hook_records_state_hash_with_reused_buffer(self):
+        """Test gate hook encodes into one buffer and records each state's hash."""
+        sb3 = pytest.importorskip("stable_baselines3")
+        from darwin.rl.envs.gate_env import GateEnv
+        from darwin.rl.storage.agent_state import AgentStateSQLite
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "gate.zip"
+            sb3.PPO("MlpPolicy", GateEnv(), n_steps=8, batch_size=8).save(model_path)
+
+            config = RLConfigV1(
+                enabled=True,
+                agent_state_db=str(Path(tmpdir) / "agent_state.sqlite"),
+                gate_agent=AgentConfigV1(
+                    name="gate",
+                    enabled=True,
+                    mode="observe",
+                    model_path=str(model_path),
+                    model_version="v1.0.0",
+                    graduation_thresholds=GraduationThresholdsV1(
+                        min_training_samples=1000,
+                        min_validation_samples=200,
+                        min_validation_metric=0.1,
+                        baseline_type="pass_all",
+                        min_improvement_pct=20.0,
+                    ),
+                ),
+            )
+
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+            buffer = rl_system._state_buffers["gate"]
+            portfolio_state = {"open_positions": 0, "exposure_frac": 0.0}
+
+            expected_hashes = []
+            for i, entry_price in enumerate((45000.0, 46000.0)):
+                candidate = CandidateRecordV1(
+                    candidate_id=f"cand_{i:03d}",
+                    run_id="test_run_001",
+                    timestamp=datetime.now(),
+                    symbol="BTC-USD",
+                    timeframe="15m",
+                    bar_index=100 + i,
+                    playbook=PlaybookType.BREAKOUT,
+                    direction="long",
+                    entry_price=entry_price,
+                    atr_at_entry=500.0,
+                    exit_spec=ExitSpecV1(
+                        stop_loss_price=entry_price - 500.0,
+                        take_profit_price=entry_price + 1000.0,
+                        time_stop_bars=32,
+                        trailing_enabled=True,
+                    ),
+                    features={"close": entry_price},
+                    was_taken=False,
+                )
+                assert rl_system.gate_hook(candidate, portfolio_state) is None
+                expected_hashes.append(
+                    AgentStateSQLite.hash_state(
+                        rl_system.gate_agent.encoder.encode(candidate, portfolio_state)
+                    )
+                )
+
+            assert rl_system._state_buffers["gate"] is buffer
+            assert [d.state_hash for d in rl_system._decision_buffer] == expected_hashes
+
+            rl_system.close()
+
+
+class TestObserveSampling:
+    """Test observe-mode candidate sampling."""
+
+    def test_observe_sample_rate(self):
+        """Test observe-mode agents score a reproducible subset of candidates."""
+        thresholds = GraduationThresholdsV1(
+            min_training_samples=1000,
+            min_validation_samples=200,
+            min_validation_metric=0.1,
+            baseline_type="pass_all",
+            min_improvement_pct=20.0,
+        )
+        observe = AgentConfigV1(
+            name="gate",
+            mode="observe",
+            observe_sample_rate=0.25,
+            graduation_thresholds=thresholds,
+        )
+        active = AgentConfigV1(
+            name="gate",
+            mode="active",
+            observe_sample_rate=0.25,
+            graduation_thresholds=thresholds,
+        )
+
+        candidate_ids = [f"cand_{i:04d}" for i in range(2000)]
+        sampled = [c for c in candidate_ids if RLSystem._observe_sampled(c, observe)]
+
+        assert 0.2 < len(sampled) / len(candidate_ids) < 0.3
+        assert sampled == [c for c in candidate_ids if RLSystem._observe_sampled(c, observe)]
+        assert all(RLSystem._observe_sampled(c, active) for c in candidate_ids)
+
+        with pytest.raises(ValueError):
+            AgentConfigV1(name="gate", observe_sample_rate=0.0, graduation_thresholds=thresholds)
+
 
 class TestDecisionOutcomeTracking:
     """Test decision outcome tracking."""
@@ -216,6 +373,201 @@ class TestDecisionOutcomeTracking:
 
             rl_system.close()
 
+    def test_decisions_buffered_until_flush(self):
+        """Test hook decisions are batched, flushed and then get their outcome."""
+        from darwin.rl.schemas.agent_state import AgentDecisionV1
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent_state_db = str(Path(tmpdir) / "agent_state.sqlite")
+
+            config = RLConfigV1(
+                enabled=True,
+                agent_state_db=agent_state_db,
+                gate_agent=AgentConfigV1(
+                    name="gate",
+                    enabled=True,
+                    mode="observe",
+                    graduation_thresholds=GraduationThresholdsV1(
+                        min_training_samples=1000,
+                        min_validation_samples=200,
+                        min_validation_metric=0.1,
+                        baseline_type="pass_all",
+                        min_improvement_pct=20.0,
+                    ),
+                ),
+            )
+
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+
+            for i in range(3):
+                rl_system._record_decision(
+                    AgentDecisionV1(
+                        agent_name="gate",
+                        candidate_id=f"cand_{i:03d}",
+                        run_id="test_run_001",
+                        timestamp=datetime.now(),
+                        state_hash="abc123",
+                        action=1,
+                        mode="observe",
+                        model_version="v1.0.0",
+                    )
+                )
+
+            # Below the flush size nothing has been written yet
+            assert rl_system.agent_state.get_decision_count("gate") == 0
+
+            # The outcome is queued behind its decision without waiting on a commit
+            rl_system.update_decision_outcome(
+                candidate_id="cand_001", r_multiple=1.5, pnl_usd=750.0
+            )
+            assert rl_system._decision_buffer == []
+            rl_system.flush_decisions()
+            assert rl_system.agent_state.get_decision_count("gate") == 3
+            outcomes = rl_system.agent_state.get_decisions_with_outcomes("gate")
+            assert [(d["candidate_id"], d["outcome_r_multiple"]) for d in outcomes] == [
+                ("cand_001", 1.5)
+            ]
+
+            # Full batches go to the background writer; flushing waits for it
+            for i in range(3, 3 + 2 * RLSystem.DECISION_FLUSH_SIZE):
+                rl_system._record_decision(
+                    AgentDecisionV1(
+                        agent_name="gate",
+                        candidate_id=f"cand_{i:03d}",
+                        run_id="test_run_001",
+                        timestamp=datetime.now(),
+                        state_hash="abc123",
+                        action=1,
+                        mode="observe",
+                        model_version="v1.0.0",
+                    )
+                )
+            assert rl_system._writer is not None and rl_system._writer.is_alive()
+
+            rl_system.flush_decisions()
+            assert rl_system.agent_state.get_decision_count("gate") == (
+                3 + 2 * RLSystem.DECISION_FLUSH_SIZE
+            )
+
+            writer = rl_system._writer
+            rl_system.close()
+            assert not writer.is_alive()
+
+    @staticmethod
+    def _gate_decision(candidate_id):
+        from darwin.rl.schemas.agent_state import AgentDecisionV1
+
+        return AgentDecisionV1(
+            agent_name="gate",
+            candidate_id=candidate_id,
+            run_id="test_run_001",
+            timestamp=datetime.now(),
+            state_hash="abc123",
+            action=1,
+            mode="observe",
+            model_version="v1.0.0",
+        )
+
+    def test_decisions_handed_off_after_flush_interval(self):
+        """Test a partial buffer is handed to the writer once the interval passes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = RLConfigV1(
+                enabled=True, agent_state_db=str(Path(tmpdir) / "agent_state.sqlite")
+            )
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+            rl_system.DECISION_FLUSH_INTERVAL_S = 0.0
+
+            rl_system._record_decision(self._gate_decision("cand_000"))
+            assert rl_system._decision_buffer == []
+            assert rl_system._writer is not None
+
+            rl_system._write_queue.join()
+            assert rl_system.agent_state.get_decision_count("gate") == 1
+            rl_system.close()
+
+    def test_failed_writes_are_kept_and_raised_on_flush(self, monkeypatch):
+        """Test decisions the writer cannot record surface on flush instead of vanishing."""
+        from darwin.rl.storage.agent_state import AgentStateSQLite
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = RLConfigV1(
+                enabled=True, agent_state_db=str(Path(tmpdir) / "agent_state.sqlite")
+            )
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+            rl_system.DECISION_WRITE_ATTEMPTS = 1
+
+            def fail(self, decisions):
+                raise RuntimeError("database is locked")
+
+            with monkeypatch.context() as m:
+                m.setattr(AgentStateSQLite, "record_decisions", fail)
+                rl_system._record_decision(self._gate_decision("cand_000"))
+                with pytest.raises(RuntimeError, match="database is locked"):
+                    rl_system.flush_decisions()
+
+            assert len(rl_system._unwritten) == 1
+
+            rl_system.flush_decisions()
+            assert rl_system._unwritten == []
+            assert rl_system.agent_state.get_decision_count("gate") == 1
+            rl_system.close()
+
+    def test_outcome_update_does_not_wait_for_writer(self, monkeypatch):
+        """Test outcome updates leave unrelated buffered decisions alone and never join."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = RLConfigV1(
+                enabled=True,
+                agent_state_db=str(Path(tmpdir) / "agent_state.sqlite"),
+                gate_agent=AgentConfigV1(
+                    name="gate",
+                    enabled=True,
+                    mode="observe",
+                    graduation_thresholds=GraduationThresholdsV1(
+                        min_training_samples=1000,
+                        min_validation_samples=200,
+                        min_validation_metric=0.1,
+                        baseline_type="pass_all",
+                        min_improvement_pct=20.0,
+                    ),
+                ),
+            )
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+            rl_system._record_decision(self._gate_decision("cand_000"))
+            rl_system.flush_decisions()
+            rl_system._record_decision(self._gate_decision("cand_001"))
+
+            def no_join():
+                raise AssertionError("update_decision_outcome waited on the writer")
+
+            with monkeypatch.context() as m:
+                m.setattr(rl_system._write_queue, "join", no_join)
+                rl_system.update_decision_outcome("cand_000", r_multiple=-1.0, pnl_usd=-50.0)
+            assert len(rl_system._decision_buffer) == 1
+
+            rl_system.flush_decisions()
+            outcomes = rl_system.agent_state.get_decisions_with_outcomes("gate")
+            assert [(d["candidate_id"], d["outcome_r_multiple"]) for d in outcomes] == [
+                ("cand_000", -1.0)
+            ]
+            rl_system.close()
+
+    def test_flush_at_exit_writes_buffered_decisions(self):
+        """Test the atexit hook commits decisions when close() was never called."""
+        from darwin.rl.storage.agent_state import AgentStateSQLite
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent_state_db = str(Path(tmpdir) / "agent_state.sqlite")
+            config = RLConfigV1(enabled=True, agent_state_db=agent_state_db)
+            rl_system = RLSystem(config=config, run_id="test_run_001")
+
+            rl_system._record_decision(self._gate_decision("cand_000"))
+            rl_system._flush_at_exit()
+
+            reader = AgentStateSQLite(agent_state_db)
+            assert reader.get_decision_count("gate") == 1
+            reader.close()
+            rl_system.close()
+
 
 class TestRunConfigRLIntegration:
     """Test RunConfigV1 with RL configuration."""
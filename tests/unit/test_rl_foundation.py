@@ -8,7 +8,7 @@ Tests:
 """
 
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import numpy as np
@@ -193,6 +193,167 @@ class TestAgentStateSQLite:
 
             db.close()
 
+    def test_fetch_action_r_matches_decisions_with_outcomes(self):
+        """Test narrow action/R-multiple arrays match the full decision rows."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "agent_state.sqlite"
+            db = AgentStateSQLite(db_path)
+
+            for i, (action, r_multiple) in enumerate([(1.0, 1.5), (0.0, None), (2.0, -0.5)]):
+                db.record_decision(
+                    AgentDecisionV1(
+                        agent_name="meta_learner",
+                        candidate_id=f"cand_{i:03d}",
+                        run_id="run_001",
+                        timestamp=datetime(2024, 1, 1, i),
+                        state_hash="abc123",
+                        action=action,
+                        mode="observe",
+                        model_version="v1.0.0",
+                    )
+                )
+                if r_multiple is not None:
+                    db.update_decision_outcome(
+                        agent_name="meta_learner",
+                        candidate_id=f"cand_{i:03d}",
+                        outcome_r_multiple=r_multiple,
+                        outcome_pnl_usd=r_multiple * 100,
+                    )
+
+            actions, r_multiples = db.fetch_action_r("meta_learner")
+            rows = db.get_decisions_with_outcomes("meta_learner")
+
+            np.testing.assert_array_equal(actions, [row["action"] for row in rows])
+            np.testing.assert_array_equal(r_multiples, [row["outcome_r_multiple"] for row in rows])
+            np.testing.assert_array_equal(r_multiples, [-0.5, 1.5])
+            np.testing.assert_array_equal(db.get_r_multiples("meta_learner"), r_multiples)
+
+            empty_actions, empty_r = db.fetch_action_r("gate")
+            assert empty_actions.shape == empty_r.shape == (0,)
+
+            db.close()
+
+    def test_sql_side_counts(self):
+        """Test SQL-side counts of overrides and decisions with outcomes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "agent_state.sqlite"
+            db = AgentStateSQLite(db_path)
+
+            outcomes = [(0.0, 1.0), (0.0, -0.5), (1.0, 2.0), (2.0, None), (2.0, 0.0)]
+            for i, (action, r_multiple) in enumerate(outcomes):
+                db.record_decision(
+                    AgentDecisionV1(
+                        agent_name="meta_learner",
+                        candidate_id=f"cand_{i:03d}",
+                        run_id="run_001",
+                        timestamp=datetime.now(),
+                        state_hash="abc123",
+                        action=action,
+                        mode="observe",
+                        model_version="v1.0.0",
+                    )
+                )
+                if r_multiple is not None:
+                    db.update_decision_outcome(
+                        agent_name="meta_learner",
+                        candidate_id=f"cand_{i:03d}",
+                        outcome_r_multiple=r_multiple,
+                        outcome_pnl_usd=r_multiple * 100,
+                    )
+
+            assert db.count_overrides("meta_learner") == (2, 4)
+            assert db.count_overrides("gate") == (0, 0)
+            assert db.count_decisions_with_outcomes("meta_learner") == len(
+                db.get_decisions_with_outcomes("meta_learner")
+            )
+
+            since = datetime.now() - timedelta(days=1)
+            assert db.get_decision_count_split("meta_learner", since) == (
+                db.get_decision_count("meta_learner"),
+                db.get_decision_count("meta_learner", since=since),
+            )
+            assert db.get_decision_count_split("gate", since) == (0, 0)
+
+            db.close()
+
+    def test_get_outcomes_bulk(self):
+        """Test bulk outcome fetch and SQL mean match windowed queries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "agent_state.sqlite"
+            db = AgentStateSQLite(db_path)
+
+            start = datetime(2024, 1, 1)
+            for i in range(10):
+                db.record_decision(
+                    AgentDecisionV1(
+                        agent_name="gate",
+                        candidate_id=f"cand_{i:03d}",
+                        run_id="run_001",
+                        timestamp=start + timedelta(days=i),
+                        state_hash="abc123",
+                        action=1.0,
+                        mode="observe",
+                        model_version="v1.0.0",
+                    )
+                )
+                db.update_decision_outcome(
+                    agent_name="gate",
+                    candidate_id=f"cand_{i:03d}",
+                    outcome_r_multiple=i - 4.5,
+                    outcome_pnl_usd=0.0,
+                )
+
+            since, until = start + timedelta(days=2), start + timedelta(days=6)
+            outcomes = db.get_outcomes_bulk("gate", since=since, until=until)
+            rows = db.get_decisions_with_outcomes("gate", since=since, until=until)
+
+            assert outcomes.shape == (5, 2)
+            np.testing.assert_array_equal(
+                outcomes[:, 1], [row["outcome_r_multiple"] for row in reversed(rows)]
+            )
+            assert outcomes[0, 0] == AgentStateSQLite.to_epoch(since)
+            assert outcomes[-1, 0] == AgentStateSQLite.to_epoch(until)
+            assert db.get_outcomes_bulk("portfolio", since=since).shape == (0, 2)
+
+            mean_r, count = db.get_mean_r_multiple("gate", since=since, until=until)
+            assert count == 5
+            assert mean_r == pytest.approx(float(outcomes[:, 1].mean()))
+            assert db.get_mean_r_multiple("portfolio") == (None, 0)
+
+            db.close()
+
+    def test_read_only_connection(self):
+        """Test read-only connection sees committed writes and rejects writes."""
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "agent_state.sqlite"
+            db = AgentStateSQLite(db_path)
+            reader = AgentStateSQLite(db_path, read_only=True)
+
+            assert reader.read_only
+            assert reader.get_decision_count("gate") == 0
+
+            db.record_decision(
+                AgentDecisionV1(
+                    agent_name="gate",
+                    candidate_id="cand_001",
+                    run_id="run_001",
+                    timestamp=datetime.now(),
+                    state_hash="abc123",
+                    action=1.0,
+                    mode="observe",
+                    model_version="v1.0.0",
+                )
+            )
+            assert reader.get_decision_count("gate") == 1
+
+            with pytest.raises(sqlite3.OperationalError):
+                reader.conn.execute("DELETE FROM agent_decisions")
+
+            reader.close()
+            db.close()
+
     def test_save_performance_snapshot(self):
         """Test saving performance snapshot."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -466,6 +627,21 @@ class TestStateEncoders:
         assert np.all(np.isfinite(state))
         assert state[0] == 0.0
 
+    def test_state_encoder_writes_into_out_buffer(self):
+        """Test that encoders fill a preallocated buffer in place."""
+        encoder = GateStateEncoder()
+        candidate = self.create_sample_candidate()
+        portfolio_state = {"open_positions": 2, "exposure_frac": 0.5}
+
+        out = np.full(encoder.get_state_dim(), 7.0, dtype=np.float32)
+        state = encoder.encode(candidate, portfolio_state, out=out)
+
+        assert state is out
+        np.testing.assert_array_equal(out, encoder.encode(candidate, portfolio_state))
+
+        with pytest.raises(ValueError):
+            encoder.encode(candidate, portfolio_state, out=np.zeros(3, dtype=np.float32))
+
 
 class TestTrainingSchemas:
     """Test training episode schemas."""
@@ -192,6 +192,15 @@ class TestGateEnv:
         assert "candidate_id" in info
         assert info["candidate_id"] == "cand_001"
 
+    def test_gate_env_reset_observation_is_read_only(self):
+        """Test reset() observations cannot be modified in place."""
+        env = GateEnv(episodes=[self.create_sample_episode()])
+
+        obs, _ = env.reset()
+
+        with pytest.raises(ValueError, match="read-only"):
+            obs[0] = 1.0
+
     def test_gate_env_step_skip_loser(self):
         """Test environment step with skip action on loser."""
         episode = self.create_sample_episode()
@@ -219,6 +228,28 @@ class TestGateEnv:
         assert terminated is True
         assert info["action"] == "pass"
 
+    def test_gate_env_step_accepts_numpy_actions(self):
+        """Test NumPy scalar and 0-d array actions behave like Python ints."""
+        env = GateEnv(episodes=[self.create_sample_episode()])
+
+        for action in (np.int64(1), np.array(1)):
+            env.reset()
+            _, reward, _, _, info = env.step(action)
+
+            assert info["action"] == "pass"
+            assert reward == env._reward_table[0, 1]
+
+    def test_gate_env_step_reuses_reset_observation(self):
+        """Test terminal step returns the reset observation without re-encoding."""
+        episode = self.create_sample_episode()
+        env = GateEnv(episodes=[episode])
+
+        reset_obs, _ = env.reset()
+        step_obs, _, terminated, _, _ = env.step(action=0)
+
+        assert terminated is True
+        np.testing.assert_array_equal(step_obs, reset_obs)
+
     def test_gate_env_set_episodes(self):
         """Test setting episodes."""
         env = GateEnv()
@@ -251,6 +282,34 @@ class TestGateEnv:
         assert seen_ids[2] == "cand_002"
         assert seen_ids[3] == "cand_000"  # Cycle back
 
+    def test_vector_replay_gate_env_matches_single_env(self):
+        """Test vectorized replay serves the same observations and rewards."""
+        from darwin.rl.envs.vector_replay import VectorReplayGateEnv
+
+        episodes = [self.create_sample_episode() for _ in range(3)]
+        for i, ep in enumerate(episodes):
+            ep["outcome"].counterfactual_r_multiple = [-0.5, 1.2, 3.0][i]
+
+        single = GateEnv(episodes=episodes)
+        vec_env = VectorReplayGateEnv(episodes=episodes, num_envs=2)
+
+        obs, info = vec_env.reset()
+        assert obs.shape == (2, 34)
+        np.testing.assert_array_equal(info["episode_idx"], [0, 1])
+
+        next_obs, rewards, terminations, truncations, _ = vec_env.step(np.array([0, 0]))
+        expected = []
+        for idx in (0, 1):
+            single.current_episode_idx = idx
+            single._load_episode(idx)
+            expected.append(single.step(0)[1])
+        np.testing.assert_allclose(rewards, expected)
+        assert terminations.all() and not truncations.any()
+
+        # Next batch wraps around the episode list
+        np.testing.assert_array_equal(next_obs[0], single._obs_cache[2])
+        np.testing.assert_array_equal(next_obs[1], single._obs_cache[0])
+
 
 class TestGateAgent:
     """Test Gate Agent wrapper."""
@@ -320,6 +379,97 @@ class TestGateAgent:
         with pytest.raises(ValueError, match="Model not loaded"):
             agent.explain_decision(candidate)
 
+    def test_gate_agent_confidence_matches_policy_distribution(self):
+        """Test action-head confidence matches the PPO policy distribution."""
+        sb3 = pytest.importorskip("stable_baselines3")
+
+        candidate = CandidateRecordV1(
+            candidate_id="cand_001",
+            run_id="run_001",
+            timestamp=datetime.now(),
+            symbol="BTC-USD",
+            timeframe="15m",
+            bar_index=100,
+            playbook=PlaybookType.BREAKOUT,
+            direction="long",
+            entry_price=45000.0,
+            atr_at_entry=500.0,
+            exit_spec=ExitSpecV1(
+                stop_loss_price=44500.0,
+                take_profit_price=46000.0,
+                time_stop_bars=32,
+                trailing_enabled=True,
+            ),
+            features={"close": 45000.0, "rsi14": 65.0},
+            was_taken=False,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "gate.zip"
+            sb3.PPO("MlpPolicy", GateEnv(), n_steps=8, batch_size=8).save(model_path)
+            agent = GateAgent(model_path=str(model_path))
+
+        action, confidence = agent.predict_with_confidence(candidate)
+
+        state = agent.encoder.encode(candidate, {})
+        obs_tensor = agent.model.policy.obs_to_tensor(state)[0]
+        probs = (
+            agent.model.policy.get_distribution(obs_tensor).distribution.probs.detach().numpy()[0]
+        )
+        assert action == int(np.argmax(probs))
+        assert confidence == pytest.approx(float(probs[action]), abs=1e-6)
+
+    def test_gate_agent_predict_state_matches_predict(self):
+        """Test predicting from a pre-encoded state matches predict()."""
+        sb3 = pytest.importorskip("stable_baselines3")
+
+        candidate = CandidateRecordV1(
+            candidate_id="cand_001",
+            run_id="run_001",
+            timestamp=datetime.now(),
+            symbol="BTC-USD",
+            timeframe="15m",
+            bar_index=100,
+            playbook=PlaybookType.BREAKOUT,
+            direction="long",
+            entry_price=45000.0,
+            atr_at_entry=500.0,
+            exit_spec=ExitSpecV1(
+                stop_loss_price=44500.0,
+                take_profit_price=46000.0,
+                time_stop_bars=32,
+                trailing_enabled=True,
+            ),
+            features={"close": 45000.0, "rsi14": 65.0},
+            was_taken=False,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "gate.zip"
+            sb3.PPO("MlpPolicy", GateEnv(), n_steps=8, batch_size=8).save(model_path)
+            agent = GateAgent(model_path=str(model_path))
+
+        state = agent.encoder.encode(candidate, {})
+        assert agent.predict_state(state) == agent.predict(candidate)
+
+    def test_gate_agent_scripted_policy_head_matches_model(self, monkeypatch):
+        """Test the TorchScript policy head predicts like model.predict."""
+        sb3 = pytest.importorskip("stable_baselines3")
+        monkeypatch.setenv("DARWIN_RL_JIT", "1")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_path = Path(tmpdir) / "gate.zip"
+            sb3.PPO("MlpPolicy", GateEnv(), n_steps=8, batch_size=8).save(model_path)
+            agent = GateAgent(model_path=str(model_path))
+
+        assert agent._pi_scripted
+
+        rng = np.random.default_rng(0)
+        for state in rng.standard_normal((16, agent.get_state_dim())):
+            state = state.astype(np.float32)
+            expected, _ = agent.model.predict(state, deterministic=True)
+            assert agent._predict_action(state) == int(expected)
+
 
 class TestOfflineTrainingPreparation:
     """Test offline training data preparation."""
@@ -7,7 +7,7 @@ Tests:
 """
 
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import numpy as np
@@ -125,6 +125,18 @@ class TestBaselineStrategies:
         assert "sharpe_ratio" in metrics
         assert metrics["agreement_rate"] == 1.0  # 100% agreement
 
+    def test_baselines_accept_converted_episodes(self):
+        """Test baselines give the same metrics for BaselineEpisode input."""
+        from darwin.rl.graduation.baselines import to_baseline_episodes
+
+        episodes = self.create_sample_episodes(10)
+        converted = to_baseline_episodes(episodes)
+
+        for baseline in (PassAllBaseline(), EqualWeightBaseline(0.5), LLMOnlyBaseline()):
+            assert baseline.compute_baseline_performance(
+                converted
+            ) == baseline.compute_baseline_performance(episodes)
+
     def test_get_baseline_strategy(self):
         """Test baseline strategy factory."""
         pass_all = get_baseline_strategy("pass_all")
@@ -136,6 +148,20 @@ class TestBaselineStrategies:
         llm_only = get_baseline_strategy("llm_only")
         assert isinstance(llm_only, LLMOnlyBaseline)
 
+        # Each call returns a fresh instance, so reconfiguring one is local
+        equal_weight.equal_weight = 0.25
+        assert get_baseline_strategy("pass_all") is not pass_all
+        assert get_baseline_strategy("equal_weight").equal_weight == 1.0
+
+    def test_make_equal_weight(self):
+        """Test equal-weight factory with a custom position size."""
+        from darwin.rl.graduation.baselines import make_equal_weight
+
+        half = make_equal_weight(0.5)
+        assert isinstance(half, EqualWeightBaseline)
+        assert half.equal_weight == 0.5
+        assert get_baseline_strategy("equal_weight").equal_weight == 1.0
+
     def test_get_baseline_strategy_invalid(self):
         """Test baseline strategy factory with invalid type."""
         with pytest.raises(ValueError, match="Unknown baseline type"):
@@ -283,6 +309,236 @@ class TestGraduationPolicy:
 
         agent_state.close()
 
+    def test_evaluate_graduation_batch_matches_single(self):
+        """Test batch evaluation matches evaluating each agent separately."""
+        agent_state = self.create_agent_state_with_data("gate", sample_count=150)
+
+        thresholds = GraduationThresholdsV1(
+            min_training_samples=100,
+            min_validation_samples=20,
+            min_validation_metric=0.1,
+            baseline_type="pass_all",
+            min_improvement_pct=10.0,
+        )
+        policy = GraduationPolicy(agent_state, thresholds)
+
+        batch = policy.evaluate_graduation_batch(["gate", "portfolio"])
+
+        assert list(batch) == ["gate", "portfolio"]
+        for agent_name, decision in batch.items():
+            single = policy.evaluate_graduation(agent_name)
+            assert decision.can_graduate == single.can_graduate
+            assert decision.reason == single.reason
+            assert decision.checks == single.checks
+        assert batch["portfolio"].metrics["total_samples"] == 0
+
+        agent_state.close()
+
+    def test_check_stability_uses_disjoint_windows(self):
+        """Test stability windows split the lookback instead of overlapping."""
+        from darwin.rl.schemas.agent_state import AgentDecisionV1
+
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite")
+        temp_db.close()
+        agent_state = AgentStateSQLite(temp_db.name)
+
+        # Two decisions per 30-day window, with window means 1.0, 2.0, 3.0
+        for i, (days_ago, r_multiple) in enumerate(
+            [(80, 0.5), (70, 1.5), (50, 2.0), (40, 2.0), (20, 2.5), (10, 3.5)]
+        ):
+            agent_state.record_decision(
+                AgentDecisionV1(
+                    agent_name="gate",
+                    candidate_id=f"cand_{i:03d}",
+                    run_id="run_001",
+                    timestamp=datetime.now() - timedelta(days=days_ago),
+                    state_hash="test_hash",
+                    action=1,
+                    mode="observe",
+                    model_version="v1.0",
+                )
+            )
+            agent_state.update_decision_outcome(
+                agent_name="gate",
+                candidate_id=f"cand_{i:03d}",
+                outcome_r_multiple=r_multiple,
+                outcome_pnl_usd=r_multiple * 1000,
+            )
+
+        thresholds = GraduationThresholdsV1(
+            min_training_samples=1,
+            min_validation_samples=1,
+            min_validation_metric=0.1,
+            baseline_type="pass_all",
+            min_improvement_pct=10.0,
+        )
+        result = GraduationPolicy(agent_state, thresholds)._check_stability("gate")
+
+        assert result["window_means"] == pytest.approx([1.0, 2.0, 3.0])
+        assert result["variance"] == pytest.approx(np.var([1.0, 2.0, 3.0]))
+        assert result["is_stable"]
+
+        agent_state.close()
+
+    def test_rolling_metrics_cache_invalidated_by_writes(self):
+        """Test cached rolling metrics are reused until outcomes change."""
+        from darwin.rl.graduation.metrics import AgentPerformanceMetrics
+
+        agent_state = self.create_agent_state_with_data("gate", sample_count=20)
+        tracker = AgentPerformanceMetrics(agent_state)
+
+        first = tracker.compute_rolling_metrics("gate")
+        first["mean_r_multiple"] = 99.0  # Callers get copies
+        assert tracker.compute_rolling_metrics("gate")["mean_r_multiple"] == pytest.approx(0.25)
+
+        agent_state.update_decision_outcome(
+            agent_name="gate",
+            candidate_id="cand_001",
+            outcome_r_multiple=1.5,
+            outcome_pnl_usd=1500,
+        )
+        assert tracker.compute_rolling_metrics("gate")["mean_r_multiple"] == pytest.approx(0.375)
+
+        agent_state.close()
+
+
+class TestGraduationEvaluator:
+    """Test graduation evaluator metrics over stored decisions."""
+
+    def test_evaluator_metrics_from_stored_outcomes(self):
+        """Test metrics are computed from outcome_r_multiple rows."""
+        from darwin.rl.graduation.evaluator import GraduationEvaluator
+        from darwin.rl.schemas.rl_config import AgentConfigV1
+
+        agent_state = TestGraduationPolicy().create_agent_state_with_data("gate", sample_count=150)
+        agent_config = AgentConfigV1(
+            name="gate",
+            graduation_thresholds=GraduationThresholdsV1(
+                min_training_samples=50,
+                min_validation_samples=10,
+                min_candidates_seen=50,
+                min_validation_metric=0.1,
+                min_win_rate=0.4,
+                min_sharpe_ratio=0.0,
+                baseline_type="pass_all",
+                min_improvement_pct=10.0,
+            ),
+        )
+
+        evaluator = GraduationEvaluator(agent_state)
+        _, details = evaluator.evaluate_graduation(agent_config, baseline_metric=0.4)
+
+        metrics = details["metrics"]
+        # Alternating winners/losers, all passed by the gate
+        assert metrics["validation_metric"] == pytest.approx(0.5)
+        assert metrics["win_rate"] == pytest.approx(0.5)
+        r = np.array([1.5, -1.0] * 75)
+        assert metrics["sharpe_ratio"] == pytest.approx(r.mean() / r.std(ddof=1))
+        assert len(metrics["validation_windows"]) == 5
+
+        agent_state.close()
+
+    def test_evaluator_zero_baseline(self):
+        """Test a zero baseline metric reports no improvement instead of raising."""
+        from darwin.rl.graduation.evaluator import GraduationEvaluator
+        from darwin.rl.schemas.rl_config import AgentConfigV1
+
+        agent_state = TestGraduationPolicy().create_agent_state_with_data("gate", sample_count=150)
+        agent_config = AgentConfigV1(
+            name="gate",
+            graduation_thresholds=GraduationThresholdsV1(
+                min_training_samples=50,
+                min_validation_samples=10,
+                min_candidates_seen=50,
+                min_validation_metric=0.1,
+                baseline_type="pass_all",
+                min_improvement_pct=10.0,
+            ),
+        )
+
+        evaluator = GraduationEvaluator(agent_state)
+        _, details = evaluator.evaluate_graduation(agent_config, baseline_metric=0.0)
+
+        assert details["metrics"]["improvement_pct"] == 0.0
+        assert all(w["improvement_pct"] == 0.0 for w in details["metrics"]["validation_windows"])
+
+        agent_state.close()
+
+    def test_evaluator_early_exit_on_hard_gate(self):
+        """Test early-exit mode stops after a failed sample-count check."""
+        from darwin.rl.graduation.evaluator import GraduationEvaluator
+        from darwin.rl.schemas.rl_config import AgentConfigV1
+
+        agent_state = TestGraduationPolicy().create_agent_state_with_data("gate", sample_count=20)
+        agent_config = AgentConfigV1(
+            name="gate",
+            graduation_thresholds=GraduationThresholdsV1(
+                min_training_samples=100,
+                min_validation_samples=10,
+                min_candidates_seen=10,
+                min_validation_metric=0.1,
+                baseline_type="pass_all",
+                min_improvement_pct=10.0,
+            ),
+        )
+
+        evaluator = GraduationEvaluator(agent_state)
+        is_ready, details = evaluator.evaluate_graduation(
+            agent_config, baseline_metric=0.4, early_exit=True
+        )
+
+        assert not is_ready
+        assert details["checks_failed"] == ["✗ Training samples: 20 < 100"]
+        assert details["checks_failed_records"] == [("training_samples", 20, 100)]
+        assert "validation_metric" not in details["metrics"]
+
+        # Full report still runs every check
+        _, full_details = evaluator.evaluate_graduation(agent_config, baseline_metric=0.4)
+        assert "validation_windows" in full_details["metrics"]
+
+        agent_state.close()
+
+    def test_fused_stats_matches_numpy(self):
+        """Test fused statistics skip NaNs and match NumPy reductions."""
+        from darwin.rl.utils.stats import fused_stats
+
+        values = np.array([1.5, np.nan, -1.0, 0.25, 2.0, np.nan, -0.5])
+        finite = values[~np.isnan(values)]
+
+        mean, std, positive, count = fused_stats(values, ddof=1)
+
+        assert mean == pytest.approx(finite.mean())
+        assert std == pytest.approx(finite.std(ddof=1))
+        assert positive == 3
+        assert count == 5
+        assert fused_stats(np.array([np.nan])) == (0.0, 0.0, 0, 0)
+
+        # Short arrays take the pure-Python path; results must agree
+        long_values = np.tile(values, 10)
+        long_finite = long_values[~np.isnan(long_values)]
+        mean, std, positive, count = fused_stats(long_values, ddof=1)
+        assert mean == pytest.approx(long_finite.mean())
+        assert std == pytest.approx(long_finite.std(ddof=1))
+        assert (positive, count) == (30, 50)
+
+    def test_max_drawdown(self):
+        """Test max drawdown of cumulative R-multiples."""
+        from darwin.rl.utils.stats import max_drawdown
+
+        # Cumulative: 1.0, 3.0, 2.0, 0.5, 1.5 -> peak 3.0, trough 0.5
+        assert max_drawdown(np.array([1.0, 2.0, -1.0, -1.5, 1.0])) == pytest.approx(2.5)
+        assert max_drawdown(np.array([0.5, 0.5, 1.0])) == 0.0
+        assert max_drawdown(np.array([])) == 0.0
+
+        # Long arrays take the NumPy path; results must agree
+        values = np.random.default_rng(0).normal(size=200)
+        cumulative = np.cumsum(values)
+        expected = np.max(np.maximum.accumulate(cumulative) - cumulative)
+        assert max_drawdown(values) == expected
+        assert max_drawdown(values[:20]) == pytest.approx(
+            np.max(np.maximum.accumulate(cumulative[:20]) - cumulative[:20])
+        )
+
 
 class TestGraduationDecision:
     """Test graduation decision object."""
@@ -317,3 +573,69 @@ class TestGraduationDecision:
         repr_str = repr(decision)
         assert "can_graduate=False" in repr_str
         assert "Insufficient data" in repr_str
+
+
+class TestGraduationStatusCLI:
+    """Test the graduation status CLI helpers."""
+
+    def make_thresholds(self) -> GraduationThresholdsV1:
+        """Create default gate thresholds."""
+        return GraduationThresholdsV1(
+            min_training_samples=1000,
+            min_validation_samples=200,
+            min_validation_metric=0.1,
+            baseline_type="pass_all",
+            min_improvement_pct=10.0,
+        )
+
+    def test_cached_evaluation_expires_and_returns_copies(self, monkeypatch):
+        """Test cached decisions are private copies and expire with the TTL bucket."""
+        from darwin.rl.cli import graduation_status
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "agent_state.sqlite")
+            graduation_status._get_agent_state(db_path)
+            graduation_status._cached_eval.cache_clear()
+            clock = [1000.0]
+            monkeypatch.setattr(graduation_status.time, "monotonic", lambda: clock[0])
+
+            first = graduation_status._evaluate("gate", db_path, self.make_thresholds())
+            first.checks.clear()
+            second = graduation_status._evaluate("gate", db_path, self.make_thresholds())
+
+            assert second.checks
+            assert graduation_status._cached_eval.cache_info().misses == 1
+
+            clock[0] += graduation_status._EVAL_CACHE_TTL_SECONDS
+            graduation_status._evaluate("gate", db_path, self.make_thresholds())
+            assert graduation_status._cached_eval.cache_info().misses == 2
+            graduation_status.close_agent_states()
+
+    def test_existing_database_opened_read_only(self):
+        """Test the CLI opens an existing database read-only and creates a missing one."""
+        from darwin.rl.cli import graduation_status
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "agent_state.sqlite")
+            assert not graduation_status._get_agent_state(db_path).read_only
+            graduation_status.close_agent_states()
+
+            assert graduation_status._get_agent_state(db_path).read_only
+            graduation_status.close_agent_states()
+
+    def test_close_agent_states_closes_shared_connections(self):
+        """Test close_agent_states() closes connections and drops cached evaluations."""
+        from darwin.rl.cli import graduation_status
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "agent_state.sqlite")
+            agent_state = graduation_status._get_agent_state(db_path)
+            assert graduation_status._get_agent_state(db_path) is agent_state
+            graduation_status._evaluate("gate", db_path, self.make_thresholds())
+
+            graduation_status.close_agent_states()
+
+            assert graduation_status._agent_states == {}
+            assert graduation_status._cached_eval.cache_info().currsize == 0
+            assert graduation_status._get_agent_state(db_path) is not agent_state
+            graduation_status.close_agent_states()
@@ -6,6 +6,7 @@ Tests:
 - Episode preparation
 """
 
+import asyncio
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -123,6 +124,27 @@ class TestMetaLearnerEnv:
         assert info["candidate_id"] == "cand_001"
         assert info["llm_decision"] == "take"
 
+    def test_meta_learner_env_reset_observation_is_read_only(self):
+        """Test reset() observations cannot be modified in place."""
+        env = MetaLearnerEnv(episodes=[self.create_sample_episode()])
+
+        obs, _ = env.reset()
+
+        with pytest.raises(ValueError, match="read-only"):
+            obs[0] = 1.0
+
+    def test_meta_learner_env_step_accepts_numpy_actions(self):
+        """Test NumPy scalar and 0-d array actions behave like Python ints."""
+        env = MetaLearnerEnv(episodes=[self.create_sample_episode(llm_decision="take")])
+
+        for action in (np.int64(OVERRIDE_TO_SKIP), np.array(OVERRIDE_TO_SKIP)):
+            env.reset()
+            _, _, _, _, info = env.step(action)
+
+            assert info["action"] == OVERRIDE_TO_SKIP
+            assert type(info["action"]) is int
+            assert info["final_decision"] == "skip"
+
     def test_meta_learner_env_step_agree_with_winner(self):
         """Test environment step: agree with LLM on winning trade."""
         episode = self.create_sample_episode(llm_decision="take", actual_r=1.5)
@@ -350,6 +372,103 @@ class TestMetaLearnerAgent:
         with pytest.raises(ValueError, match="Model not loaded"):
             agent.explain_decision(candidate, llm_response)
 
+    def test_meta_learner_agent_predict_async_batches_calls(self):
+        """Test concurrent predict_async calls share one model forward pass."""
+
+        class RecordingModel:
+            def __init__(self):
+                self.batch_shapes = []
+
+            def predict(self, states, deterministic=True):
+                self.batch_shapes.append(states.shape)
+                return np.full(len(states), OVERRIDE_TO_SKIP), None
+
+        agent = MetaLearnerAgent()
+        agent.model = RecordingModel()
+
+        candidate = CandidateRecordV1(
+            candidate_id="cand_001",
+            run_id="run_001",
+            timestamp=datetime.now(),
+            symbol="BTC-USD",
+            timeframe="15m",
+            bar_index=100,
+            playbook=PlaybookType.BREAKOUT,
+            direction="long",
+            entry_price=45000.0,
+            atr_at_entry=500.0,
+            exit_spec=ExitSpecV1(
+                stop_loss_price=44500.0,
+                take_profit_price=46000.0,
+                time_stop_bars=32,
+                trailing_enabled=True,
+            ),
+            features={"close": 45000.0},
+            was_taken=True,
+        )
+        llm_response = {"decision": "take", "confidence": 0.75}
+
+        async def score_burst():
+            return await asyncio.gather(
+                *[agent.predict_async(candidate, llm_response) for _ in range(5)]
+            )
+
+        actions = asyncio.run(score_burst())
+
+        assert actions == [OVERRIDE_TO_SKIP] * 5
+        assert agent.model.batch_shapes == [(5, 38)]
+
+    def test_meta_learner_agent_predict_batch_encodes_in_parallel(self):
+        """Test predict_batch matches serial encoding and runs one forward."""
+
+        class RecordingModel:
+            def __init__(self):
+                self.states = []
+
+            def predict(self, states, deterministic=True):
+                self.states.append(states)
+                return np.full(len(states), AGREE), None
+
+        agent = MetaLearnerAgent()
+        agent.model = RecordingModel()
+
+        candidates = [
+            CandidateRecordV1(
+                candidate_id=f"cand_{i:03d}",
+                run_id="run_001",
+                timestamp=datetime.now(),
+                symbol="BTC-USD",
+                timeframe="15m",
+                bar_index=100 + i,
+                playbook=PlaybookType.BREAKOUT,
+                direction="long" if i % 2 else "short",
+                entry_price=45000.0,
+                atr_at_entry=500.0,
+                exit_spec=ExitSpecV1(
+                    stop_loss_price=44500.0,
+                    take_profit_price=46000.0,
+                    time_stop_bars=32,
+                    trailing_enabled=True,
+                ),
+                features={"close": 45000.0 + i, "rsi14": float(i)},
+                was_taken=True,
+            )
+            for i in range(agent.parallel_encode_min_batch + 4)
+        ]
+        llm_responses = [{"decision": "take", "confidence": 0.75}] * len(candidates)
+
+        actions = agent.predict_batch(candidates, llm_responses)
+
+        assert actions == [AGREE] * len(candidates)
+        assert len(agent.model.states) == 1
+        expected = np.stack(
+            [
+                agent.encoder.encode(c, r, {}, {})
+                for c, r in zip(candidates, llm_responses, strict=True)
+            ]
+        )
+        np.testing.assert_array_equal(agent.model.states[0], expected)
+
 
 class TestMetaLearnerEpisodePreparation:
     """Test meta-learner episode structure."""
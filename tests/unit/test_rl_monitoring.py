@@ -2,6 +2,7 @@
 
 Tests:
 - AgentMonitor (alerts)
+- DegradationMonitor
 - CircuitBreaker
 - SafetyMonitor
 """
@@ -10,9 +11,11 @@ import tempfile
 import time
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from darwin.rl.monitoring.alerts import AgentMonitor, Alert, AlertType, log_alerts
+from darwin.rl.monitoring.degradation import DegradationMonitor
 from darwin.rl.monitoring.safety import CircuitBreaker, SafetyMonitor, SafetyConfig
 from darwin.rl.schemas.agent_state import AgentDecisionV1
 from darwin.rl.schemas.rl_config import (
@@ -187,6 +190,22 @@ class TestAgentMonitor:
 
         agent_state.close()
 
+    def test_monitor_decision_rate_reference_time(self):
+        """Test check windows are measured from the given reference time."""
+        agent_state = self.create_agent_state_with_decisions("gate", good_count=50)
+        monitor = AgentMonitor(agent_state)
+
+        # All decisions are 35-60 days old
+        assert monitor.check_decision_rate("gate", window_days=7) is not None
+        assert (
+            monitor.check_decision_rate(
+                "gate", window_days=7, now=datetime.now() - timedelta(days=40)
+            )
+            is None
+        )
+
+        agent_state.close()
+
     def test_monitor_check_all(self):
         """Test running all checks."""
         agent_state = self.create_agent_state_with_decisions(
@@ -203,6 +222,99 @@ class TestAgentMonitor:
         agent_state.close()
 
 
+class TestDegradationMonitor:
+    """Test degradation monitoring of active agents."""
+
+    def create_agent_state(self, agent_name: str, r_multiples: list) -> AgentStateSQLite:
+        """Create agent state with one decision per R-multiple, oldest first.
+
+        Args:
+            agent_name: Agent name
+            r_multiples: Outcome R-multiples in chronological order
+
+        Returns:
+            Agent state with data
+        """
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".sqlite")
+        temp_db.close()
+
+        agent_state = AgentStateSQLite(temp_db.name)
+        base_time = datetime.now() - timedelta(days=len(r_multiples))
+        for i, r_multiple in enumerate(r_multiples):
+            agent_state.record_decision(
+                AgentDecisionV1(
+                    agent_name=agent_name,
+                    candidate_id=f"cand_{i:03d}",
+                    run_id="run_001",
+                    timestamp=base_time + timedelta(days=i),
+                    state_hash="test_hash",
+                    action=1,
+                    mode="active",
+                    model_version="v1.0",
+                )
+            )
+            agent_state.update_decision_outcome(
+                agent_name=agent_name,
+                candidate_id=f"cand_{i:03d}",
+                outcome_r_multiple=r_multiple,
+                outcome_pnl_usd=r_multiple * 100,
+            )
+
+        return agent_state
+
+    def test_gate_degradation_uses_most_recent_window(self):
+        """Test the metric covers the newest lookback_window decisions."""
+        agent_state = self.create_agent_state("gate", [1.5] * 40 + [-1.0] * 20)
+        monitor = DegradationMonitor(agent_state, lookback_window=20, min_samples_for_check=50)
+        agent_config = AgentConfigV1(
+            name="gate",
+            enabled=True,
+            mode="active",
+            graduation_thresholds=GraduationThresholdsV1(
+                min_training_samples=1000,
+                min_validation_samples=200,
+                min_validation_metric=0.6,
+                baseline_type="pass_all",
+                min_improvement_pct=20.0,
+            ),
+        )
+
+        is_degraded, details = monitor.check_degradation("gate", agent_config, 0.6)
+
+        assert is_degraded
+        assert details["current_metric"] == 0.0
+        assert details["total_decisions"] == 60
+        assert details["recent_decisions"] == 20
+
+        agent_state.close()
+
+    def test_portfolio_sharpe_matches_numpy(self):
+        """Test the fused_stats Sharpe matches NumPy over the recent window."""
+        r_multiples = list(np.random.default_rng(0).normal(0.3, 1.2, size=80))
+        agent_state = self.create_agent_state("portfolio", r_multiples)
+        monitor = DegradationMonitor(agent_state, lookback_window=30)
+
+        recent = np.array(r_multiples[-30:])
+        expected = recent.mean() / recent.std(ddof=1)
+
+        assert monitor._calculate_agent_metric("portfolio") == pytest.approx(expected)
+
+        agent_state.close()
+
+    def test_portfolio_sharpe_stable_for_large_mean(self):
+        """Test the Sharpe ratio stays accurate when the mean dwarfs the spread."""
+        r_multiples = list(1e6 + np.random.default_rng(1).normal(0.0, 1e-3, size=40))
+        agent_state = self.create_agent_state("portfolio", r_multiples)
+        monitor = DegradationMonitor(agent_state, lookback_window=30)
+
+        recent = np.array(r_multiples[-30:])
+        expected = recent.mean() / recent.std(ddof=1)
+
+        assert monitor._calculate_agent_metric("portfolio") == pytest.approx(expected, rel=1e-6)
+
+        agent_state.close()
+
+
 class TestCircuitBreaker:
     """Test circuit breaker."""
 
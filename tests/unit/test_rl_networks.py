@@ -0,0 +1,116 @@
+"""Unit tests for RL agent networks.
+
+Tests:
+- Lazy PyTorch import
+- Pickling and torch.save of networks
+- Network factory and single-state prediction
+- Batched, int8 quantized and NumPy prediction
+"""
+
+import io
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from darwin.rl.models import networks
+
+
+class TestAgentNetworks:
+    """Test agent network factory."""
+
+    def test_import_does_not_load_torch(self):
+        """Test importing the module leaves PyTorch unloaded."""
+        code = "import sys, darwin.rl.models.networks; sys.exit('torch' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_create_agent_network_predicts(self):
+        """Test each network predicts from a single state."""
+        gate = networks.create_agent_network("gate")
+        portfolio = networks.create_agent_network("portfolio")
+        meta_learner = networks.create_agent_network("meta_learner")
+
+        assert isinstance(gate, networks.GateAgentNetwork)
+        assert gate.predict(np.zeros(34, dtype=np.float32)) in (0, 1)
+        assert 0.0 <= portfolio.predict(np.zeros(30, dtype=np.float32)) <= 1.0
+        assert meta_learner.predict(np.zeros(38, dtype=np.float32)) in (0, 1, 2)
+
+    def test_networks_pickle_and_torch_save(self):
+        """Test networks round-trip through pickle and torch.save."""
+        torch = pytest.importorskip("torch")
+        state = np.random.default_rng(0).standard_normal(30).astype(np.float32)
+        network = networks.create_agent_network("portfolio")
+        expected = network.predict(state)
+
+        restored = pickle.loads(pickle.dumps(network))
+        assert isinstance(restored, networks.PortfolioAgentNetwork)
+        assert restored.predict(state) == pytest.approx(expected)
+
+        buffer = io.BytesIO()
+        torch.save(network, buffer)
+        buffer.seek(0)
+        restored = torch.load(buffer, weights_only=False)
+        assert restored.predict(state) == pytest.approx(expected)
+
+    def test_create_agent_network_unknown(self):
+        """Test unknown agent names are rejected."""
+        with pytest.raises(ValueError, match="Unknown agent name"):
+            networks.create_agent_network("unknown")
+
+    def test_predict_batch_matches_predict(self):
+        """Test batched predictions match single-state predictions."""
+        rng = np.random.default_rng(0)
+        state_dims = {"gate": 34, "portfolio": 30, "meta_learner": 38}
+        for agent_name, state_dim in state_dims.items():
+            network = networks.create_agent_network(agent_name)
+            states = rng.standard_normal((8, state_dim)).astype(np.float32)
+
+            batch = network.predict_batch(states)
+
+            assert batch.shape == (8,)
+            expected = [network.predict(state) for state in states]
+            np.testing.assert_allclose(batch, expected, rtol=1e-6)
+
+    def test_quantized_network_predicts(self):
+        """Test int8 quantized networks keep the prediction interface."""
+        torch = pytest.importorskip("torch")
+        network = networks.create_agent_network("gate")
+        quantized = networks.quantize_network(network)
+
+        assert not quantized.training
+        assert isinstance(quantized.network[0], torch.ao.nn.quantized.dynamic.Linear)
+
+        states = np.random.default_rng(0).standard_normal((8, 34)).astype(np.float32)
+        actions = quantized.predict_batch(states)
+        assert actions.shape == (8,)
+        assert set(actions.tolist()) <= {0, 1}
+
+    def test_precompiled_numpy_predict_matches_torch(self):
+        """Test NumPy inference matches the PyTorch forward."""
+        rng = np.random.default_rng(0)
+        state_dims = {"gate": 34, "portfolio": 30, "meta_learner": 38}
+        for agent_name, state_dim in state_dims.items():
+            network = networks.create_agent_network(agent_name)
+            states = rng.standard_normal((8, state_dim)).astype(np.float32)
+            expected = [network.predict(state) for state in states]
+
+            network.precompile_numpy()
+            assert all(
+                np.shares_memory(weight_t, network._np_packed)
+                for op, weight_t, _ in network._np_layers
+                if op == "linear"
+            )
+
+            np.testing.assert_allclose(
+                [network.predict(state) for state in states], expected, rtol=1e-5
+            )
+            np.testing.assert_allclose(network.predict_batch(states), expected, rtol=1e-5)
+
+    def test_precompile_numpy_rejects_quantized(self):
+        """Test quantized layers cannot be precompiled to NumPy."""
+        quantized = networks.create_agent_network("gate", quantize=True)
+
+        with pytest.raises(ValueError, match="Cannot precompile"):
+            quantized.precompile_numpy()
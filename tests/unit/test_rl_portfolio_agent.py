@@ -196,6 +196,112 @@ class TestPortfolioEnv:
         assert seen_ids[2] == "cand_002"
         assert seen_ids[3] == "cand_000"  # Cycle back
 
+    def test_replay_portfolio_env_uses_precomputed_observations(self):
+        """Test cached observations match the encoder and step matches reset."""
+        episodes = [self.create_sample_episode() for _ in range(2)]
+        for i, ep in enumerate(episodes):
+            ep["candidate"].candidate_id = f"cand_{i:03d}"
+
+        env = ReplayPortfolioEnv(episodes=episodes)
+        assert env._obs_cache.shape == (2, env.state_dim)
+
+        obs, info = env.reset()
+        expected = env.encoder.encode(
+            episodes[0]["candidate"],
+            episodes[0]["llm_response"],
+            episodes[0]["portfolio_state"],
+        )
+        np.testing.assert_array_equal(obs, expected)
+
+        _, _, _, _, step_info = env.step(np.array([0.5], dtype=np.float32))
+        assert step_info["candidate_id"] == info["candidate_id"]
+
+    # Grid covering every branch and boundary of compute_portfolio_reward
+    REWARD_GRID_STATES = [
+        {"exposure_frac": 0.3, "max_exposure_frac": 0.8, "dd_24h_bps": -20.0},
+        {"exposure_frac": 0.9, "max_exposure_frac": 0.8, "dd_24h_bps": -600.0},
+        {"exposure_frac": 0.8, "max_exposure_frac": 0.8, "dd_24h_bps": -500.0},
+        {"exposure_frac": 0.5, "dd_24h_bps": -500.1},
+        {},
+    ]
+    REWARD_GRID_R_MULTIPLES = [-2.0, -0.5, 0.0, 1.5, None]
+    REWARD_GRID_FRACTIONS = np.union1d(np.linspace(0.0, 1.0, 41), [0.3, 0.5, 0.7])
+
+    def create_reward_grid_env(self):
+        """Create an env with one episode per (portfolio state, R-multiple) pair."""
+        episodes, cases = [], []
+        for portfolio_state in self.REWARD_GRID_STATES:
+            for r_multiple in self.REWARD_GRID_R_MULTIPLES:
+                episode = self.create_sample_episode()
+                episode["portfolio_state"] = portfolio_state
+                episode["outcome"] = episode["outcome"].model_copy(
+                    update={"actual_r_multiple": r_multiple}
+                )
+                episodes.append(episode)
+                cases.append((portfolio_state, r_multiple))
+        return PortfolioEnv(episodes=episodes), cases
+
+    @staticmethod
+    def expected_reward(portfolio_state, r_multiple, fraction):
+        """Reference reward from reward_shaping."""
+        from darwin.rl.utils.reward_shaping import (
+            compute_portfolio_reward,
+            portfolio_caused_drawdown,
+        )
+
+        if r_multiple is None:
+            return 0.0
+        return compute_portfolio_reward(
+            actual_r_multiple=r_multiple,
+            position_size_fraction=float(fraction),
+            portfolio_state=portfolio_state,
+            caused_drawdown=portfolio_caused_drawdown(portfolio_state),
+        )
+
+    def test_portfolio_env_reset_observation_is_read_only(self):
+        """Test reset() observations cannot be modified in place."""
+        env = PortfolioEnv(episodes=[self.create_sample_episode()])
+
+        obs, _ = env.reset()
+
+        with pytest.raises(ValueError, match="read-only"):
+            obs[0] = 1.0
+
+    def test_portfolio_env_reward_matches_reward_shaping(self):
+        """Test closed-form step reward matches compute_portfolio_reward over a grid."""
+        env, cases = self.create_reward_grid_env()
+
+        for idx, (portfolio_state, r_multiple) in enumerate(cases):
+            for fraction in self.REWARD_GRID_FRACTIONS:
+                expected = self.expected_reward(portfolio_state, r_multiple, fraction)
+                assert env._compute_reward(idx, float(fraction)) == pytest.approx(expected)
+
+    def test_portfolio_env_batch_rewards_match_reward_shaping(self):
+        """Test vectorized batch rewards match compute_portfolio_reward over a grid."""
+        env, cases = self.create_reward_grid_env()
+        fractions = self.REWARD_GRID_FRACTIONS
+
+        for idx, (portfolio_state, r_multiple) in enumerate(cases):
+            batch = env.batch_rewards(fractions, np.full(len(fractions), idx))
+            expected = [
+                self.expected_reward(portfolio_state, r_multiple, fraction)
+                for fraction in fractions
+            ]
+            np.testing.assert_allclose(batch, expected, atol=1e-12)
+
+    def test_portfolio_env_batch_rewards_match_step(self):
+        """Test vectorized batch rewards match per-step rewards."""
+        episodes = [self.create_sample_episode() for _ in range(3)]
+        episodes[1]["portfolio_state"]["dd_24h_bps"] = -800.0
+        episodes[2]["portfolio_state"]["exposure_frac"] = 0.9
+        env = PortfolioEnv(episodes=episodes)
+
+        fractions = np.array([0.1, 0.35, 0.6, 0.9, 1.2])
+        for idx in range(3):
+            batch = env.batch_rewards(fractions, np.full(len(fractions), idx))
+            expected = [env._compute_reward(idx, min(f, 1.0)) for f in fractions]
+            np.testing.assert_allclose(batch, expected)
+
 
 class TestPortfolioAgent:
     """Test Portfolio Agent wrapper."""